@@ -0,0 +1,99 @@
+# import_time.py
+
+"""
+冷启动导入耗时基准
+
+对 gui.app 及各实验屏幕模块分别启动独立的 Python 进程，
+使用 `python -X importtime` 记录导入耗时，输出每个模块的总耗时
+以及耗时最多的依赖包，用于检查懒加载是否生效。
+
+用法:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --top 5 --repeat 3
+"""
+
+# 内置库
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(os.path.dirname(current_script_path))
+sys.path.insert(0, project_root)
+
+# importtime 输出行格式: "import time:   self |   cumulative | [缩进]包名"
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def measure_import(module, python=sys.executable):
+    """
+    在独立进程中导入模块并解析 -X importtime 输出
+
+    参数:
+    module : str
+        待导入的模块路径
+    python : str
+        Python 解释器路径
+
+    返回:
+    tuple
+        (总耗时(ms), {顶层包名: 自身耗时合计(ms)})
+    """
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{proc.stderr.strip()[-2000:]}")
+
+    total = 0.0
+    packages = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if not match:
+            continue
+        self_ms, cumulative_ms = int(match.group(1)) / 1000, int(match.group(2)) / 1000
+        if len(match.group(3)) == 1:  # 顶层导入仅有一个前导空格
+            total += cumulative_ms
+
+        # 按顶层包名汇总自身耗时
+        package = match.group(4).split(".")[0]
+        packages[package] = packages.get(package, 0.0) + self_ms
+
+    return total, packages
+
+
+def main():
+    # 导入注册表以获取全部屏幕模块
+    from gui.app import SCREEN_REGISTRY
+
+    parser = argparse.ArgumentParser(description="ChemLabX 冷启动导入耗时基准")
+    parser.add_argument("--top", type=int, default=8, help="显示耗时最多的依赖包数量")
+    parser.add_argument("--repeat", type=int, default=1, help="重复次数，取最小值")
+    parser.add_argument(
+        "modules", nargs="*", help="待测模块，默认为 gui.app 及全部屏幕"
+    )
+    args = parser.parse_args()
+
+    modules = args.modules or ["gui.app"] + [
+        module_path for _, module_path, _ in SCREEN_REGISTRY.values()
+    ]
+
+    print(f"{'模块':<45}{'导入耗时/ms':>12}")
+    print("-" * 57)
+    for module in modules:
+        runs = [measure_import(module) for _ in range(max(args.repeat, 1))]
+        total, packages = min(runs, key=lambda run: run[0])
+        print(f"{module:<45}{total:>12.1f}")
+        heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+        for package, self_ms in heaviest[: args.top]:
+            print(f"    {package:<41}{self_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
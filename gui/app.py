@@ -1,10 +1,12 @@
 # app.py
 
 # 导入标准库结果
+import importlib
 import logging
 import traceback
 import sys
 import os
+from collections import OrderedDict
 
 # 动态获取项目根路径
 current_script_path = os.path.abspath(__file__)
@@ -15,26 +17,60 @@ sys.path.insert(0, project_root)
 import ttkbootstrap as ttk
 from tkinter import PhotoImage
 
-# 导入屏幕类
-from gui.screens.common_screens.base_screen import Base_Screen
-from gui.screens.filteration_screen import Filteration_Screen
-from gui.screens.heat_transfer_screen import Heat_Transfer_Screen
-from gui.screens.extraction_screen import Extraction_Screen
-from gui.screens.drying_screen import Drying_Screen
-from gui.screens.oxygen_desorption_screen import Oxygen_Desorption_Screen
-from gui.screens.distillation_screen import Distillation_Screen
-from gui.screens.fluid_flow_screen import Fluid_Flow_Screen
+# 屏幕注册表：屏幕名称 -> (菜单标签, 模块路径, 类名)
+# 屏幕模块及其依赖的处理器、计算器、绘图器在首次显示时才导入
+SCREEN_REGISTRY = {
+    "base_screen": (
+        "基础模式",
+        "gui.screens.common_screens.base_screen",
+        "Base_Screen",
+    ),
+    "filteration_screen": (
+        "过滤实验",
+        "gui.screens.filteration_screen",
+        "Filteration_Screen",
+    ),
+    "heat_transfer_screen": (
+        "传热实验",
+        "gui.screens.heat_transfer_screen",
+        "Heat_Transfer_Screen",
+    ),
+    "extraction_screen": (
+        "萃取实验",
+        "gui.screens.extraction_screen",
+        "Extraction_Screen",
+    ),
+    "drying_screen": (
+        "干燥实验",
+        "gui.screens.drying_screen",
+        "Drying_Screen",
+    ),
+    "oxygen_desorption_screen": (
+        "解吸实验",
+        "gui.screens.oxygen_desorption_screen",
+        "Oxygen_Desorption_Screen",
+    ),
+    "distillation_screen": (
+        "精馏实验",
+        "gui.screens.distillation_screen",
+        "Distillation_Screen",
+    ),
+    "fluid_flow_screen": (
+        "流体实验",
+        "gui.screens.fluid_flow_screen",
+        "Fluid_Flow_Screen",
+    ),
+}
 
 # 导入配置
 from gui.screens.utils.config import *
+from gui.screens.utils.redraw_scheduler import Redraw_Scheduler
 
 # 配置日志记录
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-from gui.screens.utils.smooth_resize_window import Smooth_Resize_Window
-
 
 class App:
     """
@@ -53,6 +89,7 @@ class App:
         width_height_inches: tuple = (10, 7),
         dpi: int = 600,
         py_path: str = os.path.dirname(os.path.abspath(__file__)),
+        max_live_screens: int = None,
     ):
         # 数据配置
         DATA_CONFIG["app"] = self
@@ -66,6 +103,7 @@ class App:
         DATA_CONFIG["time_upper_limit"] = time_upper_limit
         DATA_CONFIG["width_height_inches"] = width_height_inches
         DATA_CONFIG["dpi"] = dpi
+        DATA_CONFIG["max_live_screens"] = max_live_screens
 
         # 初始化窗口
         DATA_CONFIG["window"] = ttk.Window(
@@ -108,17 +146,10 @@ class App:
         # 窗口左上角显示
         DATA_CONFIG["window"].geometry("+0+0")
 
-        # 创建所有屏幕实例
-        self.screens = {
-            "base_screen": Base_Screen(DATA_CONFIG["window"]),
-            "filteration_screen": Filteration_Screen(DATA_CONFIG["window"]),
-            "heat_transfer_screen": Heat_Transfer_Screen(DATA_CONFIG["window"]),
-            "extraction_screen": Extraction_Screen(DATA_CONFIG["window"]),
-            "drying_screen": Drying_Screen(DATA_CONFIG["window"]),
-            "oxygen_desorption_screen": Oxygen_Desorption_Screen(DATA_CONFIG["window"]),
-            "distillation_screen": Distillation_Screen(DATA_CONFIG["window"]),
-            "fluid_flow_screen": Fluid_Flow_Screen(DATA_CONFIG["window"]),
-        }
+        # 屏幕实例在首次显示时创建，超过上限时按最近最少使用回收
+        self.screens = OrderedDict()
+        self.screen_snapshots = {}
+        self.max_live_screens = max_live_screens
 
         # 初始化 current_screen
         self.current_screen = None
@@ -141,48 +172,60 @@ class App:
         menubar.add_cascade(label="实验模式", menu=mode_menu)
 
         # 创建菜单项
-        mode_menu.add_command(
-            label="基础模式", command=lambda: self.show_screen("base_screen")
-        )
-        mode_menu.add_command(
-            label="过滤实验", command=lambda: self.show_screen("filteration_screen")
-        )
-        mode_menu.add_command(
-            label="传热实验", command=lambda: self.show_screen("heat_transfer_screen")
-        )
-        mode_menu.add_command(
-            label="萃取实验", command=lambda: self.show_screen("extraction_screen")
-        )
-        mode_menu.add_command(
-            label="干燥实验", command=lambda: self.show_screen("drying_screen")
-        )
-        mode_menu.add_command(
-            label="解吸实验",
-            command=lambda: self.show_screen("oxygen_desorption_screen"),
-        )
-        mode_menu.add_command(
-            label="精馏实验", command=lambda: self.show_screen("distillation_screen")
-        )
-        mode_menu.add_command(
-            label="流体实验", command=lambda: self.show_screen("fluid_flow_screen")
-        )
+        for screen_name, (label, _, _) in SCREEN_REGISTRY.items():
+            mode_menu.add_command(
+                label=label, command=lambda name=screen_name: self.show_screen(name)
+            )
+
+    def _get_screen(self, screen_name):
+        """获取屏幕实例，首次访问（或回收后再次访问）时导入模块并创建"""
+        if screen_name not in self.screens:
+            _, module_path, class_name = SCREEN_REGISTRY[screen_name]
+            screen_class = getattr(importlib.import_module(module_path), class_name)
+            screen = screen_class(DATA_CONFIG["window"])
+
+            # 从快照恢复回收前的状态
+            snapshot = self.screen_snapshots.pop(screen_name, None)
+            if snapshot is not None:
+                try:
+                    screen.restore_state(snapshot)
+                except Exception:
+                    logging.error(f"屏幕状态恢复失败: {traceback.format_exc()}")
+            self.screens[screen_name] = screen
+
+        self.screens.move_to_end(screen_name)
+        return self.screens[screen_name]
+
+    def _evict_screens(self):
+        """回收超出上限的隐藏屏幕，仅保留轻量状态快照"""
+        if not self.max_live_screens:
+            return
+
+        for screen_name in list(self.screens):
+            if len(self.screens) <= self.max_live_screens:
+                break
+            screen = self.screens[screen_name]
+            if screen is self.current_screen or not screen.can_evict():
+                continue
+
+            self.screen_snapshots[screen_name] = screen.snapshot_state()
+            del self.screens[screen_name]
+            screen.destroy()
+            logging.debug(f"屏幕已回收: {screen_name}")
 
     def show_screen(self, screen_name):
         """显示指定的屏幕"""
+        if screen_name not in SCREEN_REGISTRY:
+            logging.error(f"未知屏幕名称: {screen_name}")
+            return
+
         if self.current_screen:
             self.current_screen.pack_forget()
 
-        if screen_name in self.screens:
-            self.current_screen = self.screens[screen_name]
-            self.current_screen.pack(fill="both", expand=True)
-
-            # 只有在切换到非基础模式的界面时才触发抖动
-            if screen_name != "base_screen":
-                # 触发抖动效果
-                self.smooth_resize = Smooth_Resize_Window(DATA_CONFIG["window"])
-                self.smooth_resize.start()
-        else:
-            logging.error(f"未知屏幕名称: {screen_name}")
+        self.current_screen = self._get_screen(screen_name)
+        self.current_screen.pack(fill="both", expand=True)
+        self._evict_screens()
+        logging.debug(f"重绘统计: {Redraw_Scheduler.shared().stats()}")
 
     def change_mode(self, *args):
         """界面模式切换，切换窗口"""
@@ -13,7 +13,191 @@ sys.path.insert(0, project_root)
 
 import pandas as pd
 import numpy as np
-import sympy
+
+# 回流比不小于该值时按全回流处理
+TOTAL_REFLUX_R = 10000
+
+# 逐板计算的默认最大理论板数
+MAX_STAGES = 100
+
+
+def batch_calculate_stages(R, αm, xD, xW, xF, q, max_stages=MAX_STAGES):
+    """
+    批量逐板计算：对多组操作条件同步进行逐板计算
+
+    所有参数均可为标量或一维数组（按广播规则对齐），每一组
+    (R, αm, xD, xW, xF, q) 对应一座精馏塔。各塔在预分配的缓冲区中
+    同步逐板推进，已到达塔釜组成的塔通过掩码停止更新。
+
+    物料平衡按单位进料归一化（D/F = (xF - xW) / (xD - xW)），
+    因此结果与进料流量F无关；R >= TOTAL_REFLUX_R 时按全回流处理（D = 0）。
+
+    参数:
+    ----------
+    R, αm, xD, xW, xF, q : float 或 array_like
+        回流比、平均相对挥发度、馏出液组成、釜残液组成、进料组成、进料热状态参数
+    max_stages : int
+        最大逐板计算次数，超过后停止并标记为未收敛
+
+    返回:
+    ----------
+    dict
+        NT : 理论板数数组(包括再沸器)
+        xn, yn : 各板液相/气相组成，形状 (n, max_stages + 1)，未用部分为NaN
+        xQ, yQ : 两操作线交点坐标
+        converged : 是否在 max_stages 内到达釜残液组成
+    """
+    R, αm, xD, xW, xF, q = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (R, αm, xD, xW, xF, q))
+    )
+    n = R.shape[0]
+
+    # 单位进料下的物料平衡（全回流时D=0）
+    total_reflux = R >= TOTAL_REFLUX_R
+    d = np.where(total_reflux, 0.0, (xF - xW) / (xD - xW))
+    w = 1.0 - d
+
+    # 操作线参数
+    rect_slope = R / (R + 1)
+    rect_intercept = xD / (R + 1)
+    numerator = R * d + q
+    denominator = numerator - w
+    strip_slope = numerator / denominator
+    strip_intercept = -w * xW / denominator
+
+    # 两操作线交点Q
+    xQ = ((R + 1) * xF + (q - 1) * xD) / (R + q)
+    yQ = (R * xF + q * xD) / (R + q)
+
+    # 预分配缓冲区
+    xn = np.full((n, max_stages + 1), np.nan)
+    yn = np.full((n, max_stages + 1), np.nan)
+    yn[:, 0] = xD
+    NT = np.zeros(n, dtype=int)
+    converged = np.zeros(n, dtype=bool)
+    active = np.ones(n, dtype=bool)
+
+    for k in range(max_stages + 1):
+        # 反平衡关系求当前板液相组成
+        y = yn[active, k]
+        a = αm[active]
+        x = y / (a - (a - 1) * y)
+        xn[active, k] = x
+
+        # 到达釜残液组成的塔停止推进
+        reached = x <= xW[active]
+        idx = np.flatnonzero(active)
+        NT[idx[reached]] = k + 1
+        converged[idx[reached]] = True
+        active[idx[reached]] = False
+
+        if k == max_stages:
+            NT[active] = k + 1
+            break
+        if not active.any():
+            break
+
+        # 按所在塔段选择操作线
+        idx = np.flatnonzero(active)
+        x = xn[idx, k]
+        yn[idx, k + 1] = np.where(
+            x > xQ[idx],
+            rect_slope[idx] * x + rect_intercept[idx],
+            strip_slope[idx] * x + strip_intercept[idx],
+        )
+
+    return {
+        "NT": NT,
+        "xn": xn,
+        "yn": yn,
+        "xQ": xQ,
+        "yQ": yQ,
+        "converged": converged,
+    }
+
+
+def solve_material_balance_batch(F, xF, xD, xW):
+    """
+    批量求解全塔物料平衡
+
+    对方程组
+        D + W = F
+        xD * D + xW * W = F * xF
+    使用闭式解 D = F (xF - xW) / (xD - xW)，W = F - D，参数可为标量或一维数组。
+    xD == xW 时方程组奇异，对应结果为NaN。
+
+    返回:
+    ----------
+    tuple of numpy.ndarray
+        (D, W) 馏出液流量与釜残液流量
+    """
+    F, xF, xD, xW = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (F, xF, xD, xW))
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        D = np.where(xD != xW, F * (xF - xW) / (xD - xW), np.nan)
+    W = F - D
+    return D, W
+
+
+def find_minimum_reflux(αm, xD, xF, q, tol=1e-8, max_iter=200):
+    """
+    二分法求最小回流比
+
+    当两操作线交点Q落在平衡线上或其上方时出现夹点（所需理论板数趋于无穷），
+    以此为判据对每组操作条件同步二分，参数可为标量或一维数组。
+
+    参数:
+    ----------
+    αm, xD, xF, q : float 或 array_like
+        平均相对挥发度、馏出液组成、进料组成、进料热状态参数
+    tol : float
+        回流比收敛精度
+    max_iter : int
+        最大二分次数
+
+    返回:
+    ----------
+    numpy.ndarray
+        各组条件下的最小回流比，回流比达到 TOTAL_REFLUX_R 仍有夹点
+        （无法分离）的条件为 np.inf
+    """
+    αm, xD, xF, q = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (αm, xD, xF, q))
+    )
+
+    def pinched(R):
+        # R + q <= 0 时两操作线平行或交于图外，交点 xQ <= 0 时同样无法作图，
+        # 均按夹点处理（过热蒸气进料时出现）
+        denominator = R + q
+        safe = np.where(denominator > 0, denominator, 1.0)
+        xQ = ((R + 1) * xF + (q - 1) * xD) / safe
+        yQ = (R * xF + q * xD) / safe
+        with np.errstate(divide="ignore", invalid="ignore"):
+            yE = αm * xQ / (1 + (αm - 1) * xQ)
+        return (denominator <= 0) | (xQ <= 0) | (yQ >= yE)
+
+    # 扩展上界直至不再出现夹点
+    lo = np.zeros(αm.shape)
+    hi = np.ones(αm.shape)
+    expand = pinched(hi)
+    while expand.any():
+        hi[expand] = np.minimum(hi[expand] * 2, TOTAL_REFLUX_R)
+        expand = pinched(hi) & (hi < TOTAL_REFLUX_R)
+    infeasible = pinched(hi)
+
+    # 同步二分
+    for _ in range(max_iter):
+        mid = (lo + hi) / 2
+        p = pinched(mid)
+        lo = np.where(p, mid, lo)
+        hi = np.where(p, hi, mid)
+        if np.max(hi - lo) < tol:
+            break
+
+    # R=0时已无夹点的条件最小回流比记为0
+    R_min = np.where(pinched(np.zeros(αm.shape)), hi, 0.0)
+    return np.where(infeasible, np.inf, R_min)
 
 
 class Distillation_Calculator:
@@ -160,20 +344,18 @@ class Distillation_Calculator:
 
     def solve_material_balance(self):
         """求解全塔物料平衡方程"""
-        if self.R >= 10000:  # 全回流情况处理
+        if self.R >= TOTAL_REFLUX_R:  # 全回流情况处理
             self.D = 0.0  # 馏出液量为0
             self.W = self.F  # 釜残液量等于进料量
             self.L = self.R * self.D  # 实际此时L趋近无穷大
         else:  # 正常情况求解
-            # 建立矩阵方程：
+            # 闭式求解：
             # [1    1  ] [D]   [F]
             # [xD  xW  ] [W] = [F * xF]
-            A = sympy.Matrix([[1, 1], [self.xD, self.xW]])
-            b = sympy.Matrix([self.F, self.xF * self.F])
-
-            # 解线性方程组
-            solution = A.solve(b)
-            self.D, self.W = solution[0], solution[1]
+            if self.xD == self.xW:
+                raise ValueError("馏出液与釜残液组成相同，物料平衡方程无解")
+            D, W = solve_material_balance_batch(self.F, self.xF, self.xD, self.xW)
+            self.D, self.W = float(D[0]), float(W[0])
 
             # 计算回流液量
             self.L = self.R * self.D
@@ -253,47 +435,68 @@ class Distillation_Calculator:
         else:
             return (self.q / (self.q - 1)) * x - (self.xF / (self.q - 1))
 
-    def calculate_stages(self):
+    def calculate_stages(self, max_stages=MAX_STAGES):
         """通过逐板计算法确定理论塔板数"""
         # 根据回流比选择计算模式
-        if self.R >= 10000:  # 全回流模式
+        if self.R >= TOTAL_REFLUX_R:  # 全回流模式
             xD = self.xD_inf
             xW = self.xW_inf
         else:  # 正常操作模式
             xD = self.xD
             xW = self.xW
 
-        # 计算两操作线交点Q的坐标
-        self.xQ = ((self.R + 1) * self.xF + (self.q - 1) * xD) / (self.R + self.q)
-        self.yQ = (self.R * self.xF + self.q * xD) / (self.R + self.q)
-
-        # 初始化迭代变量
-        yn = np.array([xD])  # 从塔顶开始计算
-        xn = np.array([])  # 存储各板液相组成
-        max_iterations = 20  # 防止无限循环
-        iteration = 0
-
-        # 逐板计算循环
-        while self.x_e(yn[-1]) > xW and iteration < max_iterations:
-            iteration += 1
+        # 单塔调用批量逐板计算
+        stages = batch_calculate_stages(
+            self.R, self.αm, xD, xW, self.xF, self.q, max_stages=max_stages
+        )
 
-            # 计算当前板的液相组成
-            xn = np.append(xn, self.x_e(yn[-1]))
+        # 计算两操作线交点Q的坐标
+        self.xQ = float(stages["xQ"][0])
+        self.yQ = float(stages["yQ"][0])
 
-            # 判断使用哪条操作线
-            if xn[-1] > self.xQ:  # 在精馏段
-                new_y = self.y_np1(xn[-1])
-            else:  # 进入提馏段
-                new_y = self.y_mp1(xn[-1])
+        # 计算结果整理
+        self.NT = int(stages["NT"][0])  # 总理论板数(包括再沸器)
+        self.xn = stages["xn"][0, : self.NT]  # 保存各板组成
+        self.yn = stages["yn"][0, : self.NT]
+        self.converged = bool(stages["converged"][0])
 
-            yn = np.append(yn, new_y)
+    def sweep_reflux(self, R_values, max_stages=MAX_STAGES):
+        """
+        回流比扫描：一次向量化计算多个回流比下的理论板数
 
-        # 记录最终液相组成
-        xn = np.append(xn, self.x_e(yn[-1]))
+        参数:
+        R_values : array_like
+            待扫描的回流比序列
+        max_stages : int
+            最大逐板计算次数
 
-        # 计算结果整理
-        self.NT = len(xn)  # 总理论板数(包括再沸器)
-        self.xn, self.yn = xn, yn  # 保存各板组成
+        返回:
+        pd.DataFrame
+            每个回流比对应的理论板数、进料板位置及收敛情况；
+            小于最小回流比或未收敛的理论板数记为NaN
+        """
+        R_values = np.asarray(R_values, dtype=float)
+        stages = batch_calculate_stages(
+            R_values, self.αm, self.xD, self.xW, self.xF, self.q, max_stages=max_stages
+        )
+        self.R_min = float(find_minimum_reflux(self.αm, self.xD, self.xF, self.q)[0])
+
+        # 进料板位置：精馏段内的理论板数
+        with np.errstate(invalid="ignore"):
+            feed_stage = np.sum(stages["xn"] > stages["xQ"][:, None], axis=1)
+
+        converged = stages["converged"] & (R_values > self.R_min)
+        self.reflux_sweep = pd.DataFrame(
+            {
+                "回流比": R_values,
+                "R/Rmin": R_values / self.R_min if self.R_min > 0 else np.inf,
+                "理论塔板数": np.where(converged, stages["NT"], np.nan),
+                "进料板位置": np.where(converged, feed_stage, np.nan),
+                "是否收敛": converged,
+            }
+        )
+        self.results["最小回流比"] = self.R_min
+        return self.reflux_sweep
 
     def save_results(self, filename):
         """将关键结果保存至文本文件"""
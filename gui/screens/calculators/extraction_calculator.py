@@ -14,19 +14,174 @@ sys.path.insert(0, project_root)
 import logging
 import pandas as pd
 import numpy as np
-from scipy.integrate import trapezoid
-from scipy.interpolate import interp1d
+
+from gui.screens.utils.calibration_library import Calibration_Library
 
 # 配置日志设置
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+COLUMN_HEIGHT = 0.75  # 萃取塔有效高度 (m)
+GAUSS_ORDER = 16  # Gauss-Legendre求积阶数
+PINCH_TOLERANCE = 0.05  # 最小推动力低于积分区间长度的该比例时判为夹点
+DISTRIBUTION_ORDER = 3  # 分配曲线多项式阶数
+DISTRIBUTION_TABLE_POINTS = 1000  # 分配曲线取值表点数
+DESIGN_POINTS = 6  # 设计等值线表每个方向的取值个数
+SWEEP_AXES = ("溶剂比", "进料浓度X_F", "萃余相浓度X_R", "进口萃取相浓度Y_in")
+
+
+def ntu_integrand(coefficients, k, b, Y):
+    """
+    传质单元数积分项 1/(Y* - Y)
+
+    Y在操作线 Y = kX + b 上对应 X = (Y - b)/k，Y* 由分配曲线多项式直接计算，
+    k、b、Y 可为任意可广播的数组。
+    """
+    X = (Y - b) / k
+    with np.errstate(divide="ignore"):
+        return 1 / (np.polyval(coefficients, X) - Y)
+
+
+def integrate_ntu(
+    coefficients,
+    k,
+    b,
+    Y_start,
+    Y_end,
+    order=GAUSS_ORDER,
+    pinch_tolerance=PINCH_TOLERANCE,
+):
+    """
+    以固定阶数Gauss-Legendre求积批量计算传质单元数 N = ∫ dY/(Y* - Y)
+
+    所有操作线（k、b、积分上下限可广播为同一形状）在一次数组运算中完成；
+    以 order 阶与 order/2 阶结果之差作为误差估计。
+    推动力 Y* - Y 在求积节点和两端点上取最小值，低于积分区间长度的
+    pinch_tolerance 倍时判为夹点；推动力不为正时操作线与分配曲线相交，
+    传质单元数为NaN。
+
+    返回:
+    dict
+        传质单元数、误差估计、最小推动力、夹点，均为与 k 广播后同形状的数组
+    """
+    k, b, Y_start, Y_end = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (k, b, Y_start, Y_end))
+    )
+    half = ((Y_end - Y_start) / 2)[..., None]
+    middle = ((Y_end + Y_start) / 2)[..., None]
+
+    def quadrature(n):
+        nodes, weights = np.polynomial.legendre.leggauss(n)
+        Y = middle + half * nodes
+        integrand = ntu_integrand(coefficients, k[..., None], b[..., None], Y)
+        return (integrand * weights).sum(axis=-1) * half[..., 0], integrand
+
+    ntu, integrand = quadrature(order)
+    coarse, _ = quadrature(max(order // 2, 1))
+
+    ends = np.stack([Y_start, Y_end], axis=-1)
+    ends_integrand = ntu_integrand(coefficients, k[..., None], b[..., None], ends)
+    driving = 1 / np.concatenate([integrand, ends_integrand], axis=-1)
+    min_driving = np.min(driving, axis=-1)
+
+    crossed = ~(min_driving > 0)
+    ntu = np.where(crossed, np.nan, ntu)
+    return {
+        "传质单元数": ntu,
+        "误差估计": np.where(crossed, np.nan, np.abs(ntu - coarse)),
+        "最小推动力": min_driving,
+        "夹点": crossed | (min_driving < pinch_tolerance * np.abs(2 * half[..., 0])),
+    }
+
+
+def design_sweep(
+    coefficients, solvent_ratio, X_feed, X_raffinate, Y_in=0.0, HTU=COLUMN_HEIGHT
+):
+    """
+    萃取塔设计扫描
+
+    逆流萃取的操作线为 Y = Y_in + (X - X_raffinate)/溶剂比，出口萃取相浓度由物料衡算
+    Y_out = Y_in + (X_feed - X_raffinate)/溶剂比 给出。各参数按外积组成网格，
+    全部网格点的传质单元数由 integrate_ntu 一次算出，塔高 = 传质单元数 × 传质单元高度。
+
+    参数:
+    coefficients : array_like
+        分配曲线多项式系数 Y* = f(X)
+    solvent_ratio, X_feed, X_raffinate, Y_in : array_like
+        溶剂比（萃取相与萃余相流量比，即操作线斜率的倒数）、进料浓度、
+        萃余相浓度、进口萃取相浓度（标量或一维数组）
+    HTU : float
+        传质单元高度 (m)
+
+    返回:
+    pd.DataFrame
+        每个网格点一行；萃余相浓度不低于进料浓度或操作线与分配曲线相交的点
+        传质单元数和塔高为NaN
+    """
+    axes = [
+        np.atleast_1d(np.asarray(v, dtype=float))
+        for v in (solvent_ratio, X_feed, X_raffinate, Y_in)
+    ]
+    ratio, X_F, X_R, Y_0 = np.meshgrid(*axes, indexing="ij")
+
+    k = 1 / ratio
+    b = Y_0 - X_R * k
+    Y_out = Y_0 + (X_F - X_R) * k
+    integration = integrate_ntu(coefficients, k, b, Y_0, Y_out)
+    ntu = np.where(X_R < X_F, integration["传质单元数"], np.nan)
+
+    return pd.DataFrame(
+        {
+            "溶剂比": ratio.ravel(),
+            "进料浓度X_F": X_F.ravel(),
+            "萃余相浓度X_R": X_R.ravel(),
+            "进口萃取相浓度Y_in": Y_0.ravel(),
+            "出口萃取相浓度Y_out": Y_out.ravel(),
+            "传质单元数": ntu.ravel(),
+            "传质单元高度/m": np.full(ntu.size, HTU),
+            "塔高/m": (ntu * HTU).ravel(),
+            "夹点": integration["夹点"].ravel(),
+        }
+    )
+
+
+def contour_table(
+    sweep, value="塔高/m", index="溶剂比", columns="萃余相浓度X_R", fixed=None
+):
+    """
+    将设计扫描结果整理为等值线表（行、列为两个扫描参数），可直接交给TableWidget显示
+
+    其余扫描参数须只有一个取值，或由 fixed（{列名: 取值}）选定一个切片，
+    不同设计之间不做平均；value 为NaN的组合（不可行设计）保留为NaN。
+    """
+    for name, target in (fixed or {}).items():
+        sweep = sweep[np.isclose(sweep[name], target)]
+    others = [
+        name
+        for name in SWEEP_AXES
+        if name not in (index, columns) and sweep[name].nunique() > 1
+    ]
+    if others:
+        raise ValueError(f"扫描参数 {others} 有多个取值，请用 fixed 指定切片")
+
+    table = sweep.pivot(index=index, columns=columns, values=value)
+    table.columns = [f"{columns}={column:.4g}" for column in table.columns]
+    return table.reset_index()
+
 
 class Extraction_Calculator:
-    def __init__(self, main_file, distribution_file):
+    def __init__(
+        self,
+        main_file,
+        distribution_file,
+        column_height=COLUMN_HEIGHT,
+        calibration_library=None,
+    ):
         self.main_file = main_file  # 主数据CSV文件路径
         self.distribution_file = distribution_file  # 分配曲线数据CSV文件路径
+        self.column_height = column_height  # 萃取塔有效高度 (m)
+        self.calibration_library = calibration_library or Calibration_Library()
         self.results = {}  # 存储处理结果
 
     def load_data(self):
@@ -91,30 +246,76 @@ class Extraction_Calculator:
         """
         拟合分配曲线。
         """
-        order = 3  # 多项式阶数
-        self.coefficients = np.polyfit(self.X3_data, self.Y3_data, order)
-        self.X3_to_fit = np.linspace(min(self.X3_data), max(self.X3_data), 100)
+        self.coefficients = np.polyfit(self.X3_data, self.Y3_data, DISTRIBUTION_ORDER)
+        self.valid_range = (float(min(self.X3_data)), float(max(self.X3_data)))
+        self.X3_to_fit = np.linspace(*self.valid_range, DISTRIBUTION_TABLE_POINTS)
         self.Y_fitted = np.polyval(self.coefficients, self.X3_to_fit)
+        self._store_distribution_results()
 
+    def _store_distribution_results(self):
         self.results.update(
             {
                 "X3_data": self.X3_data.tolist(),
                 "Y3_data": self.Y3_data.tolist(),
                 "coefficients": self.coefficients.tolist(),
+                "valid_range": list(self.valid_range),
                 "X3_to_fit": self.X3_to_fit.tolist(),
                 "Y_fitted": self.Y_fitted.tolist(),
             }
         )
 
+    def _calibrate_distribution_curve(self):
+        """读取分配曲线CSV并拟合，返回可存入标定库的标定内容"""
+        self.load_distribution_curve_data()
+        self.fit_distribution_curve()
+        return {
+            key: self.results[key]
+            for key in (
+                "X3_data",
+                "Y3_data",
+                "coefficients",
+                "valid_range",
+                "X3_to_fit",
+                "Y_fitted",
+            )
+        }
+
+    def load_distribution_curve(self):
+        """
+        从标定库加载分配曲线。
+
+        标定库以分配曲线CSV的内容哈希为键，命中时直接使用已保存的系数、
+        适用范围和取值表，不再解析CSV和拟合；未命中时拟合并存入标定库。
+        """
+        calibration, self.calibration_digest, cached = (
+            self.calibration_library.get_or_create(
+                f"distribution_curve_poly{DISTRIBUTION_ORDER}",
+                self.distribution_file,
+                self._calibrate_distribution_curve,
+            )
+        )
+        if cached:
+            self.X3_data = np.array(calibration["X3_data"])
+            self.Y3_data = np.array(calibration["Y3_data"])
+            self.coefficients = np.array(calibration["coefficients"])
+            self.valid_range = tuple(calibration["valid_range"])
+            self.X3_to_fit = np.array(calibration["X3_to_fit"])
+            self.Y_fitted = np.array(calibration["Y_fitted"])
+            self._store_distribution_results()
+        self.results["calibration"] = {
+            "sha256": self.calibration_digest,
+            "cached": cached,
+        }
+
     def calculate_operating_lines(self):
         """
         计算操作线方程。
         """
-        self.k1 = (0 - self.Y_Eb[0]) / (self.X_Rt[0] - self.X_Rb[0])
-        self.b1 = self.Y_Eb[0] - self.k1 * self.X_Rb[0]
-
-        self.k2 = (0 - self.Y_Eb[1]) / (self.X_Rt[1] - self.X_Rb[1])
-        self.b2 = self.Y_Eb[1] - self.k2 * self.X_Rb[1]
+        # 各实验组的操作线过 (X_Rt, 0) 和 (X_Rb, Y_Eb)
+        self.k = (0 - self.Y_Eb) / (self.X_Rt - self.X_Rb)
+        self.b = self.Y_Eb - self.k * self.X_Rb
+        self.k1, self.k2 = self.k[:2]
+        self.b1, self.b2 = self.b[:2]
 
         self.results.update(
             {
@@ -128,38 +329,91 @@ class Extraction_Calculator:
     def perform_graphical_integration(self):
         """
         执行图解积分。
+
+        积分项由分配曲线多项式和操作线直接计算，所有实验组一次完成Gauss-Legendre求积。
         """
-        self.integral_values = []  # 用于存储每个实验组的积分结果
-        self.data5_for_graph_integral = []  # 用于存储每组绘图数据
+        self.integration = integrate_ntu(
+            self.coefficients, self.k, self.b, 0.0, self.Y_Eb
+        )
+        self.integral_values = list(self.integration["传质单元数"])
 
-        k = np.array([self.k1, self.k2])
-        b = np.array([self.b1, self.b2])
+        X_low, X_high = self.valid_range
+        outside = (np.minimum(self.X_Rt, self.X_Rb) < X_low) | (
+            np.maximum(self.X_Rt, self.X_Rb) > X_high
+        )
+        for i in np.flatnonzero(outside):
+            logging.warning(
+                f"实验组 {i + 1} 的浓度超出分配曲线的适用范围，积分为外推结果"
+            )
 
-        for i in range(len(self.Y_Eb)):
-            Y5_Eb_data = np.linspace(0, self.Y_Eb[i], 20)
-            X_Rb_data = (Y5_Eb_data - b[i]) / k[i]
-            Y5star_data = np.polyval(self.coefficients, X_Rb_data)
-            one_over_Y5star_minus_Y5 = 1 / (Y5star_data - Y5_Eb_data)
+        # 每组绘图数据：操作线上均分的20个点
+        Y5_Eb_data = np.linspace(0, self.Y_Eb, 20, axis=-1)
+        X_Rb_data = (Y5_Eb_data - self.b[:, None]) / self.k[:, None]
+        Y5star_data = np.polyval(self.coefficients, X_Rb_data)
+        one_over_Y5star_minus_Y5 = 1 / (Y5star_data - Y5_Eb_data)
+        self.data5_for_graph_integral = [
+            list(group)
+            for group in zip(
+                Y5_Eb_data, X_Rb_data, Y5star_data, one_over_Y5star_minus_Y5
+            )
+        ]
 
-            # 将当前实验组的数据存入列表
-            self.data5_for_graph_integral.append(
-                [Y5_Eb_data, X_Rb_data, Y5star_data, one_over_Y5star_minus_Y5]
+        for i in np.flatnonzero(self.integration["夹点"]):
+            logging.warning(
+                f"实验组 {i + 1} 的操作线接近分配曲线（最小推动力 "
+                f"{self.integration['最小推动力'][i]:.3e}），传质单元数不可靠"
             )
 
-            # 插值平滑曲线
-            interp_func = interp1d(Y5_Eb_data, one_over_Y5star_minus_Y5, kind="cubic")
-            Y5_Eb_data_smooth = np.linspace(Y5_Eb_data.min(), Y5_Eb_data.max(), 40)
-            one_over_Y5star_minus_Y5_smooth = interp_func(Y5_Eb_data_smooth)
+        # 保存积分结果到ans3，传质单元高度到ans4
+        self.ans3 = self.integration["传质单元数"]
+        self.ans4 = self.column_height / self.ans3
+        self.results.update(
+            {
+                "ans3": self.ans3.tolist(),
+                "ans4": self.ans4.tolist(),
+                "ans3_error": self.integration["误差估计"].tolist(),
+                "pinch": self.integration["夹点"].tolist(),
+            }
+        )
 
-            # 计算积分并保存
-            integral_value = trapezoid(
-                one_over_Y5star_minus_Y5_smooth, Y5_Eb_data_smooth
-            )
-            self.integral_values.append(integral_value)
+    def design_sweep(
+        self, solvent_ratios, X_feed=None, X_raffinate=None, Y_in=0.0, HTU=None
+    ):
+        """
+        以拟合的分配曲线做萃取塔设计扫描（需先完成 run_calculations）
+
+        参数:
+        solvent_ratios : array_like
+            溶剂比（萃取相与萃余相流量比）
+        X_feed, X_raffinate : array_like, optional
+            进料和萃余相浓度，默认取各实验组的平均值
+        Y_in : array_like
+            进口萃取相浓度
+        HTU : float, optional
+            传质单元高度 (m)，默认取各实验组实测值的平均
+
+        返回:
+        pd.DataFrame
+            每个网格点的传质单元数、传质单元高度和所需塔高
+        """
+        X_feed = np.mean(self.X_Rb) if X_feed is None else X_feed
+        X_raffinate = np.mean(self.X_Rt) if X_raffinate is None else X_raffinate
+        HTU = np.nanmean(self.ans4) if HTU is None else HTU
+        return design_sweep(
+            self.coefficients, solvent_ratios, X_feed, X_raffinate, Y_in, HTU
+        )
 
-        # 保存积分结果到ans3
-        self.ans3 = np.array(self.integral_values)
-        self.results["ans3"] = self.ans3.tolist()
+    def design_contour_table(self, n_points=DESIGN_POINTS):
+        """
+        以实测操作点为中心的塔高等值线表（溶剂比 × 萃余相浓度），供界面显示
+
+        溶剂比取实测值的 0.5 ~ 2 倍，萃余相浓度取实测值的 0.5 ~ 1.5 倍，
+        进料浓度和进口萃取相浓度固定为实测平均值和0。
+        """
+        ratio = np.nanmean(1 / self.k)
+        solvent_ratios = ratio * np.linspace(0.5, 2, n_points)
+        X_raffinate = np.mean(self.X_Rt) * np.linspace(0.5, 1.5, n_points)
+        return contour_table(self.design_sweep(solvent_ratios, None, X_raffinate))
 
     def print_results(self):
         """
@@ -184,6 +438,9 @@ class Extraction_Calculator:
         print(f"操作线2 - 斜率 k2: {self.k2:.4f}, 截距 b2: {self.b2:.4f}")
 
         print(f"\n5. 图解积分结果 (ans3)已计算完成")
+        print(f"传质单元数: {self.ans3}")
+        print(f"误差估计: {self.integration['误差估计']}")
+        print(f"传质单元高度 (m): {self.ans4}")
         print("\n=================================")
 
     def run_calculations(self):
@@ -192,8 +449,7 @@ class Extraction_Calculator:
         """
         self.load_data()
         self.preprocess_data()
-        self.load_distribution_curve_data()
-        self.fit_distribution_curve()
+        self.load_distribution_curve()
         self.calculate_operating_lines()
         self.perform_graphical_integration()
         self.print_results()
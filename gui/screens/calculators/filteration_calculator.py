@@ -12,12 +12,64 @@ project_root = os.path.dirname(
 sys.path.insert(0, project_root)
 import numpy as np
 import pandas as pd
-from sklearn.linear_model import LinearRegression
+
+
+def fit_lines(x, y, mask=None):
+    """
+    批量闭式最小二乘直线拟合
+
+    各组数据按行堆叠为二维数组，由 Σx、Σy、Σxy、Σx² 直接求出各组斜率和截距，
+    所有组一次完成。
+    :param x: 自变量，形状为 (组数, 点数)
+    :param y: 因变量，形状同 x
+    :param mask: 参与拟合的数据点，形状同 x，默认为全部有限值
+    :return: 斜率数组和截距数组，有效点少于2个或自变量全相同的组为NaN
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if mask is None:
+        mask = np.isfinite(x) & np.isfinite(y)
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+
+    n = mask.sum(axis=-1)
+    sum_x = x.sum(axis=-1)
+    sum_y = y.sum(axis=-1)
+    sum_xy = (x * y).sum(axis=-1)
+    sum_xx = (x * x).sum(axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slopes = (n * sum_xy - sum_x * sum_y) / (n * sum_xx - sum_x**2)
+        intercepts = (sum_y - slopes * sum_x) / n
+    return slopes, intercepts
+
+
+def zscore_outliers(y, mask, threshold=2):
+    """
+    批量z分数异常值检测
+
+    :param y: 因变量，形状为 (组数, 点数)
+    :param mask: 有效数据点，形状同 y
+    :param threshold: 异常值阈值
+    :return: 异常值掩码，形状同 y；标准差为0的组没有异常值
+    """
+    n = mask.sum(axis=-1, keepdims=True)
+    y = np.where(mask, y, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = y.sum(axis=-1, keepdims=True) / n
+        std = np.sqrt(
+            (np.where(mask, y - mean, 0.0) ** 2).sum(axis=-1, keepdims=True) / n
+        )
+        z_scores = np.abs(y - mean) / std
+    return mask & (z_scores > threshold)
 
 
 class Filteration_Calculator:
     """
     负责过滤实验数据的计算部分，包括数据加载、拟合、异常值检测等
+
+    CSV首列为序号，其后每3列为一组（滤面高度、时间θ等），组数和各组行数由表格确定，
+    各组不等长时较短的组末尾留空即可。所有组堆叠为二维数组后一次完成拟合和异常值检测。
     """
 
     def __init__(self, csv_file_path):
@@ -46,14 +98,19 @@ class Filteration_Calculator:
         self.q_list = None
         self.q_to_fit = None
         self.delta_theta_over_delta_q_to_fit = None
-        self.fit_model = None
         self.fit_data = None
         self.fit_slope = None
         self.fit_intercept = None
         self.outliers = None
-        self.refit_model = None
         self.filtered_data = None
 
+        # 各组堆叠后的数据，形状为 (组数, 最大点数)
+        self.groups = self.stack_groups()
+        self.group_count = len(self.groups)
+        self.fit_slopes = None
+        self.fit_intercepts = None
+        self.outlier_mask = None
+
     def load_csv_data(self, csv_file_path):
         """
         加载CSV文件并进行数据预处理
@@ -63,20 +120,49 @@ class Filteration_Calculator:
         data = pd.read_csv(csv_file_path, header=0)
         for col in data.columns:
             data[col] = pd.to_numeric(data[col], errors="coerce")
-        data = data.dropna()  # 删除任何含有NaN值的行
+        data = data.dropna(how="all")  # 只删除整行为空的行，各组可以不等长
         return data
 
+    def stack_groups(self):
+        """
+        按表格布局拆分各组数据并堆叠
+        :return: 数组，形状为 (组数, 行数, 3)，不含任何时间数据的组被忽略
+        """
+        n_groups = (self.data.shape[1] - 1) // 3
+        values = self.data.iloc[:, 1 : 1 + 3 * n_groups].to_numpy(dtype=float)
+        groups = values.reshape(len(values), n_groups, 3).transpose(1, 0, 2)
+        recorded = np.isfinite(groups[:, :, 1])
+        groups = groups[recorded.any(axis=1)]
+        recorded = recorded[recorded.any(axis=1)]
+
+        # 各组有时间数据的行按原顺序移到前面，空行留在末尾
+        order = np.argsort(~recorded, axis=1, kind="stable")
+        groups = np.take_along_axis(groups, order[:, :, None], axis=1)
+        if not len(groups):
+            raise ValueError("CSV文件中没有可用的过滤数据组")
+        return groups
+
+    def differentiate_groups(self):
+        """
+        计算各组的 q 值和 Δθ/Δq 值
+        :return: q值中点、Δθ/Δq值和有效数据掩码，形状均为 (组数, 行数 - 1)
+        """
+        delta_theta = np.diff(self.groups[:, :, 1], axis=1)
+        q_to_fit = (np.arange(delta_theta.shape[1]) + 0.5) * self.deltaQ
+        q_to_fit = np.broadcast_to(q_to_fit, delta_theta.shape)
+        delta_theta_over_delta_q = delta_theta / self.deltaQ
+        return q_to_fit, delta_theta_over_delta_q, np.isfinite(delta_theta)
+
     def perform_linear_fit(self, x, y):
         """
         对数据进行线性拟合
         :param x: 自变量
         :param y: 因变量
-        :return: 拟合模型和拟合数据
+        :return: 斜率、截距和拟合数据
         """
         fit_data = np.column_stack((x, y))
-        model = LinearRegression()
-        model.fit(fit_data[:, 0].reshape(-1, 1), fit_data[:, 1])
-        return model, fit_data
+        slope, intercept = fit_lines(fit_data[:, 0], fit_data[:, 1])
+        return slope, intercept, fit_data
 
     def detect_outliers(self, fit_data, threshold=2):
         """
@@ -85,34 +171,22 @@ class Filteration_Calculator:
         :param threshold: 异常值阈值
         :return: 异常值索引
         """
-        z_scores = np.abs(
-            (fit_data[:, 1] - np.mean(fit_data[:, 1])) / np.std(fit_data[:, 1])
-        )
-        outliers = np.where(z_scores > threshold)[0]
-        return outliers
+        y = fit_data[:, 1]
+        return np.flatnonzero(zscore_outliers(y, np.isfinite(y), threshold))
 
     def refit_data_after_outlier_removal(self, fit_data, outliers):
         """
         移除异常值后重新拟合数据
         :param fit_data: 拟合数据 (should be 2D array)
         :param outliers: 异常值索引
-        :return: 新的拟合模型和清洗后的数据
+        :return: 新的斜率、截距和清洗后的数据
         """
-        if len(outliers) > 0:
-            # 确保异常值不是空的
-            filtered_data = np.delete(fit_data, outliers, axis=0)
-        else:
-            # 如果没有异常值，直接使用原始数据
-            filtered_data = fit_data
-
+        filtered_data = np.delete(fit_data, outliers, axis=0)
         if filtered_data.shape[0] == 0:
             raise ValueError("去除异常值后数据为空")
 
-        x = filtered_data[:, 0].reshape(-1, 1)
-        y = filtered_data[:, 1]
-        model = LinearRegression()
-        model.fit(x, y)
-        return model, filtered_data
+        slope, intercept = fit_lines(filtered_data[:, 0], filtered_data[:, 1])
+        return slope, intercept, filtered_data
 
     def process_single_group_data(self, group_index):
         """
@@ -120,11 +194,10 @@ class Filteration_Calculator:
         :param group_index: 组索引
         :return: 拟合所需的数据
         """
-        self.selected_data = self.data.iloc[
-            0:11, 1 + 3 * group_index : 4 + 3 * group_index
-        ]
-        self.data_array = self.selected_data.values
+        self.data_array = self.groups[group_index].copy()
+        self.data_array = self.data_array[np.isfinite(self.data_array[:, 1])]
         self.data_array[:, 0] = self.data_array[:, 0] / 100  # 转换为标准单位
+        self.selected_data = pd.DataFrame(self.data_array)
 
         self.delta_theta_list = np.diff(self.data_array[:, 1])
         self.delta_q_list = np.full(len(self.delta_theta_list), self.deltaQ)
@@ -143,53 +216,60 @@ class Filteration_Calculator:
             self.q_list,
         )
 
-    def process_all_groups(self):
+    def process_all_groups(self, threshold=2):
         """
         处理所有组数据并生成拟合数据
+        :param threshold: 异常值阈值
         :return: 返回拟合图的q值和Δθ/Δq值
         """
-        # 重置列表以保存数据
-        self.q_to_refit_lists = []
-        self.delta_theta_over_delta_q_to_refit_lists = []
-        self.refit_slopes = []
-        self.refit_intercepts = []
+        q_to_fit, delta_theta_over_delta_q, valid = self.differentiate_groups()
 
-        for group_index in range(3):
-            (
-                self.q_to_fit,
-                self.delta_theta_over_delta_q_to_fit,
-                self.delta_theta_over_delta_q_list,
-                self.q_list,
-            ) = self.process_single_group_data(group_index)
-
-            self.fit_model, self.fit_data = self.perform_linear_fit(
-                self.q_to_fit, self.delta_theta_over_delta_q_to_fit
-            )
-            self.fit_slope = self.fit_model.coef_[0]
-            self.fit_intercept = self.fit_model.intercept_
+        # 所有组一次完成初拟合、异常值检测和再拟合
+        self.fit_slopes, self.fit_intercepts = fit_lines(
+            q_to_fit, delta_theta_over_delta_q, valid
+        )
+        self.outlier_mask = zscore_outliers(delta_theta_over_delta_q, valid, threshold)
+        refit_mask = valid & ~self.outlier_mask
+        refit_slopes, refit_intercepts = fit_lines(
+            q_to_fit, delta_theta_over_delta_q, refit_mask
+        )
 
-            print(f"第{group_index+1}组数据初拟合结果:")
-            print("初拟合斜率:", self.fit_slope)
-            print("初拟合截距:", self.fit_intercept)
+        invalid = np.flatnonzero(refit_mask.sum(axis=1) < 2)
+        if len(invalid):
+            raise ValueError(f"第{invalid[0] + 1}组有效数据不足，无法拟合")
 
-            self.outliers = self.detect_outliers(self.fit_data)
-            if len(self.outliers) > 0:
-                self.refit_model, self.filtered_data = (
-                    self.refit_data_after_outlier_removal(self.fit_data, self.outliers)
-                )
-                self.refit_slope = self.refit_model.coef_[0]
-                self.refit_intercept = self.refit_model.intercept_
+        # 没有异常值的组，再拟合结果即初拟合结果
+        self.q_to_refit_lists = [q[m] for q, m in zip(q_to_fit, refit_mask)]
+        self.delta_theta_over_delta_q_to_refit_lists = [
+            y[m] for y, m in zip(delta_theta_over_delta_q, refit_mask)
+        ]
+        self.refit_slopes = list(refit_slopes)
+        self.refit_intercepts = list(refit_intercepts)
 
+        for group_index in range(self.group_count):
+            print(f"第{group_index+1}组数据初拟合结果:")
+            print("初拟合斜率:", self.fit_slopes[group_index])
+            print("初拟合截距:", self.fit_intercepts[group_index])
+            if self.outlier_mask[group_index].any():
                 print(f"第{group_index+1}组数据排除异常值后重新拟合结果:")
-                print("排除异常值后斜率:", self.refit_slope)
-                print("排除异常值后截距:", self.refit_intercept)
-
-                self.q_to_refit_lists.append(self.filtered_data[:, 0])
-                self.delta_theta_over_delta_q_to_refit_lists.append(
-                    self.filtered_data[:, 1]
-                )
-                self.refit_slopes.append(self.refit_slope)
-                self.refit_intercepts.append(self.refit_intercept)
+                print("排除异常值后斜率:", self.refit_slopes[group_index])
+                print("排除异常值后截距:", self.refit_intercepts[group_index])
+
+        # 单组中间变量保留最后一组的结果，便于调试/检查
+        last = self.group_count - 1
+        self.process_single_group_data(last)
+        self.fit_data = np.column_stack(
+            (self.q_to_fit, self.delta_theta_over_delta_q_to_fit)
+        )
+        self.fit_slope = self.fit_slopes[last]
+        self.fit_intercept = self.fit_intercepts[last]
+        self.outliers = np.flatnonzero(self.outlier_mask[last][valid[last]])
+        self.filtered_data = np.column_stack(
+            (
+                self.q_to_refit_lists[last],
+                self.delta_theta_over_delta_q_to_refit_lists[last],
+            )
+        )
 
         return (
             self.q_to_refit_lists,
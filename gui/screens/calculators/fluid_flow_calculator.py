@@ -14,9 +14,221 @@ sys.path.insert(0, project_root)
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
+from functools import partial
+from scipy.optimize import minimize_scalar
 import os
 
+LAMINAR_RE = 2000  # 层流区上限
+TURBULENT_RE = 4000  # 湍流区下限
+COLEBROOK_ITERATIONS = 3  # 以Swamee-Jain显式式为初值，3次牛顿迭代即达到机器精度
+
+
+def laminar_friction_factor(Re):
+    """层流摩擦系数 λ = 64/Re"""
+    return 64 / np.asarray(Re, dtype=float)
+
+
+def blasius_friction_factor(Re):
+    """Blasius光滑管公式 λ = 0.3164/Re^0.25（适用于 4000 < Re < 1e5）"""
+    return 0.3164 / np.asarray(Re, dtype=float) ** 0.25
+
+
+def colebrook_friction_factor(
+    Re, relative_roughness=0.0, iterations=COLEBROOK_ITERATIONS
+):
+    """
+    Colebrook公式 1/√λ = -2lg(ε/(3.7d) + 2.51/(Re√λ)) 的向量化求解
+
+    以 x = 1/√λ 为未知量，整个数组同时做固定次数的牛顿迭代，
+    不逐点调用标量求根器，稠密Re网格也能一次算完。
+
+    参数:
+    Re : array_like
+        雷诺数
+    relative_roughness : array_like
+        相对粗糙度 ε/d，可与Re广播
+    iterations : int
+        牛顿迭代次数
+
+    返回:
+    numpy.ndarray
+        摩擦系数λ
+    """
+    Re, relative_roughness = np.broadcast_arrays(
+        np.asarray(Re, dtype=float), np.asarray(relative_roughness, dtype=float)
+    )
+    a = relative_roughness / 3.7
+    b = 2.51 / Re
+
+    # Swamee-Jain显式近似作为初值
+    x = -1.8 * np.log10(a**1.11 + 6.9 / Re)
+    for _ in range(iterations):
+        s = a + b * x
+        residual = x + 2 * np.log10(s)
+        x = x - residual / (1 + 2 * b / (s * np.log(10)))
+    return 1 / x**2
+
+
+def friction_factor(Re, relative_roughness=0.0, model="colebrook"):
+    """
+    全流区摩擦系数
+
+    Re < LAMINAR_RE 时为层流公式，Re > TURBULENT_RE 时为湍流公式，
+    过渡区内两者按Re线性过渡，保证曲线连续。Re不为正的点返回NaN。
+
+    参数:
+    Re : array_like
+        雷诺数
+    relative_roughness : array_like
+        相对粗糙度 ε/d（仅Colebrook公式使用）
+    model : str
+        湍流区公式，"colebrook" 或 "blasius"
+
+    返回:
+    numpy.ndarray
+        摩擦系数λ
+    """
+    Re = np.asarray(Re, dtype=float)
+    Re_safe = np.where(Re > 0, Re, np.nan)
+    if model == "colebrook":
+        turbulent = colebrook_friction_factor(Re_safe, relative_roughness)
+    elif model == "blasius":
+        turbulent = blasius_friction_factor(Re_safe)
+    else:
+        raise ValueError(f"未知摩擦系数公式: {model}")
+
+    weight = np.clip((Re_safe - LAMINAR_RE) / (TURBULENT_RE - LAMINAR_RE), 0, 1)
+    return (1 - weight) * laminar_friction_factor(Re_safe) + weight * turbulent
+
+
+def log_friction_factor(log_Re, relative_roughness=0.0, model="colebrook"):
+    """以 lg(Re) 为自变量返回 lg(λ)，供双对数绘图使用"""
+    return np.log10(
+        friction_factor(10 ** np.asarray(log_Re), relative_roughness, model)
+    )
+
+
+def fit_relative_roughness(Re, λ, bounds=(0.0, 0.05)):
+    """
+    由实测 (Re, λ) 拟合相对粗糙度 ε/d
+
+    层流区λ与粗糙度无关，只使用 Re > TURBULENT_RE 的数据点；
+    目标函数为 lg(λ) 残差平方和，在 bounds 内做一维有界最小化，
+    每次求值都是对全部数据点的一次向量化Colebrook计算。
+
+    返回:
+    tuple
+        (相对粗糙度, lg(λ)残差均方根)，没有湍流区数据时为 (None, None)
+    """
+    Re = np.asarray(Re, dtype=float)
+    λ = np.asarray(λ, dtype=float)
+    turbulent = (Re > TURBULENT_RE) & (λ > 0)
+    if not turbulent.any():
+        return None, None
+    Re, log_λ = Re[turbulent], np.log10(λ[turbulent])
+
+    def objective(relative_roughness):
+        residual = np.log10(colebrook_friction_factor(Re, relative_roughness)) - log_λ
+        return np.sum(residual**2)
+
+    result = minimize_scalar(objective, bounds=bounds, method="bounded")
+    relative_roughness = float(result.x)
+
+    # 有界最小化不会取到端点，光滑管情形单独比较
+    if objective(bounds[0]) <= result.fun:
+        relative_roughness = float(bounds[0])
+    rms = float(np.sqrt(objective(relative_roughness) / len(Re)))
+    return relative_roughness, rms
+
+
+def fit_pump_curves(Q, curves, degree=2):
+    """
+    以一次Vandermonde最小二乘同时拟合多条泵特性曲线
+
+    参数:
+    Q : array_like
+        流量
+    curves : array_like
+        形状为 (点数, 曲线数)，如扬程、功率、效率按列排列
+    degree : int
+        多项式次数
+
+    返回:
+    numpy.ndarray
+        形状为 (曲线数, degree + 1)，每行为一条曲线的系数（高次在前，与np.polyval一致）
+    """
+    V = np.vander(np.asarray(Q, dtype=float), degree + 1)
+    coefficients, *_ = np.linalg.lstsq(V, np.asarray(curves, dtype=float), rcond=None)
+    return coefficients.T
+
+
+def system_resistance(Q, H, H_static=0.0):
+    """
+    由工作点反算管路特性 H = H_static + K·Q² 的阻力系数K（每个阀门开度一条管路曲线）
+    """
+    Q = np.asarray(Q, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(Q > 0, (np.asarray(H) - H_static) / Q**2, np.nan)
+
+
+def solve_operating_points(params_H, K, H_static=0.0, speed_ratio=1.0):
+    """
+    批量求解泵特性曲线与管路特性曲线的交点
+
+    转速比 r = n/n0 下按比例定律 H(Q) = a·Q² + b·r·Q + c·r²，
+    与管路曲线 H = H_static + K·Q² 联立为一元二次方程后直接求根，
+    K、H_static、r 可为任意可广播的数组，一次求出全部工作点。
+
+    参数:
+    params_H : array_like
+        额定转速下的扬程曲线系数 (a, b, c)
+    K, H_static, speed_ratio : array_like
+        管路阻力系数、静压头和转速比
+
+    返回:
+    tuple
+        (流量, 扬程)，无正实根的组合为NaN
+    """
+    a, b, c = params_H
+    K, H_static, r = np.broadcast_arrays(
+        np.asarray(K, dtype=float),
+        np.asarray(H_static, dtype=float),
+        np.asarray(speed_ratio, dtype=float),
+    )
+    A = a - K
+    B = b * r
+    C = c * r**2 - H_static
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.sqrt(B**2 - 4 * A * C)
+        # 取较大的正根；A为0时退化为一次方程
+        roots = np.stack([(-B + root) / (2 * A), (-B - root) / (2 * A)])
+        roots = np.where(roots > 0, roots, np.nan)
+        Q = np.where(A != 0, np.fmax(roots[0], roots[1]), -C / B)
+    Q = np.where(np.isfinite(Q) & (Q > 0), Q, np.nan)
+    return Q, H_static + K * Q**2
+
+
+def affinity_scale(params, speed_ratio, power):
+    """
+    按比例定律求转速比 r 下曲线在流量Q处的值 y(Q) = r^power · y0(Q/r)
+
+    返回:
+    callable
+        f(Q) -> 数组
+    """
+    degree = len(params) - 1
+
+    def scaled(Q):
+        Q = np.asarray(Q, dtype=float)
+        r = np.asarray(speed_ratio, dtype=float)
+        return sum(
+            coefficient * Q ** (degree - k) * r ** (power - degree + k)
+            for k, coefficient in enumerate(params)
+        )
+
+    return scaled
+
 
 class Fluid_Flow_Calculator:
     def __init__(self, file_dir):
@@ -27,9 +239,11 @@ class Fluid_Flow_Calculator:
         self.log_Re = None
         self.log_λ = None
         self.valid_idx = None
+        self.relative_roughness = None  # 拟合的相对粗糙度 ε/d
+        self.fit_rms = None  # 拟合的lg(λ)残差均方根
 
     def process(self):
-        """进行流体流动分析，包括计算雷诺数和摩擦系数，并进行双对数拟合"""
+        """进行流体流动分析，包括计算雷诺数和摩擦系数，并拟合相对粗糙度"""
         # 已知参数
         d = 0.008  # 管径(m)
         l = 1.70  # 管长(m)
@@ -71,9 +285,13 @@ class Fluid_Flow_Calculator:
         log_Re = np.log10(Re[valid_idx])
         log_λ = np.log10(λ[valid_idx])
 
-        degree = 9
-        coefficients = np.polyfit(log_Re, log_λ, degree)
-        p = np.poly1d(coefficients)
+        # 以Colebrook公式拟合相对粗糙度，拟合曲线 p(lg Re) = lg λ 可在数据范围外外推
+        self.relative_roughness, self.fit_rms = fit_relative_roughness(
+            Re[valid_idx], λ[valid_idx]
+        )
+        p = partial(
+            log_friction_factor, relative_roughness=self.relative_roughness or 0.0
+        )
 
         # 保存结果到实例变量
         self.ans1 = np.column_stack((u, Re, λ))
@@ -132,10 +350,10 @@ class Centrifugal_Pump_Characteristics_Calculator:
         valid_N = np.where(N_elc_e != 0, N_elc_e, 1e-10)
         η = N_e / valid_N
 
-        # 二次拟合
-        params_H, _ = curve_fit(self.quadratic, Q, H)
-        params_N, _ = curve_fit(self.quadratic, Q, N_elc_e)
-        params_η, _ = curve_fit(self.quadratic, Q, η)
+        # 二次拟合（三条曲线一次求解）
+        params_H, params_N, params_η = fit_pump_curves(
+            Q, np.column_stack((H, N_elc_e, η))
+        )
 
         # 保存结果到实例变量
         self.ans2 = np.column_stack((H, N_elc_e, η))
@@ -145,6 +363,68 @@ class Centrifugal_Pump_Characteristics_Calculator:
         self.params_η = params_η
         return self.ans2, self.df, self.params_H, self.params_N, self.params_η
 
+    def operating_points(self, K=None, H_static=0.0, speed_ratio=1.0):
+        """
+        批量求解工作点
+
+        参数:
+        K : array_like, optional
+            管路阻力系数 (m/(m³/h)²)，默认为各实验点阀门开度对应的管路
+        H_static : array_like
+            管路静压头 (m)
+        speed_ratio : array_like
+            转速与实验转速之比
+
+        返回:
+        pd.DataFrame
+            工作点表，K、H_static、speed_ratio 广播后每个组合一行
+        """
+        if K is None:
+            K = system_resistance(self.df.iloc[:, 1].values, self.ans2[:, 0], H_static)
+        Q, H = solve_operating_points(self.params_H, K, H_static, speed_ratio)
+        K, H_static, r = np.broadcast_arrays(K, H_static, speed_ratio)
+
+        N = affinity_scale(self.params_N, r, 3)(Q)
+        η = affinity_scale(self.params_η, r, 0)(Q)
+        return pd.DataFrame(
+            {
+                "阻力系数K": K.ravel(),
+                "静压头/m": H_static.ravel(),
+                "转速比": r.ravel(),
+                "流量Q/(m³/h)": Q.ravel(),
+                "扬程H/m": H.ravel(),
+                "功率N/W": N.ravel(),
+                "效率η": η.ravel(),
+            }
+        )
+
+    def best_efficiency_point(self, speed_ratio=1.0):
+        """
+        求最高效率点
+
+        效率曲线为开口向下的抛物线时取顶点，否则取实验流量范围内效率较高的端点；
+        其他转速按比例定律换算（效率不变，流量、扬程、功率分别按 r、r²、r³ 缩放）。
+
+        返回:
+        dict
+            流量、扬程、功率、效率
+        """
+        Q_data = self.df.iloc[:, 1].values
+        Q_min, Q_max = Q_data.min(), Q_data.max()
+        a, b, _ = self.params_η
+        if a < 0:
+            Q = float(np.clip(-b / (2 * a), Q_min, Q_max))
+        else:
+            Q = max((Q_min, Q_max), key=lambda q: np.polyval(self.params_η, q))
+
+        r = speed_ratio
+        return {
+            "流量Q/(m³/h)": Q * r,
+            "扬程H/m": float(np.polyval(self.params_H, Q)) * r**2,
+            "功率N/W": float(np.polyval(self.params_N, Q)) * r**3,
+            "效率η": float(np.polyval(self.params_η, Q)),
+        }
+
 
 class Auxiliary:
     def __init__(self, file_paths):
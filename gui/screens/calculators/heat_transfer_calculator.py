@@ -179,7 +179,13 @@ class Heat_Transfer_Calculator:
     def process_data(self):
         """
         处理数据集，进行数据预处理和曲线拟合。
+
+        结果写入 self.results（原地清空后重新填充，已持有该列表引用的绘图类无需更新）。
+
+        返回:
+        list: 各数据集的处理结果
         """
+        self.results.clear()
         for idx, dataset in enumerate(self.datasets):
             Δp_kb = dataset["Δp_kb"]
             t_in = dataset["t_in"]
@@ -211,6 +217,7 @@ class Heat_Transfer_Calculator:
                     "params": ans_params,
                 }
             )
+        return self.results
 
     def print_results(self):
         """
@@ -14,7 +14,6 @@ sys.path.insert(0, project_root)
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
 from scipy.stats import pearsonr
 import warnings
 from typing import Dict, List, Union
@@ -22,6 +21,131 @@ from pathlib import Path
 
 warnings.filterwarnings("ignore")
 
+SEGMENT_MIN_POINTS = 3  # 分段线性模型每段最少数据点数
+MAX_BREAKPOINTS = 2  # 最多断点数（载点、泛点）
+MIN_SLOPE_CHANGE = 0.5  # 相邻两段双对数斜率的最小增量，小于此值不视为断点
+
+
+def polynomial_value(x, coefficients):
+    """按升幂系数计算多项式的值（Horner法，x可为数组）"""
+    return np.polynomial.polynomial.polyval(x, coefficients)
+
+
+def polynomial_fit(x, y, degree):
+    """多项式最小二乘拟合（Vandermonde矩阵一次求解），返回升幂系数"""
+    vander = np.vander(x, degree + 1, increasing=True)
+    coefficients, *_ = np.linalg.lstsq(vander, y, rcond=None)
+    return coefficients
+
+
+def _prefix_sums(x, y):
+    """各点 1、x、y、x²、xy、y² 的前缀和，形状为 (6, 点数+1)"""
+    terms = np.stack([np.ones_like(x), x, y, x * x, x * y, y * y])
+    return np.concatenate([np.zeros((6, 1)), np.cumsum(terms, axis=1)], axis=1)
+
+
+def _segment_fit(prefix, i, j):
+    """
+    由前缀和直接求点 [i, j) 的直线拟合，每段代价 O(1)
+
+    i、j 可为数组（按广播规则批量计算）。
+
+    返回:
+    tuple
+        (斜率, 截距, 残差平方和)
+    """
+    i, j = np.broadcast_arrays(i, j)
+    n, sx, sy, sxx, sxy, syy = prefix[:, j] - prefix[:, i]
+    sxx_c = sxx - sx * sx / n
+    sxy_c = sxy - sx * sy / n
+    syy_c = syy - sy * sy / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy_c / sxx_c
+    intercept = (sy - slope * sx) / n
+    sse = np.maximum(syy_c - slope * sxy_c, 0.0)
+    return slope, intercept, sse
+
+
+def find_breakpoints(
+    x,
+    y,
+    max_breaks=MAX_BREAKPOINTS,
+    min_points=SEGMENT_MIN_POINTS,
+    min_slope_change=MIN_SLOPE_CHANGE,
+):
+    """
+    分段线性模型的断点穷举搜索
+
+    对 1 ~ max_breaks+1 段的全部分段方式计算各段直线拟合的残差平方和，
+    各段统计量由前缀和直接求出：两个断点时逐个枚举第一个断点，第二个断点的
+    全部候选一次向量化计算，每个候选代价 O(n)。只保留斜率逐段增大
+    （增量超过 min_slope_change）的分段，段数按BIC选取，避免噪声被误判为断点。
+
+    参数:
+    x, y : array_like
+        按 x 升序排列的数据
+    max_breaks : int
+        最多断点数（0、1或2）
+    min_points : int
+        每段最少点数
+    min_slope_change : float
+        相邻两段斜率的最小增量
+
+    返回:
+    dict
+        segments: 各段 (起始索引, 结束索引, 斜率, 截距)
+        breaks: 断点处的 x（相邻两段直线的交点，限制在两侧数据点之间）
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    x_mean, y_mean = x.mean(), y.mean()  # 中心化以减小前缀和的舍入误差
+    prefix = _prefix_sums(x - x_mean, y - y_mean)
+    m = min_points
+
+    candidates = [((0, n), _segment_fit(prefix, 0, n)[2])]
+    if max_breaks >= 1 and n >= 2 * m:
+        i = np.arange(m, n - m + 1)
+        k1, _, sse1 = _segment_fit(prefix, 0, i)
+        k2, _, sse2 = _segment_fit(prefix, i, n)
+        total = np.where(k2 - k1 > min_slope_change, sse1 + sse2, np.inf)
+        best = int(np.argmin(total))
+        candidates.append(((0, int(i[best]), n), total[best]))
+    if max_breaks >= 2 and n >= 3 * m:
+        best_total, best_split = np.inf, None
+        for i in range(m, n - 2 * m + 1):
+            j = np.arange(i + m, n - m + 1)
+            k1, _, sse1 = _segment_fit(prefix, 0, i)
+            k2, _, sse2 = _segment_fit(prefix, i, j)
+            k3, _, sse3 = _segment_fit(prefix, j, n)
+            increasing = (k2 - k1 > min_slope_change) & (k3 - k2 > min_slope_change)
+            total = np.where(increasing, sse1 + sse2 + sse3, np.inf)
+            best = int(np.argmin(total))
+            if total[best] < best_total:
+                best_total, best_split = total[best], (0, i, int(j[best]), n)
+        if best_split is not None:
+            candidates.append((best_split, best_total))
+
+    # BIC：每段2个参数，每个断点1个参数
+    floor = 1e-12 * max(float(np.sum((y - y_mean) ** 2)), 1e-12)
+    bic = [
+        n * np.log(max(sse, floor) / n) + (3 * (len(split) - 1) - 1) * np.log(n)
+        for split, sse in candidates
+    ]
+    split = candidates[int(np.argmin(bic))][0]
+
+    segments = []
+    for start, stop in zip(split[:-1], split[1:]):
+        slope, intercept, _ = _segment_fit(prefix, start, stop)
+        intercept = intercept + y_mean - slope * x_mean
+        segments.append((start, stop, float(slope), float(intercept)))
+
+    breaks = []
+    for (_, stop, k1, b1), (_, _, k2, b2) in zip(segments[:-1], segments[1:]):
+        x_cross = (b1 - b2) / (k2 - k1)
+        breaks.append(float(np.clip(x_cross, x[stop - 1], x[stop])))
+    return {"segments": segments, "breaks": breaks}
+
 
 class Experiment_Data_Loader:
     """数据加载器，负责管理实验数据文件"""
@@ -86,7 +210,44 @@ class Packed_Tower_Calculator:
 
     @staticmethod
     def taylor_fit(x, *coefficients):
-        return sum(coeff * (x**i) for i, coeff in enumerate(coefficients))
+        return polynomial_value(x, coefficients)
+
+    def detect_loading_flooding(self, u, Δp_over_Z):
+        """
+        载点与泛点检测
+
+        在双对数坐标下对 log(Δp/Z)–log(u) 做分段线性断点搜索：三段时两个断点
+        依次为载点和泛点，两段时只有载点（泛点超出测量范围），一段时
+        （如干填料）两者都没有。泛点气速对应的气体流量即为塔的处理能力。
+        """
+        valid = np.isfinite(u) & np.isfinite(Δp_over_Z) & (u > 0) & (Δp_over_Z > 0)
+        order = np.argsort(u[valid])
+        log_u = np.log(u[valid][order])
+        log_Δp = np.log(Δp_over_Z[valid][order])
+
+        model = find_breakpoints(log_u, log_Δp)
+        breaks = np.exp(model["breaks"])
+        u_loading = float(breaks[0]) if len(breaks) >= 1 else None
+        u_flooding = float(breaks[1]) if len(breaks) >= 2 else None
+
+        A = np.pi * (self.D / 2) ** 2
+        return {
+            "log_segments": [
+                {
+                    "u_range": (
+                        float(np.exp(log_u[start])),
+                        float(np.exp(log_u[stop - 1])),
+                    ),
+                    "slope": slope,
+                    "intercept": intercept,
+                }
+                for start, stop, slope, intercept in model["segments"]
+            ],
+            "u_loading": u_loading,
+            "u_flooding": u_flooding,
+            # 塔处理能力：泛点气速下的空塔气体流量 (m³/h)
+            "capacity": None if u_flooding is None else u_flooding * A * 3600,
+        }
 
     def calc_fluid_dynamics(self, csv_file: str, threshold: float = 0.95) -> dict:
         file_path = self.data_loader.get_file(csv_file)
@@ -111,10 +272,10 @@ class Packed_Tower_Calculator:
         # 数据拟合
         corr, _ = pearsonr(u, Δp_over_Z)
         if abs(corr) >= threshold:
-            popt, _ = curve_fit(self.linear_fit, u, Δp_over_Z)
+            popt = polynomial_fit(u, Δp_over_Z, 1)[::-1]  # [斜率, 截距]
             fit_type = "linear"
         else:
-            popt, _ = curve_fit(self.taylor_fit, u, Δp_over_Z, p0=[0] * 5)
+            popt = polynomial_fit(u, Δp_over_Z, 4)
             fit_type = "taylor"
 
         return {
@@ -123,6 +284,7 @@ class Packed_Tower_Calculator:
             "corr": corr,
             "popt": popt,
             "fit_type": fit_type,
+            **self.detect_loading_flooding(u, Δp_over_Z),
             "csv_file": csv_file,
         }
 
@@ -12,15 +12,27 @@ project_root = os.path.dirname(
 sys.path.insert(0, project_root)
 
 import logging
+import traceback
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import serial
+import numpy as np
+from matplotlib.figure import Figure
 
 # 导入界面配置和小部件
-from gui.screens.utils.config import MAIN_FRAME_CONFIG, SCREEN_CONFIG
+from gui.screens.utils.config import DATA_CONFIG, MAIN_FRAME_CONFIG, SCREEN_CONFIG
 from gui.screens.common_widgets.plot_widget import PlotWidget
 from gui.screens.common_widgets.string_entries_widget import StringEntriesWidget
 from gui.screens.common_widgets.table_widget import TableWidget
+from gui.screens.utils.executor_service import Executor_Service
+from gui.screens.utils.acquisition_hub import Acquisition_Hub
+from gui.screens.utils.acquisition_log import (
+    Acquisition_Log_Writer,
+    new_log_directory,
+)
+from gui.screens.utils.expserial import Experiment_Serial
+from gui.screens.utils.plateau_detector import Plateau_Detector
+from gui.screens.utils.serial_acquisition import Serial_Acquisition
 
 # 配置日志
 logging.basicConfig(
@@ -43,6 +55,14 @@ class Base_Screen(ttk.Frame):
         "stopbits": serial.STOPBITS_ONE,
         "timeout": 1,
     }
+    SNAPSHOT_ATTRS = (  # 屏幕回收时保存的轻量状态属性
+        "data_files",
+        "csv_file_path",
+        "csv_file_paths",
+        "file_paths",
+        "file_dict",
+        "images_paths",
+    )
 
     def __init__(self, window):
         super().__init__(window)
@@ -52,6 +72,16 @@ class Base_Screen(ttk.Frame):
         self.current_page = 0
         self.images_paths = []
         self.serial_connection = None
+        self.acquisition = None
+        self.protocol = None
+        self.instruments = []  # 多仪器采集时的 Instrument 列表
+        self.acquisition_log = None  # 采集日志写入器，首批样本到达时创建
+        self.acquisition_log_dir = None
+        self.plateau_detectors = []  # 每个采集通道一个平台期检测器
+        self.plateau_events = []
+        self._acquisition_after_id = None
+        self._acquisition_finished = True  # 本次采集是否已收尾
+        self.background_task = None
         self._debounce_id = None
 
         # 初始化组件
@@ -146,18 +176,13 @@ class Base_Screen(ttk.Frame):
         self.right_frame.columnconfigure(0, weight=1)
         self.right_frame.rowconfigure(0, weight=1)
 
-        # 添加对窗口大小调整的监听，确保右侧面板刷新
+        # 右侧面板尺寸变化或屏幕重新显示时，通过重绘调度器合并刷新
         self.right_frame.bind("<Configure>", self._on_right_panel_resize)
+        self.bind("<Map>", self._on_right_panel_resize, add="+")
 
     def _on_right_panel_resize(self, event):
-        """监听右侧面板大小调整"""
-        # 强制更新布局
-        self.right_frame.update_idletasks()  # 强制更新右侧面板
-        self.right_frame.after(100, self.right_frame.update)  # 延时更新，确保刷新正常
-
-        # 只在需要时刷新图形事件
-        self.after(100, self.plot_frame.canvas.flush_events)  # 延迟刷新图形事件
-        self.after(100, self.plot_frame.canvas.draw_idle)  # 延迟刷新图形
+        """监听右侧面板大小调整（隐藏屏幕的请求由调度器跳过）"""
+        self.plot_frame.request_redraw()
 
     @property
     def parameters(self):
@@ -202,9 +227,177 @@ class Base_Screen(ttk.Frame):
             self.logger.error(f"串口打开失败: {str(e)}")
 
     def _close_serial(self):
+        self._stop_acquisition()
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
 
+    # ---------------------------- 串口采集方法 ----------------------------
+    def create_protocol(self):
+        """创建仪器协议解析器（子类可重写以指定帧格式和字段）"""
+        return Experiment_Serial(mode="ascii")
+
+    def create_acquisition(self):
+        """创建采集对象：配置了多台仪器时使用异步采集中心，否则读取当前串口"""
+        if self.instruments:
+            self.protocol = None
+            return Acquisition_Hub(self.instruments)
+        self.protocol = self.create_protocol()
+        return Serial_Acquisition(
+            self.serial_connection, parser=self.protocol.parse_samples
+        )
+
+    def _start_acquisition(self):
+        """启动后台采集线程并开始定时轮询"""
+        serial_open = self.serial_connection and self.serial_connection.is_open
+        if not self.instruments and not serial_open:
+            messagebox.showwarning("警告", "请先打开串口连接！")
+            return False
+        if self.acquisition and self.acquisition.running:
+            return False
+
+        self.acquisition = self.create_acquisition().start()
+        self._acquisition_finished = False
+        self.plateau_detectors, self.plateau_events = [], []
+        self.acquisition_log, self.acquisition_log_dir = None, new_log_directory()
+        self._schedule_acquisition_poll()
+        self.logger.info("开始串口采集")
+        return True
+
+    def _stop_acquisition(self):
+        """
+        停止采集线程，取出剩余样本并收尾
+
+        收尾只执行一次，与采集线程是否仍在运行无关：采集出错或自行结束时
+        由轮询调用，之后用户再点击停止不会重复收尾。
+        """
+        if self.acquisition is None:
+            return False
+        if self._acquisition_after_id is not None:
+            self.after_cancel(self._acquisition_after_id)
+            self._acquisition_after_id = None
+        was_running = self.acquisition.running
+        self.acquisition.stop()
+        if not self._acquisition_finished:
+            self._acquisition_finished = True
+            self._collect_samples()
+            self.plot_frame.stop_live()
+            if self.acquisition_log is not None:
+                self._close_acquisition_log()
+            for channel, detector in enumerate(self.plateau_detectors):
+                event = detector.finish()
+                if event is not None:
+                    self.on_plateau_event(channel, event)
+            self.logger.info(f"采集结束: {self.acquisition.stats()}")
+            if self.protocol is not None:
+                self.logger.info(f"协议解析: {self.protocol.stats()}")
+        return was_running
+
+    def _close_acquisition_log(self):
+        """关闭采集日志，写入失败或超时未完成时提示用户"""
+        closed = self.acquisition_log.close()
+        error = self.acquisition_log.error
+        if error is None and closed:
+            self.logger.info(f"采集日志: {self.acquisition_log_dir}")
+            return
+        reason = str(error) if error is not None else "写入线程未在限定时间内结束"
+        self.logger.error(f"采集日志不完整: {self.acquisition_log_dir} ({reason})")
+        messagebox.showerror("错误", f"采集日志写入失败，日志可能不完整：{reason}")
+
+    def _schedule_acquisition_poll(self):
+        self._acquisition_after_id = self.after(
+            DATA_CONFIG["time_interval"], self._poll_acquisition
+        )
+
+    def _poll_acquisition(self):
+        """在Tk线程中定时取出新样本，采集出错或结束时收尾"""
+        self._acquisition_after_id = None
+        self._collect_samples()
+
+        acquisition = self.acquisition
+        new_failures = getattr(acquisition, "new_failures", None)
+        for name, error in new_failures() if new_failures else ():
+            self.logger.error(f"仪器 {name} 采集中断，其余仪器继续采集: {str(error)}")
+            messagebox.showwarning("警告", f"仪器 {name} 采集中断：{str(error)}")
+        if acquisition.running and acquisition.error is None:
+            self._schedule_acquisition_poll()
+            return
+        self._stop_acquisition()
+        if acquisition.error is not None:
+            messagebox.showerror("错误", f"串口采集中断：{str(acquisition.error)}")
+
+    def _collect_samples(self):
+        """取出新样本，写入采集日志并分发给平台期检测和显示"""
+        times, samples = self.acquisition.poll()
+        if len(samples):
+            if self.acquisition_log is None:
+                self.acquisition_log = Acquisition_Log_Writer(
+                    self.acquisition_log_dir,
+                    columns=["时间/s"] + self._acquisition_channels(),
+                )
+            self.acquisition_log.append(times, samples)
+            self._detect_plateaus(times, samples)
+            self.on_samples_acquired(times, samples)
+
+    def _detect_plateaus(self, times, samples):
+        """逐通道对新样本进行平台期检测"""
+        if len(self.plateau_detectors) != samples.shape[1]:
+            self.plateau_detectors = [Plateau_Detector() for _ in samples.T]
+        for channel, detector in enumerate(self.plateau_detectors):
+            for event in detector.update_batch(times, samples[:, channel]):
+                self.on_plateau_event(channel, event)
+
+    def on_plateau_event(self, channel, event):
+        """
+        平台期事件回调（Tk线程），默认记录事件并发出虚拟事件
+        <<PlateauStart>> / <<PlateauEnd>>，子类可绑定或重写
+
+        Args:
+            channel: 通道序号
+            event: Plateau_Detector 返回的事件字典
+        """
+        event["通道"] = channel
+        self.plateau_events.append(event)
+        self.logger.info(f"平台期{event['事件']}: {event}")
+        if event["事件"] == "开始":
+            self.event_generate("<<PlateauStart>>")
+        else:
+            self.event_generate("<<PlateauEnd>>")
+
+    def _acquisition_channels(self):
+        """采集通道名称，优先使用采集中心或协议给出的名称"""
+        names = getattr(self.acquisition, "channel_names", None)
+        if names:
+            return list(names)
+        if self.protocol is not None and self.protocol.dtype is not None:
+            return list(self.protocol.dtype.names)
+        return [f"通道{j + 1}" for j in range(self.acquisition.buffer.n_channels)]
+
+    def on_samples_acquired(self, times, samples):
+        """
+        新样本回调（Tk线程），默认在原始数据表格中显示最近的样本，
+        并以降采样后的实时曲线显示缓冲区内的全部样本
+
+        Args:
+            times: 新样本的时间（秒），为环形缓冲区视图
+            samples: 新样本数组（样本数, 通道数），为环形缓冲区视图
+        """
+        buffer = self.acquisition.buffer
+        times, samples = buffer.latest(DATA_CONFIG["plot_max_points"])
+        cols = ["序号", "时间/s"] + self._acquisition_channels()
+        if list(self.raw_table.cols) != cols:
+            self.raw_table.update_columns(cols)
+        self.raw_table.set_dataframe(
+            np.column_stack([times, samples]),
+            formats="%.3f",
+            index_start=buffer.written - len(samples) + 1,
+            auto_scroll=True,
+        )
+
+        if len(self.plot_frame.live_lines) != buffer.n_channels:
+            self.plot_frame.start_live(buffer.n_channels)
+        # 实时曲线在 after() 回调中才绘制，须复制窗口，避免届时已被写入方覆盖
+        self.plot_frame.update_live(*buffer.snapshot(buffer.capacity))
+
     # ---------------------------- 通用功能方法 ----------------------------
     def bind_parameter_change(self, widget):
         """绑定参数修改事件到控件。
@@ -223,31 +416,101 @@ class Base_Screen(ttk.Frame):
         pass
 
     def start_data_acquisition(self):
-        """数据采集启动（子类必须重写）。"""
-        raise NotImplementedError("子类需实现 start_data_acquisition 方法")
+        """数据采集启动（默认启动后台串口采集，子类可重写）。"""
+        self._start_acquisition()
 
     def stop_data_acquisition(self):
-        """停止数据采集（子类必须重写）。"""
-        raise NotImplementedError("子类需实现 stop_data_acquisition 方法")
+        """停止数据采集（默认停止后台串口采集，子类可重写）。"""
+        self._stop_acquisition()
 
-    def show_processing(self, msg="处理中..."):
+    def show_processing(self, msg="处理中...", maximum=None, on_cancel=None):
         """显示处理中对话框。
 
         Args:
             msg: 对话框显示的消息
+            maximum: 总步骤数，提供时显示确定进度，否则显示不确定进度
+            on_cancel: 取消回调，提供时显示取消按钮
         """
         self.processing_win = tk.Toplevel(self.window)
         self.processing_win.title("请稍候")
-        self.processing_win.geometry("300x100")
+        self.processing_win.geometry("300x130" if on_cancel else "300x100")
 
-        ttk.Label(self.processing_win, text=msg).pack(pady=10)
-        self.progress = ttk.Progressbar(self.processing_win, mode="indeterminate")
+        self.processing_label = ttk.Label(self.processing_win, text=msg)
+        self.processing_label.pack(pady=10)
+        if maximum:
+            self.progress = ttk.Progressbar(
+                self.processing_win, mode="determinate", maximum=maximum
+            )
+        else:
+            self.progress = ttk.Progressbar(self.processing_win, mode="indeterminate")
+            self.progress.start()
         self.progress.pack(fill="x", padx=20, pady=5)
-        self.progress.start()
+
+        if on_cancel:
+            ttk.Button(self.processing_win, text="取消", command=on_cancel).pack(pady=5)
+            self.processing_win.protocol("WM_DELETE_WINDOW", on_cancel)
 
         self.processing_win.grab_set()
         self.processing_win.update()
 
+    def update_processing(self, value, msg=None):
+        """更新处理中对话框的进度和消息"""
+        if not hasattr(self, "processing_win"):
+            return
+        self.progress["value"] = value
+        if msg:
+            self.processing_label.config(text=msg)
+
+    def run_in_background(
+        self, steps, on_success, msg="处理中...", error_msg="处理失败"
+    ):
+        """在后台执行任务，不阻塞Tk主循环。
+
+        Args:
+            steps: [(函数, "thread" | "process"), ...]，后一步骤以前一步骤的结果为参数
+            on_success: 全部步骤完成后在Tk线程中调用，参数为最后一步的结果
+            msg: 进度对话框显示的消息
+            error_msg: 失败时的错误提示前缀
+
+        Returns:
+            Background_Task 任务句柄；已有任务执行时返回 None
+        """
+        if self.background_task and not self.background_task.finished:
+            messagebox.showwarning("警告", "已有任务正在执行，请稍候")
+            return None
+
+        def _on_success(result):
+            self.close_processing()
+            try:
+                on_success(result)
+            except Exception as e:
+                _on_error(e)
+
+        def _on_error(e):
+            self.close_processing()
+            details = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+            self.logger.error(f"{error_msg}: {details}")
+            messagebox.showerror("错误", f"{error_msg}：{str(e)}")
+
+        self.show_processing(
+            msg, maximum=len(steps), on_cancel=self.cancel_background_task
+        )
+        self.background_task = Executor_Service.shared().submit(
+            self,
+            steps,
+            on_success=_on_success,
+            on_error=_on_error,
+            on_progress=lambda done, total: self.update_processing(done),
+            on_cancel=self.close_processing,
+        )
+        return self.background_task
+
+    def cancel_background_task(self):
+        """取消当前后台任务"""
+        if self.background_task and not self.background_task.finished:
+            self.background_task.cancel()
+            self.logger.info("后台任务已取消")
+
     def update_table(self, table, data):
         if isinstance(table, TableWidget):
             table.clear()
@@ -275,12 +538,82 @@ class Base_Screen(ttk.Frame):
                 del self.processing_win
                 if hasattr(self, "progress"):
                     del self.progress
+                if hasattr(self, "processing_label"):
+                    del self.processing_label
+
+    # ---------------------------- 状态快照 ----------------------------
+    def can_evict(self):
+        """屏幕是否可被回收（串口连接中、采集中或正在处理时不可回收）"""
+        serial_open = self.serial_connection and self.serial_connection.is_open
+        serial_open = serial_open or (self.acquisition and self.acquisition.running)
+        task_running = self.background_task and not self.background_task.finished
+        return (
+            not serial_open and not task_running and not hasattr(self, "processing_win")
+        )
+
+    def snapshot_state(self):
+        """
+        生成轻量状态快照，用于屏幕回收后重建
+
+        仅保存文件路径、参数、表格文本和绘图分页等状态（分页中的Figure对象
+        直接保留，恢复时重新挂到新画布），处理器和计算器不保存，重建后需重新处理。
+        """
+        snapshot = {
+            "attrs": {
+                name: getattr(self, name)
+                for name in self.SNAPSHOT_ATTRS
+                if hasattr(self, name)
+            },
+            "tables": {},
+            "plot": {
+                "images_paths": list(getattr(self.plot_frame, "images_paths", [])),
+                "current_page": getattr(self.plot_frame, "current_page", 0),
+            },
+        }
+        if hasattr(self.param_widget, "get_values"):
+            snapshot["parameters"] = self.parameters
+
+        for name in ("raw_table", "result_table"):
+            table = getattr(self, name)
+            snapshot["tables"][name] = {
+                "cols": list(table.cols),
+                "widths": list(table.widths),
+                "rows": table.get_rows(),
+            }
+        return snapshot
+
+    def restore_state(self, snapshot):
+        """从快照恢复屏幕状态"""
+        for name, value in snapshot["attrs"].items():
+            setattr(self, name, value)
+
+        if "parameters" in snapshot and hasattr(self.param_widget, "set_values"):
+            self.parameters = snapshot["parameters"]
+
+        for name, state in snapshot["tables"].items():
+            table = getattr(self, name)
+            table.update_columns(state["cols"], state["widths"])
+            table.set_rows(state["rows"])
+
+        images_paths = [
+            p
+            for p in snapshot["plot"]["images_paths"]
+            if isinstance(p, Figure) or os.path.exists(p)
+        ]
+        if images_paths:
+            self.plot_frame.set_images_paths(images_paths)
+            self.plot_frame.current_page = min(
+                snapshot["plot"]["current_page"], len(images_paths) - 1
+            )
+            self.plot_frame.show_current_image()
 
     def _safe_close(self):
         """安全关闭窗口，确保资源释放。"""
         self._close_serial()
+        self.cancel_background_task()
         if hasattr(self, "processing_win"):
             self.close_processing()
+        Executor_Service.shared().shutdown()
         self.window.destroy()
 
     # ---------------------------- 核心功能接口 ----------------------------
@@ -11,11 +11,19 @@ project_root = os.path.dirname(
 )
 sys.path.insert(0, project_root)
 
-from tkinter import ttk
+import time
+import warnings
+import numpy as np
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk, filedialog, messagebox
 from PIL import Image as pilImage, ImageTk
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from gui.screens.utils.config import DATA_CONFIG
+from gui.screens.utils.decimation import decimate
+from gui.screens.utils.figure_export import save_figure
+from gui.screens.utils.redraw_scheduler import Redraw_Scheduler
 
 
 class PlotWidget(ttk.Frame):
@@ -44,12 +52,48 @@ class PlotWidget(ttk.Frame):
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.plot_container)
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
+        # 图片页视图：直接贴显示分辨率的位图，无需经过Matplotlib重绘
+        self.image_view = tk.Canvas(
+            self.plot_container,
+            background="white",
+            width=1,  # 请求尺寸保持最小，避免位图尺寸反向撑大窗口
+            height=1,
+            highlightthickness=2,
+            highlightbackground="black",
+        )
+        self._image_item = self.image_view.create_image(0, 0, anchor="nw")
+        self.image_view.bind("<Configure>", lambda event: self.request_redraw())
+
+        # 尺寸变化事件先记录，由重绘调度器每帧合并处理一次
+        self._pending_resizes = {}  # {画布: 最新的<Configure>事件}
+        self._bind_scheduled_resize(self.canvas)
+
+        # 分页内容：图片路径或内存中的Figure对象
+        self.images_paths = []
+        self.current_page = 0
+        self._active_view = self.canvas.get_tk_widget()  # 当前显示的视图
+        self._page_canvases = {}  # {页码: Figure页对应的画布}
+
+        # 显示位图缓存 {(路径, 修改时间, 宽, 高): PhotoImage}，按LRU淘汰
+        self.render_cache = OrderedDict()
+        self.render_cache_size = DATA_CONFIG["plot_cache_size"]
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._source_image = (None, None)  # 当前页解码后的原图 (键, Image)
+        self._displayed_bitmap = None
+
+        # 实时曲线：原地更新Line2D数据，仅重绘坐标区（blit），并限制刷新帧率
+        self.live_lines = []
+        self._live_background = None  # 不含实时曲线的坐标区背景
+        self._live_data = None  # 尚未绘制的最新数据 (x, ys)
+        self._live_after_id = None
+        self._live_last_draw = 0.0
+        self.live_frame_ms = DATA_CONFIG["live_frame_ms"]
+        self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+
         # 创建分页控件（单独容器，放在主容器底部）
         self._create_pagination_controls()
 
-        # 绑定窗口大小改变事件
-        self.bind("<Configure>", self.resize_image)
-
     def _set_plot_style(self):
         """配置图表样式（无刻度、仅保留边框）"""
         # 隐藏所有刻度和标签
@@ -72,6 +116,8 @@ class PlotWidget(ttk.Frame):
 
     def clear(self):
         """清除当前图表内容"""
+        self._activate_view(self.canvas.get_tk_widget())
+        self.live_lines, self._live_background = [], None
         self.ax.clear()
         self._set_plot_style()
         self.canvas.draw()
@@ -89,42 +135,256 @@ class PlotWidget(ttk.Frame):
     def _adjust_plot_limits(self, x, y):
         """自动调整坐标范围使图形填满绘图区"""
         if len(x) > 0 and len(y) > 0:
-            x_padding = (max(x) - min(x)) * 0.05
-            y_padding = (max(y) - min(y)) * 0.05
-            self.ax.set_xlim(min(x) - x_padding, max(x) + x_padding)
-            self.ax.set_ylim(min(y) - y_padding, max(y) + y_padding)
-        self.canvas.draw()
+            x_min, x_max = np.nanmin(x), np.nanmax(x)
+            y_min, y_max = np.nanmin(y), np.nanmax(y)
+            x_padding = (x_max - x_min) * 0.05
+            y_padding = (y_max - y_min) * 0.05
+            self.ax.set_xlim(x_min - x_padding, x_max + x_padding)
+            self.ax.set_ylim(y_min - y_padding, y_max + y_padding)
+        self.canvas.draw_idle()
+
+    # ---------------------------- 实时曲线 ----------------------------
+    def start_live(self, n_lines, **kwargs):
+        """
+        进入实时曲线模式
+        :param n_lines: 曲线条数
+        :param kwargs: 传给 Axes.plot 的线型参数
+        """
+        self.stop_live()
+        self.clear()
+        kwargs.setdefault("linewidth", 1)
+        self.live_lines = [
+            self.ax.plot([], [], animated=True, **kwargs)[0] for _ in range(n_lines)
+        ]
+        self.canvas.draw_idle()
+
+    def update_live(self, x, ys):
+        """
+        提交最新数据，按帧率上限合并刷新
+        :param x: 横坐标数组
+        :param ys: 纵坐标数组，形状为 (点数, 曲线条数)
+        """
+        self._live_data = (x, ys)
+        if self._live_after_id is None:
+            now = time.monotonic() * 1000
+            delay = max(0, int(self._live_last_draw + self.live_frame_ms - now))
+            self._live_after_id = self.after(delay, self._render_live)
+
+    def stop_live(self):
+        """退出实时曲线模式，曲线转为普通线条保留在图中"""
+        if self._live_after_id is not None:
+            self.after_cancel(self._live_after_id)
+            self._live_after_id = None
+        if not self.live_lines:
+            return
+        self._render_live()
+        for line in self.live_lines:
+            line.set_animated(False)
+        self.live_lines, self._live_background = [], None
+        self.canvas.draw_idle()
+
+    def _render_live(self):
+        """降采样后原地更新曲线数据，坐标范围不变时只重绘坐标区"""
+        self._live_after_id = None
+        if not self.live_lines or self._live_data is None:
+            return
+        x, ys = self._live_data
+        self._live_data = None
+        x = np.asarray(x)
+        ys = np.asarray(ys).reshape(len(x), -1)
+
+        max_points = DATA_CONFIG["plot_max_points"]
+        for j, line in enumerate(self.live_lines[: ys.shape[1]]):
+            line.set_data(*decimate(x, ys[:, j], max_points))
+        self._live_last_draw = time.monotonic() * 1000
+
+        if self._fit_live_limits(x, ys) or self._live_background is None:
+            self.canvas.draw_idle()  # 完整重绘后在 draw_event 中重新缓存背景
+        elif self.winfo_viewable():
+            self.canvas.restore_region(self._live_background)
+            for line in self.live_lines:
+                self.ax.draw_artist(line)
+            self.canvas.blit(self.ax.bbox)
+
+    def _fit_live_limits(self, x, ys):
+        """
+        数据超出坐标范围或明显缩小时重设范围
+        :return: 是否需要完整重绘
+        """
+        finite_x, finite_y = x[np.isfinite(x)], ys[np.isfinite(ys)]
+        if not len(finite_x) or not len(finite_y):
+            return False
+        x_min, x_max = finite_x.min(), finite_x.max()
+        y_min, y_max = finite_y.min(), finite_y.max()
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        inside = x0 <= x_min and x_max <= x1 and y0 <= y_min and y_max <= y1
+        if inside and (y_max - y_min) >= 0.5 * (y1 - y0):
+            return False
+
+        x_span = (x_max - x_min) or 1.0
+        y_span = (y_max - y_min) or max(abs(y_max) * 0.01, 1e-6)
+        self.ax.set_xlim(x_min, x_max + 0.2 * x_span)  # 右侧预留余量，减少重设次数
+        self.ax.set_ylim(y_min - 0.1 * y_span, y_max + 0.1 * y_span)
+        return True
+
+    def _on_canvas_draw(self, event):
+        """完整重绘后重新缓存坐标区背景，并补画实时曲线"""
+        if not self.live_lines:
+            return
+        self._live_background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for line in self.live_lines:
+            self.ax.draw_artist(line)
 
     def show_current_image(self):
-        """显示当前图像（填满整个绘图区）"""
+        """显示当前页（Figure页直接渲染，图片页填满整个绘图区）"""
         if not self.images_paths or self.current_page >= len(self.images_paths):
             return
 
+        page = self.images_paths[self.current_page]
         try:
-            img = pilImage.open(self.images_paths[self.current_page])
-            self.clear()
-
-            # 直接填充整个坐标系，使用自动调整范围
-            self.ax.imshow(img, aspect="auto")
-            self.ax.autoscale()  # 自动调整坐标轴范围
-
-            self._set_plot_style()  # 确保spines样式应用
-            self.canvas.draw()
+            if isinstance(page, Figure):
+                self._show_figure(page)
+            else:
+                self._show_image_file(page)
             self._update_page_controls()
         except Exception as e:
             print(f"图像加载失败: {str(e)}")
 
-    def resize_image(self, event):
-        """响应窗口大小变化"""
-        if event.width > 0 and event.height > 0:
-            self.figure.set_size_inches(
-                event.width / self.figure.dpi, event.height / self.figure.dpi
-            )
-            # 重新设置spines样式并调整坐标轴范围
-            self._set_plot_style()
-            self.ax.set_xlim(self.ax.get_xlim())  # 保持当前范围或自动调整
-            self.ax.set_ylim(self.ax.get_ylim())
-            self.canvas.draw()
+    def _show_image_file(self, image_path):
+        """将图片页按当前视图尺寸缩放后贴到图片视图上（填满整个绘图区）"""
+        self._activate_view(self.image_view)
+        width, height = self._image_view_size()
+        bitmap = self._get_display_bitmap(image_path, width, height)
+        self._displayed_bitmap = bitmap  # 保持引用，避免位图被淘汰后显示空白
+        self.image_view.itemconfigure(self._image_item, image=bitmap)
+        self.image_view.coords(self._image_item, *self._image_view_offset())
+
+    def _image_view_size(self):
+        """图片视图的可用像素尺寸，尚未布局时按绘图容器尺寸估计"""
+        border = 2 * self._image_view_offset()[0]
+        for widget in (self.image_view, self.plot_container):
+            width = widget.winfo_width() - border
+            height = widget.winfo_height() - border
+            if width > 1 and height > 1:
+                return width, height
+        return self.canvas.get_width_height()
+
+    def _image_view_offset(self):
+        """边框占用的偏移量"""
+        offset = int(self.image_view.cget("highlightthickness"))
+        return offset, offset
+
+    def _get_display_bitmap(self, image_path, width, height):
+        """
+        获取显示分辨率的位图
+
+        以 (路径, 修改时间, 宽, 高) 为键缓存缩放后的位图，翻页或窗口尺寸
+        往返变化时直接复用，不再解码原图；超出容量时淘汰最久未使用的条目。
+        """
+        path = os.path.abspath(image_path)
+        mtime = os.path.getmtime(path)
+        key = (path, mtime, width, height)
+
+        bitmap = self.render_cache.get(key)
+        if bitmap is not None:
+            self.render_cache.move_to_end(key)
+            self.cache_hits += 1
+            return bitmap
+
+        self.cache_misses += 1
+        source = self._load_source_image(path, mtime)
+        bitmap = ImageTk.PhotoImage(
+            source.resize((width, height), pilImage.BILINEAR, reducing_gap=3.0),
+            master=self.image_view,
+        )
+        self.render_cache[key] = bitmap
+        while len(self.render_cache) > self.render_cache_size:
+            self.render_cache.popitem(last=False)
+        return bitmap
+
+    def _load_source_image(self, path, mtime):
+        """解码原图，仅保留当前页的一份，窗口拖动时避免重复解码"""
+        key, image = self._source_image
+        if key != (path, mtime):
+            with pilImage.open(path) as img:
+                image = img.convert("RGBA")
+            self._source_image = ((path, mtime), image)
+        return image
+
+    def clear_render_cache(self):
+        """清空显示位图缓存"""
+        self.render_cache.clear()
+        self._source_image = (None, None)
+
+    def _show_figure(self, fig):
+        """将内存中的Figure挂到独立画布上显示，无需编码/解码图片"""
+        canvas = self._page_canvases.get(self.current_page)
+        if canvas is None:
+            fig.set_dpi(self.figure.dpi)  # 按屏幕分辨率显示，导出时另行指定dpi
+            canvas = FigureCanvasTkAgg(fig, master=self.plot_container)
+            self._bind_scheduled_resize(canvas)
+            self._page_canvases[self.current_page] = canvas
+        self._activate_view(canvas.get_tk_widget())
+
+        # 画布保留上次渲染的像素，图形未变化时翻页无需重新渲染
+        if fig.stale:
+            canvas.draw_idle()
+
+    @staticmethod
+    def _relayout(fig):
+        """画布尺寸变化后重新紧凑布局"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                fig.tight_layout()
+            except Exception:
+                pass
+
+    def _activate_view(self, view):
+        """切换当前显示的视图"""
+        if view is self._active_view:
+            return
+        self._active_view.pack_forget()
+        view.pack(fill="both", expand=True)
+        self._active_view = view
+
+    def _release_page_canvases(self):
+        """销毁旧分页的画布并切回默认画布"""
+        self._activate_view(self.canvas.get_tk_widget())
+        for canvas in self._page_canvases.values():
+            self._pending_resizes.pop(canvas, None)
+            canvas.get_tk_widget().destroy()
+        self._page_canvases = {}
+
+    def _bind_scheduled_resize(self, canvas):
+        """以调度器接管画布的尺寸变化事件，替代Matplotlib逐事件重绘"""
+
+        def on_configure(event):
+            self._pending_resizes[canvas] = event
+            self.request_redraw()
+
+        canvas.get_tk_widget().bind("<Configure>", on_configure)
+
+    def request_redraw(self):
+        """请求在下一帧重绘当前视图，同一帧内的多次请求合并为一次"""
+        Redraw_Scheduler.shared().request(self, self._flush_redraw)
+
+    def _flush_redraw(self):
+        """应用本帧内最后一次尺寸变化并重绘当前视图"""
+        resizes, self._pending_resizes = self._pending_resizes, {}
+        for canvas, event in resizes.items():
+            if event.width <= 1 or event.height <= 1:
+                continue
+            canvas.resize(event)  # 调整图形尺寸并在空闲时重绘
+            if canvas is not self.canvas:
+                self._relayout(canvas.figure)
+
+        if self._active_view is self.image_view:
+            self.show_current_image()  # 按新尺寸取缓存位图
+        elif not resizes:
+            for canvas in [self.canvas, *self._page_canvases.values()]:
+                if canvas.get_tk_widget() is self._active_view:
+                    canvas.draw_idle()
 
     def _create_pagination_controls(self):
         """分页控件居中布局 + 页码美化"""
@@ -172,6 +432,14 @@ class PlotWidget(ttk.Frame):
         )
         self.next_btn.pack(side="left", padx=2)
 
+        self.save_btn = ttk.Button(
+            btn_frame,
+            text="保存图像",
+            command=self.save_current_page,
+            style="Pagination.TButton",
+        )
+        self.save_btn.pack(side="left", padx=2)
+
         # 右侧弹性空间
         right_space = ttk.Frame(inner_frame, width=10)
         right_space.grid(row=0, column=2, sticky="ew")
@@ -207,11 +475,59 @@ class PlotWidget(ttk.Frame):
         )
 
     def set_images_paths(self, images_paths):
-        self.images_paths = images_paths
+        """
+        设置分页内容
+
+        参数:
+        images_paths : list
+            每一页为图片路径或matplotlib Figure对象
+        """
+        self._release_page_canvases()
+        self._source_image = (None, None)
+        self.images_paths = list(images_paths)
+        self.current_page = 0
         if self.images_paths:
-            self.current_page = 0
             self.show_current_image()
 
+    def set_figures(self, figures):
+        """直接显示内存中的Figure对象列表"""
+        self.set_images_paths(figures)
+
+    def save_current_page(self, save_path=None, dpi=None):
+        """
+        导出当前页
+
+        Figure页按指定dpi重新渲染保存，图片页直接复制原图。
+        未指定保存路径时弹出保存对话框。
+        """
+        if not self.images_paths:
+            messagebox.showwarning("警告", "当前没有可保存的图像！")
+            return None
+
+        page = self.images_paths[self.current_page]
+        if save_path is None:
+            save_path = filedialog.asksaveasfilename(
+                defaultextension=".png",
+                filetypes=[("PNG 图片", "*.png"), ("PDF 文件", "*.pdf")],
+            )
+            if not save_path:
+                return None
+
+        try:
+            if isinstance(page, Figure):
+                save_figure(
+                    page,
+                    save_path,
+                    dpi=dpi or DATA_CONFIG["export_dpi"],
+                    bbox_inches="tight",
+                )
+            else:
+                pilImage.open(page).convert("RGB").save(save_path)
+        except Exception as e:
+            messagebox.showerror("错误", f"图像保存失败：{str(e)}")
+            return None
+        return save_path
+
     def _update_page_controls(self):
         total = len(self.images_paths)
         self.page_label.config(text=f"第{self.current_page+1}页/共{total}页")
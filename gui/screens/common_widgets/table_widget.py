@@ -13,13 +13,27 @@ sys.path.insert(0, project_root)
 
 import queue
 import threading
+from collections import deque
+import numpy as np
 from tkinter import ttk
 
+from gui.screens.utils.config import DATA_CONFIG
+from gui.screens.utils.redraw_scheduler import Redraw_Scheduler
+
 
 class TableWidget(ttk.Frame):
-    """通用表格数据显示组件，支持动态列配置、多线程安全操作和数据格式化"""
+    """
+    通用表格数据显示组件，支持动态列配置、多线程安全操作和数据格式化
+
+    大数据量时可调用 set_dataframe() 进入虚拟化模式：数据按列保存在NumPy数组中，
+    Treeview只保留可见窗口内的若干行，滚动时按需格式化并复用这些行。
+    """
 
-    def __init__(self, master, cols, widths=None, **kwargs):
+    def __init__(self, master, cols, widths=None, max_rows=None, **kwargs):
+        """
+        :param max_rows: append_thread_safe 保留的最大行数，超出后滚出最早的行；
+                         append()/set_dataframe() 载入的行不计入上限，也不会被滚出
+        """
         super().__init__(master, **kwargs)
         self.cols = cols
         self.widths = widths or [100] * len(cols)  # 默认宽度为100
@@ -29,6 +43,32 @@ class TableWidget(ttk.Frame):
         self.lock = threading.Lock()  # 用于线程安全的锁
         self.style = ttk.Style()  # 创建样式对象
 
+        # 虚拟化模式的列存储
+        self.virtual = False
+        self._columns = []  # 每列一个NumPy数组
+        self._formats = {}  # {列序号: printf风格格式}
+        self._order = None  # 排序后的行序号，None表示原始顺序
+        self._appended = []  # 虚拟化模式下追加、尚未并入列存储的行
+        self._top = 0  # 可见窗口首行
+
+        self.table.bind("<Configure>", self._on_table_configure)
+        self.table.bind("<MouseWheel>", self._on_mousewheel)
+        self.table.bind("<Button-4>", lambda event: self._scroll_rows(-3))
+        self.table.bind("<Button-5>", lambda event: self._scroll_rows(3))
+
+        # 线程安全追加：单个定时器在Tk线程中批量取出缓冲区
+        self.max_rows = max_rows or DATA_CONFIG["table_max_rows"]
+        self.drain_ms = DATA_CONFIG["table_drain_ms"]
+        self.rows_drained = 0  # 已处理行数
+        self.batches = 0  # 批次数
+        self.max_batch = 0  # 最大批次行数
+        self.max_queue_depth = 0  # 观测到的最大队列长度
+        self.rows_rolled_off = 0  # 因超出行数上限滚出的行数
+        self._streamed = deque()  # 普通模式下 append_thread_safe 插入的行ID
+        self._loaded = 0  # 虚拟化模式下 set_dataframe 载入、不计入上限的行数
+        self._drain_after_id = self.after(self.drain_ms, self._process_buffer)
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
     def _create_table(self):
         """创建表格核心逻辑"""
         table = ttk.Treeview(self, show="headings", columns=self.cols)
@@ -76,6 +116,13 @@ class TableWidget(ttk.Frame):
         :param auto_scroll: 是否自动滚动到底部
         """
         with self.lock:  # 确保线程安全
+            if self.virtual:
+                self._appended.append(list(values))
+                if auto_scroll:
+                    self._top = self.row_count
+                self._request_render()
+                return None
+
             item_id = self.table.insert("", "end", values=values)
             if auto_scroll:
                 self.table.yview_moveto(1)
@@ -87,19 +134,296 @@ class TableWidget(ttk.Frame):
         :param values: 要添加的行数据
         :param auto_scroll: 是否自动滚动到底部
         """
-        self.buffer.put((values, auto_scroll))
-        self.after(100, self._process_buffer)  # 每100毫秒处理一次缓冲区
+        self.buffer.put((values, auto_scroll))  # 由 _process_buffer 定时批量取出
+        self.max_queue_depth = max(self.max_queue_depth, self.buffer.qsize())
 
     def _process_buffer(self):
-        """处理缓冲区中的数据"""
-        while not self.buffer.empty():
-            values, auto_scroll = self.buffer.get()
-            self.append(values, auto_scroll)
+        """取出缓冲区中的全部数据，一次插入、一次滚动，然后重新定时"""
+        rows, auto_scroll = [], False
+        while True:
+            try:
+                values, scroll = self.buffer.get_nowait()
+            except queue.Empty:
+                break
+            rows.append(values)
+            auto_scroll = auto_scroll or scroll
+
+        if rows:
+            self.max_batch = max(self.max_batch, len(rows))
+            self.batches += 1
+            self.rows_drained += len(rows)
+            self._append_batch(rows, auto_scroll)
+        self._drain_after_id = self.after(self.drain_ms, self._process_buffer)
+
+    def _append_batch(self, rows, auto_scroll):
+        """批量添加数据行，超出行数上限时删除最早的行"""
+        with self.lock:
+            if self.virtual:
+                self._appended.extend(list(values) for values in rows[-self.max_rows :])
+                self.rows_rolled_off += max(len(rows) - self.max_rows, 0)
+                self._roll_off_virtual()
+                if auto_scroll:
+                    self._top = self.row_count
+                self._request_render()
+                return
+
+            for values in rows[-self.max_rows :]:
+                self._streamed.append(self.table.insert("", "end", values=values))
+            self.rows_rolled_off += max(len(rows) - self.max_rows, 0)
+            excess = len(self._streamed) - self.max_rows
+            if excess > 0:
+                expired = [self._streamed.popleft() for _ in range(excess)]
+                self.table.delete(
+                    *[item for item in expired if self.table.exists(item)]
+                )
+                self.rows_rolled_off += excess
+            if auto_scroll:
+                self.table.yview_moveto(1)
+
+    def queue_stats(self):
+        """返回线程安全追加的队列统计"""
+        return {
+            "队列长度": self.buffer.qsize(),
+            "最大队列长度": self.max_queue_depth,
+            "已处理行数": self.rows_drained,
+            "批次数": self.batches,
+            "最大批次行数": self.max_batch,
+            "滚出行数": self.rows_rolled_off,
+        }
+
+    def _on_destroy(self, event):
+        """控件销毁时取消定时器"""
+        if event.widget is self and self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
 
     def clear(self):
-        """清空表格所有数据"""
+        """清空表格所有数据（同时退出虚拟化模式）"""
+        self._set_virtual(False)
+        self._columns, self._appended, self._order = [], [], None
+        self._streamed.clear()
+        self._loaded = 0
         self.table.delete(*self.table.get_children())
 
+    # ---------------------------- 虚拟化模式 ----------------------------
+    def set_dataframe(self, data, formats=None, index_start=None, auto_scroll=False):
+        """
+        批量载入数据并进入虚拟化模式，只生成可见窗口内的行
+        :param data: pandas.DataFrame、二维数组或行列表，按位置对应表格各列
+        :param formats: printf风格格式，字符串作用于所有浮点列，
+                        字典 {列序号: 格式} 作用于指定列（列序号含序号列）
+        :param index_start: 不为None时在首列添加从该值开始的序号
+        :param auto_scroll: 是否滚动到末尾
+        """
+        columns = self._to_columns(data)
+        if index_start is not None:
+            n_rows = len(columns[0]) if columns else 0
+            columns.insert(0, np.arange(index_start, index_start + n_rows))
+
+        if isinstance(formats, str):
+            formats = {
+                j: formats
+                for j, column in enumerate(columns)
+                if column.dtype.kind == "f"
+            }
+
+        with self.lock:
+            self.table.delete(*self.table.get_children())
+            self._columns = columns
+            self._formats = dict(formats or {})
+            self._appended, self._order = [], None
+            self._streamed.clear()
+            self._loaded = self.row_count
+            self._top = self.row_count if auto_scroll else 0
+            self._set_virtual(True)
+            self._render_window()
+
+    def set_rows(self, rows):
+        """批量载入已格式化的行数据（虚拟化模式）"""
+        self.set_dataframe(rows)
+
+    def get_rows(self):
+        """获取全部行数据（已格式化，按当前显示顺序）"""
+        if not self.virtual:
+            return [
+                self.table.item(item, "values") for item in self.table.get_children("")
+            ]
+        self._merge_appended()
+        rows = self._display_rows(0, self.row_count)
+        return [tuple(row) for row in zip(*self._format_rows(rows))]
+
+    @property
+    def row_count(self):
+        """虚拟化模式下的总行数"""
+        stored = len(self._columns[0]) if self._columns else 0
+        return stored + len(self._appended)
+
+    @staticmethod
+    def _to_columns(data):
+        """将表格数据拆分为按列存储的NumPy数组"""
+        if hasattr(data, "iloc"):
+            return [data.iloc[:, j].to_numpy() for j in range(data.shape[1])]
+        try:
+            array = np.asarray(data)
+        except ValueError:
+            array = None
+        if array is None or array.ndim != 2:
+            # 行长度不一致时按最长行补齐
+            rows = [list(row) for row in data]
+            width = max((len(row) for row in rows), default=0)
+            array = np.empty((len(rows), width), dtype=object)
+            for i, row in enumerate(rows):
+                array[i] = row + [""] * (width - len(row))
+        return [array[:, j] for j in range(array.shape[1])]
+
+    def _set_virtual(self, enabled):
+        """切换滚动条的驱动方式"""
+        if enabled == self.virtual:
+            return
+        self.virtual = enabled
+        if enabled:
+            self.table.configure(yscrollcommand="")
+            self.scrollbar.configure(command=self._on_scrollbar)
+        else:
+            self.table.configure(yscrollcommand=self.scrollbar.set)
+            self.scrollbar.configure(command=self.table.yview)
+
+    def _merge_appended(self):
+        """将追加的行并入列存储"""
+        if not self._appended:
+            return
+        new_columns = self._to_columns(self._appended)
+        if not self._columns:
+            self._columns = new_columns
+        else:
+            width = max(len(self._columns), len(new_columns))
+            n_old, n_new = len(self._columns[0]), len(new_columns[0])
+            merged = []
+            for j in range(width):
+                old = self._columns[j] if j < len(self._columns) else np.full(n_old, "")
+                new = new_columns[j] if j < len(new_columns) else np.full(n_new, "")
+                merged.append(np.concatenate([old, new]))
+            self._columns = merged
+        if self._order is not None:
+            n_total = len(self._columns[0])
+            self._order = np.concatenate(
+                [self._order, np.arange(n_total - len(self._appended), n_total)]
+            )
+        self._appended = []
+
+    def _roll_off_virtual(self):
+        """
+        虚拟化模式下滚出最早追加的行，使追加的行数不超过 max_rows；
+        set_dataframe 载入的前 _loaded 行保持不变
+        """
+        excess = self.row_count - self._loaded - self.max_rows
+        if excess <= 0:
+            return
+        self.rows_rolled_off += excess
+        stored = len(self._columns[0]) if self._columns else 0
+        # 已并入列存储的追加行位于 [_loaded, stored)，先滚出这部分，再滚出未并入的
+        start = self._loaded
+        n_stored = min(excess, stored - start)
+        if n_stored > 0:
+            stop = start + n_stored
+            self._columns = [
+                np.concatenate([column[:start], column[stop:]])
+                for column in self._columns
+            ]
+            if self._order is not None:
+                order = self._order[(self._order < start) | (self._order >= stop)]
+                self._order = np.where(order >= stop, order - n_stored, order)
+        del self._appended[: excess - max(n_stored, 0)]
+        if self._top > self._loaded:
+            self._top = max(self._top - excess, self._loaded)
+
+    def _display_rows(self, start, stop):
+        """当前显示顺序下 [start, stop) 对应的原始行序号"""
+        if self._order is None:
+            return np.arange(start, stop)
+        return self._order[start:stop]
+
+    def _format_rows(self, rows):
+        """对指定行按列进行向量化格式化，返回各列的字符串数组"""
+        cells = []
+        for j, column in enumerate(self._columns):
+            values = column[rows]
+            fmt = self._formats.get(j)
+            if fmt and values.dtype.kind == "O":
+                try:  # 追加行可能使数值列变为object类型
+                    values = values.astype(float)
+                except (TypeError, ValueError):
+                    pass
+            if fmt and values.dtype.kind in "fiu":
+                cells.append(np.char.mod(fmt, values))
+            else:
+                cells.append(values.astype(str))
+        return cells
+
+    def _visible_row_count(self):
+        """可见窗口能容纳的行数"""
+        row_height = int(self.style.lookup("Treeview", "rowheight") or 20)
+        height = self.table.winfo_height()
+        if height <= 1:
+            return int(self.table.cget("height"))
+        return max(1, height // row_height - 1)  # 扣除表头
+
+    def _render_window(self):
+        """重新生成可见窗口内的行（复用已有的Treeview行）"""
+        if not self.virtual:
+            return
+        self._merge_appended()
+        n_rows = self.row_count
+        visible = self._visible_row_count()
+        self._top = max(0, min(self._top, n_rows - visible))
+
+        rows = self._display_rows(self._top, min(self._top + visible, n_rows))
+        values = list(zip(*self._format_rows(rows))) if len(rows) else []
+
+        items = self.table.get_children("")
+        for k, row_values in enumerate(values):
+            if k < len(items):
+                self.table.item(items[k], values=row_values)
+            else:
+                self.table.insert("", "end", values=row_values)
+        if len(items) > len(values):
+            self.table.delete(*items[len(values) :])
+
+        if n_rows:
+            self.scrollbar.set(self._top / n_rows, (self._top + len(values)) / n_rows)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _request_render(self):
+        """请求在下一帧重新生成可见窗口，多次请求合并为一次"""
+        Redraw_Scheduler.shared().request(self, self._render_window)
+
+    def _scroll_rows(self, delta):
+        """按行滚动可见窗口"""
+        if self.virtual:
+            self._top += delta
+            self._render_window()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        """虚拟化模式下的滚动条回调"""
+        if action == "moveto":
+            self._top = int(float(amount) * self.row_count)
+        elif action == "scroll":
+            step = self._visible_row_count() if unit == "pages" else 1
+            self._top += int(amount) * step
+        self._render_window()
+
+    def _on_mousewheel(self, event):
+        """鼠标滚轮滚动（Windows/macOS）"""
+        if self.virtual:
+            self._scroll_rows(-3 if event.delta > 0 else 3)
+            return "break"
+
+    def _on_table_configure(self, event):
+        """表格尺寸变化时调整可见行数"""
+        if self.virtual:
+            self._request_render()
+
     def set_cell_value(self, item_id, column, value):
         """
         设置单元格的值
@@ -124,6 +448,11 @@ class TableWidget(ttk.Frame):
         :param column: 列名
         :param reverse: 是否降序排序
         """
+        if self.virtual:
+            self._sort_virtual(self.cols.index(column), reverse)
+            self._update_sort_headings(column, reverse)
+            return
+
         # 获取所有行的数据
         data = [
             (self.table.set(item, column), item) for item in self.table.get_children("")
@@ -133,6 +462,24 @@ class TableWidget(ttk.Frame):
         # 重新排列行
         for index, (_, item) in enumerate(data):
             self.table.move(item, "", index)
+        self._update_sort_headings(column, reverse)
+
+    def _sort_virtual(self, j, reverse):
+        """虚拟化模式下按列存储排序（数值列按数值排序）"""
+        self._merge_appended()
+        if j >= len(self._columns):
+            return
+        column = self._columns[j]
+        try:
+            order = np.argsort(column, kind="stable")
+        except TypeError:  # 混合类型按文本排序
+            order = np.argsort(column.astype(str), kind="stable")
+        self._order = order[::-1] if reverse else order
+        self._top = 0
+        self._render_window()
+
+    def _update_sort_headings(self, column, reverse):
+        """更新排序箭头"""
         # 设置排序箭头
         self.table.heading(
             column, command=lambda: self.sort_column(column, not reverse)
@@ -9,13 +9,14 @@ current_script_path = os.path.abspath(__file__)
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
 sys.path.insert(0, project_root)
 
-import traceback
+from functools import partial
 from tkinter import messagebox, filedialog, ttk
 import pandas as pd
 from gui.screens.common_screens.base_screen import Base_Screen
 from gui.screens.common_widgets.string_entries_widget import StringEntriesWidget
 from gui.screens.processors.distillation_experiment_processor import (
-    Distillation_Experiment_Processor,
+    render_distillation_plots,
+    run_distillation_cases,
 )
 
 
@@ -96,12 +97,8 @@ class Distillation_Screen(Base_Screen):
     def start_data_acquisition(self):
         """实现采集启动功能"""
         try:
-            if not self.serial_connection or not self.serial_connection.is_open:
-                messagebox.showwarning("警告", "请先打开串口连接！")
-                return
-            
-            # 这里可以添加精馏实验特有的采集逻辑
-            messagebox.showinfo("提示", "开始采集精馏实验数据")
+            if self._start_acquisition():
+                messagebox.showinfo("提示", "开始采集精馏实验数据")
 
         except Exception as e:
             self.logger.error(f"采集启动失败: {str(e)}")
@@ -109,9 +106,8 @@ class Distillation_Screen(Base_Screen):
 
     def stop_data_acquisition(self):
         """实现停止采集功能"""
-
-        # 这里可以添加精馏实验特有的停止逻辑
-        messagebox.showinfo("提示", "已停止数据采集")
+        if self._stop_acquisition():
+            messagebox.showinfo("提示", "已停止数据采集")
 
     # ---------------------------- 核心方法重写 ----------------------------
     def load_data(self):
@@ -144,17 +140,30 @@ class Distillation_Screen(Base_Screen):
             messagebox.showwarning("警告", "请先导入CSV数据！")
             return
 
-        try:
-            self.show_processing("数据处理中...")
-            self._create_processors()
-            self._process_all_cases()
-            self._update_result_table()
+        params = self._read_parameters()
+        if params is None:
+            return
 
-        except Exception as e:
-            self.logger.error(f"数据处理失败: {traceback.format_exc()}")
-            messagebox.showerror("错误", f"处理失败：{str(e)}")
-        finally:
-            self.close_processing()
+        cases = [(params["R"], f"实验结果/R{params['R']}"), (10000, "实验结果/R_inf")]
+        self.run_in_background(
+            [
+                (
+                    partial(
+                        run_distillation_cases,
+                        self.csv_file_path,
+                        cases,
+                        params["αm"],
+                        params["F"],
+                        params["tS"],
+                        params["tF"],
+                    ),
+                    "process",
+                )
+            ],
+            on_success=self._on_cases_processed,
+            msg="数据处理中...",
+            error_msg="处理失败",
+        )
 
     def plot_graph(self):
         """绘制图形（实现基类抽象方法）"""
@@ -162,65 +171,53 @@ class Distillation_Screen(Base_Screen):
             messagebox.showwarning("警告", "请先处理数据！")
             return
 
-        try:
-            self.show_processing("生成图表中...")
-            self._generate_plots()
-            self.plot_frame.set_images_paths(self._get_plot_paths())
-            self.plot_frame._update_page_controls()  # 启用分页控件
+        # 图形已在处理时绘制，直接显示
+        if all("mccabe_thiele" in processor.result for processor in self.processors):
+            self._on_plots_generated(render_distillation_plots(self.processors))
+            return
 
-        except Exception as e:
-            self.logger.error(f"绘图失败: {traceback.format_exc()}")
-            messagebox.showerror("错误", f"绘图失败：{str(e)}")
-        finally:
-            self.close_processing()
+        self.run_in_background(
+            [(partial(render_distillation_plots, self.processors), "process")],
+            on_success=self._on_plots_generated,
+            msg="生成图表中...",
+            error_msg="绘图失败",
+        )
 
     # ---------------------------- 精馏实验特有逻辑 ----------------------------
-    def _create_processors(self):
-        """根据界面参数动态创建处理器"""
+    def _read_parameters(self):
+        """读取界面参数，参数错误时提示并返回None"""
         param_values = self.parameters
         try:
-            R = float(param_values[0])
-            αm = float(param_values[1])
-            F = float(param_values[2])
-            tS = float(param_values[3])
-            tF = float(param_values[4])
+            return {
+                "R": float(param_values[0]),
+                "αm": float(param_values[1]),
+                "F": float(param_values[2]),
+                "tS": float(param_values[3]),
+                "tF": float(param_values[4]),
+            }
         except (IndexError, ValueError) as e:
             messagebox.showerror("错误", f"参数错误: {str(e)}")
-            return
+            return None
 
-        self.processors = [
-            Distillation_Experiment_Processor(
-                file_path=self.csv_file_path,
-                R=R,
-                αm=αm,
-                F=F,
-                tS=tS,
-                tF=tF,
-                output_dir=f"实验结果/R{R}",
-            ),
-            Distillation_Experiment_Processor(
-                file_path=self.csv_file_path,
-                R=10000,
-                αm=αm,
-                F=F,
-                tS=tS,
-                tF=tF,
-                output_dir="实验结果/R_inf",
-            ),
+    def _on_cases_processed(self, processors):
+        """所有回流比处理完成回调（Tk线程）"""
+        self.processors = processors
+        self.processed_data_list = [
+            processor.calculator.results for processor in processors
         ]
+        self._update_result_table()
 
-    def _process_all_cases(self):
-        """处理所有回流比情况"""
-        self.processed_data_list = []
-        for processor in self.processors:
-            processor.process_experiment(show_plot=False)
-            self.processed_data_list.append(processor.calculator.results)
+    def _on_plots_generated(self, figures):
+        """图形生成完成回调（Tk线程）"""
+        self.images_paths = [
+            str(processor.result_paths["visualization"])
+            for processor in self.processors
+        ]
+        self.plot_frame.set_figures(figures)
 
     def _update_raw_table(self, df):
         """更新原始数据表格"""
-        self.raw_table.clear()
-        for idx, row in df.iterrows():
-            self.raw_table.append([idx + 1] + row.tolist())
+        self.raw_table.set_dataframe(df, index_start=1)
 
     def _update_result_table(self):
         """更新结果表格"""
@@ -237,15 +234,3 @@ class Distillation_Screen(Base_Screen):
                     f"{data.get('分离效率', 'N/A')}",
                 ]
             )
-
-    def _generate_plots(self):
-        """生成所有图形文件"""
-        self.images_paths = []
-        for processor in self.processors:
-            plot_path = processor.result_paths["visualization"]
-            processor.plotter.plot_mccabe_thiele(save_path=plot_path, show=False)
-            self.images_paths.append(plot_path)
-
-    def _get_plot_paths(self):
-        """获取生成的图形路径"""
-        return [p for p in self.images_paths if os.path.exists(p)]
@@ -34,6 +34,7 @@ class Drying_Screen(Base_Screen):
         self.processor = None
         self.results = None
         self.images_paths = []
+        self.figures = []  # 内存中的图形，直接交给绘图控件显示
 
         # 初始化组件
         self._adjust_base_components()
@@ -86,6 +87,11 @@ class Drying_Screen(Base_Screen):
 
         process_btn["state"] = "normal" if self.csv_file_paths else "disabled"
 
+    def restore_state(self, snapshot):
+        """恢复快照后同步按钮状态"""
+        super().restore_state(snapshot)
+        self._update_button_states()
+
     def _find_named_frame(self, frame_name):
         """查找指定名称的框架"""
         for child in self.left_frame.winfo_children():
@@ -116,22 +122,14 @@ class Drying_Screen(Base_Screen):
     # 数据采集方法（保持基类实现）
     def start_data_acquisition(self):
         """实时数据采集（需连接串口）"""
-        if not self.serial_connection or not self.serial_connection.is_open:
-            messagebox.showwarning("警告", "请先打开串口！")
-            return
-
         try:
-            self.show_processing("实时采集中...")
-            # TODO: 实现具体采集逻辑
-            self.close_processing()
-            messagebox.showinfo("成功", "数据采集完成")
+            self._start_acquisition()
         except Exception as e:
             self._handle_error("采集错误", e)
 
     def stop_data_acquisition(self):
         """停止采集"""
-        if hasattr(self, "processing_win"):
-            self.close_processing()
+        if self._stop_acquisition():
             messagebox.showinfo("提示", "已停止采集")
 
     # 文件数据处理方法
@@ -176,12 +174,7 @@ class Drying_Screen(Base_Screen):
 
     def _update_raw_table(self, data):
         """更新原始数据表格"""
-        self.raw_table.clear()
-        for row in data:
-            formatted_row = [
-                f"{x:.2f}" if isinstance(x, float) else str(x) for x in row
-            ]
-            self.raw_table.append(formatted_row)
+        self.raw_table.set_dataframe(data, formats="%.2f")
 
     def process_data(self):
         """处理数据"""
@@ -200,6 +193,7 @@ class Drying_Screen(Base_Screen):
                 outputs["combined_plot"].replace("combined_plots", "drying_curve"),
                 outputs["combined_plot"].replace("combined_plots", "drying_rate_curve"),
             ]
+            self.figures = outputs["figures"]
 
             self._update_result_table()
             self.close_processing()
@@ -227,7 +221,7 @@ class Drying_Screen(Base_Screen):
 
         try:
             self.show_processing("生成图表中...")
-            self.plot_frame.set_images_paths(self.images_paths)
+            self.plot_frame.set_figures(self.figures)
             self.close_processing()
             messagebox.showinfo("成功", "图表生成完成！")
         except Exception as e:
@@ -5,6 +5,7 @@ import sys
 import os
 import logging
 import traceback
+from functools import partial
 from tkinter import filedialog, messagebox, Canvas, Toplevel
 from tkinter import ttk
 from PIL import Image, ImageTk
@@ -19,7 +20,7 @@ sys.path.insert(0, project_root)
 from gui.screens.common_screens.base_screen import Base_Screen
 from gui.screens.common_widgets.table_widget import TableWidget
 from gui.screens.processors.extraction_expriment_processor import (
-    ExtractionExperimentProcessor,
+    run_extraction_experiment,
 )
 
 
@@ -53,6 +54,12 @@ class Extraction_Screen(Base_Screen):
         self.raw_table.pack(fill="both", expand=True, padx=5, pady=5)
         self.result_table.pack(fill="both", expand=True, padx=5, pady=5)
 
+        # 设计等值线表按钮
+        data_frame = self.left_frame.nametowidget("data_btn_frame")
+        btn = ttk.Button(data_frame, text="设计等值线", command=self.show_design_table)
+        btn.grid(row=0, column=3, padx=2, pady=2, sticky="ew")
+        data_frame.columnconfigure(3, weight=1)
+
     def _update_button_states(self):
         """更新按钮状态（继承基类功能）"""
         data_loaded = all(self.file_dict.values())
@@ -80,9 +87,7 @@ class Extraction_Screen(Base_Screen):
 
             # 更新原始数据表格
             origin_df = pd.read_csv(self.file_dict["origin"])
-            self.raw_table.clear()
-            for idx, row in origin_df.iterrows():
-                self.raw_table.append([idx + 1, *row.values.tolist()])
+            self.raw_table.set_dataframe(origin_df, index_start=1)
 
             self._update_button_states()
 
@@ -123,20 +128,26 @@ class Extraction_Screen(Base_Screen):
             messagebox.showwarning("警告", "请先完整加载原始数据和分配曲线文件")
             return
 
-        try:
-            self.show_processing("数据处理中...")
-            self.processor = ExtractionExperimentProcessor(
-                origin_file=self.file_dict["origin"],
-                distribution_file=self.file_dict["distribution"],
-            )
-            self.processor.run()
-            self._update_result_table()
+        self.run_in_background(
+            [
+                (
+                    partial(
+                        run_extraction_experiment,
+                        self.file_dict["origin"],
+                        self.file_dict["distribution"],
+                    ),
+                    "process",
+                )
+            ],
+            on_success=self._on_data_processed,
+            msg="数据处理中...",
+            error_msg="处理失败",
+        )
 
-        except Exception as e:
-            messagebox.showerror("错误", f"处理失败: {str(e)}")
-            self.logger.error(f"处理异常: {traceback.format_exc()}")
-        finally:
-            self.close_processing()
+    def _on_data_processed(self, processor):
+        """数据处理完成回调（Tk线程）"""
+        self.processor = processor
+        self._update_result_table()
 
     def _update_result_table(self):
         """更新结果表格数据"""
@@ -149,38 +160,43 @@ class Extraction_Screen(Base_Screen):
             ["分配系数", *[f"{x:.4f}" for x in calc.coefficients]],
             ["操作线斜率", f"{calc.k1:.2f}", f"{calc.k2:.2f}", "", ""],
             ["积分结果", *[f"{x:.3e}" for x in calc.ans3], "", ""],
+            ["传质单元高度/m", *[f"{x:.3f}" for x in calc.ans4], "", ""],
         ]
         for row in results:
             self.result_table.append(row)
 
+    def show_design_table(self):
+        """在新窗口中显示塔高设计等值线表（溶剂比 × 萃余相浓度）"""
+        if not self.processor or self.processor.design_table is None:
+            messagebox.showwarning("警告", "请先完成数据处理")
+            return
+
+        table = self.processor.design_table
+        window = Toplevel(self.window)
+        window.title("萃取塔设计等值线表（塔高/m，nan为不可行设计）")
+        design_table = TableWidget(
+            window, list(table.columns), [120] * len(table.columns), height=10
+        )
+        design_table.pack(fill="both", expand=True, padx=5, pady=5)
+        design_table.set_dataframe(table, formats="%.3f")
+
     def plot_graph(self):
         """显示生成的图表"""
-        if not self.processor or not self.processor.output_dir:
+        if not self.processor or not self.processor.plotter:
             messagebox.showwarning("警告", "请先完成数据处理")
             return
 
         try:
-            self.show_processing("加载图表中...")
-            output_dir = self.processor.output_dir
-            self.images_paths = [
-                os.path.join(output_dir, f)
-                for f in sorted(os.listdir(output_dir))  # 添加排序保证显示顺序
-                if f.lower().endswith(".png")
-            ]
-
-            # 添加路径验证
-            if not self.images_paths:
-                raise FileNotFoundError("输出目录中未找到PNG文件")
-
-            # 直接调用基类方法
-            self.plot_frame.set_images_paths(self.images_paths)
-            self.plot_frame.show_current_image()  # 主动触发显示
+            figures = list(self.processor.plotter.figures.values())
+            if not figures:
+                raise ValueError("处理结果中没有可显示的图表")
+
+            # 直接显示内存中的图形，无需读回PNG
+            self.plot_frame.set_figures(figures)
 
         except Exception as e:
             messagebox.showerror("错误", f"图表加载失败: {str(e)}")
             self.logger.error(f"图表异常: {traceback.format_exc()}")
-        finally:
-            self.close_processing()
 
     def _safe_close(self):
         """安全关闭资源"""
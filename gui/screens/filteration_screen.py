@@ -5,6 +5,7 @@ import sys
 import os
 import logging
 import traceback
+from functools import partial
 import pandas as pd
 from tkinter import messagebox, filedialog
 from PIL import Image
@@ -17,7 +18,8 @@ sys.path.insert(0, project_root)
 # 导入基类和组件
 from gui.screens.common_screens.base_screen import Base_Screen
 from gui.screens.processors.filteration_experiment_processor import (
-    Filteration_Experiment_Processor,
+    render_filteration_figures,
+    run_filteration_processing,
 )
 
 
@@ -61,64 +63,65 @@ class Filteration_Screen(Base_Screen):
         try:
             # 读取并预处理数据
             data = pd.read_csv(file_path, header=0)
-            data = data.apply(pd.to_numeric, errors="coerce").dropna()
+            # 只剔除全空的行，部分列缺测的行仍在预览中显示
+            data = data.apply(pd.to_numeric, errors="coerce").dropna(how="all")
 
             # 更新实例状态
             self.csv_file_path = file_path
 
             # 更新原始数据表格
-            self.raw_table.clear()
-            for idx, row in data.iterrows():
-                self.raw_table.append([idx + 1, *row.values])
+            table_data = data.copy()
+            table_data.insert(0, "序号", data.index + 1)  # 保留剔除空行前的行号
+            self.raw_table.set_dataframe(table_data)
 
         except Exception as e:
             messagebox.showerror("错误", f"数据加载失败: {str(e)}")
             self.logger.error(f"数据加载异常: {traceback.format_exc()}")
 
     def process_data(self):
-        """处理数据并更新结果表格"""
+        """后台处理数据，完成后更新结果表格"""
         if not self.csv_file_path:
             messagebox.showwarning("警告", "请先导入数据文件")
             return
 
-        try:
-            self.show_processing("数据处理中...")
-            self.processor = Filteration_Experiment_Processor(self.csv_file_path)
-            self.processor.calculate()
-            self.processor.store()
-            self.processed_data = self.processor.processed_data
-
-            # 更新结果表格
-            self.result_table.clear()
-            for res in self.processed_data:
-                self.result_table.append(
-                    [res["group"], f"{res['slope']:.4f}", f"{res['intercept']:.2f}"]
-                )
+        self.run_in_background(
+            [(partial(run_filteration_processing, self.csv_file_path), "process")],
+            on_success=self._on_data_processed,
+            msg="数据处理中...",
+            error_msg="数据处理失败",
+        )
 
-        except Exception as e:
-            messagebox.showerror("错误", f"数据处理失败: {str(e)}")
-            self.logger.error(f"数据处理异常: {traceback.format_exc()}")
-        finally:
-            self.close_processing()
+    def _on_data_processed(self, processor):
+        """数据处理完成回调（Tk线程）"""
+        self.processor = processor
+        self.processed_data = self.processor.processed_data
+
+        # 更新结果表格
+        self.result_table.clear()
+        for res in self.processed_data:
+            self.result_table.append(
+                [res["group"], f"{res['slope']:.4f}", f"{res['intercept']:.2f}"]
+            )
 
     def plot_graph(self):
-        """生成图表并更新绘图组件"""
+        """后台生成图表，完成后更新绘图组件"""
         if not hasattr(self, "processor") or not self.processor:
             messagebox.showwarning("警告", "请先完成数据处理")
             return
 
-        try:
-            self.show_processing("图表生成中...")
-            self.processor.plot()
-            self.images_paths = self.processor.plotter.images_paths
+        self.run_in_background(
+            [(partial(render_filteration_figures, self.processor), "process")],
+            on_success=self._on_figures_rendered,
+            msg="图表生成中...",
+            error_msg="图表生成失败",
+        )
 
-            # 更新绘图组件
-            self.plot_frame.set_images_paths(self.images_paths)
-        except Exception as e:
-            messagebox.showerror("错误", f"图表生成失败: {str(e)}")
-            self.logger.error(f"绘图异常: {traceback.format_exc()}")
-        finally:
-            self.close_processing()
+    def _on_figures_rendered(self, processor):
+        """图表生成完成回调（Tk线程）"""
+        self.processor = processor
+
+        # 直接显示内存中的图形
+        self.plot_frame.set_figures(list(self.processor.plotter.figures.values()))
 
     # ---------------------------- 事件处理增强 ----------------------------
     def _safe_close(self):
@@ -13,7 +13,6 @@ import logging
 import traceback
 import numpy as np
 import pandas as pd
-import re
 from tkinter import messagebox, filedialog
 
 # 导入基类和组件
@@ -54,11 +53,6 @@ class Fluid_Flow_Screen(Base_Screen):
         self.raw_table.pack(fill="both", expand=True, padx=5, pady=5)
         self.result_table.pack(fill="both", expand=True, padx=5, pady=5)
 
-        # 配置分页控件
-        self.plot_frame.set_images_paths = lambda paths: setattr(
-            self.plot_frame, "images_paths", paths
-        )
-
     def _update_button_states(self):
         """更新按钮状态"""
         data_loaded = bool(self.csv_file_paths)
@@ -88,9 +82,7 @@ class Fluid_Flow_Screen(Base_Screen):
 
             # 加载并显示流体阻力数据
             fluid_df = pd.read_csv(self.csv_file_paths[0], skiprows=2, header=None)
-            self.raw_table.clear()
-            for idx, row in fluid_df.iterrows():
-                self.raw_table.append([idx + 1, *row.values.tolist()[:3]])
+            self.raw_table.set_dataframe(fluid_df.iloc[:, :3], index_start=1)
 
             self._update_button_states()
 
@@ -180,29 +172,10 @@ class Fluid_Flow_Screen(Base_Screen):
 
         try:
             self.show_processing("生成图表中...")
-            self.processor.generate_all_plots()
-
-            # 精确匹配当前实验的图表文件
-            expected_patterns = [
-                r"雷诺数与阻力系数双对数拟合\(无插值\)\.png",
-                r"雷诺数与阻力系数双对数拟合\(有插值\)\.png",
-                r"离心泵特性曲线及二次拟合\.png",
-            ]
-
-            output_dir = self.processor.output_dir
-            self.images_paths = []
-            for f in sorted(os.listdir(output_dir)):
-                if any(re.match(pattern, f) for pattern in expected_patterns):
-                    self.images_paths.append(os.path.join(output_dir, f))
-
-            if not self.images_paths:
-                raise FileNotFoundError("未找到实验图表文件")
+            figures = self.processor.generate_all_plots()
 
-            # 清空历史图像缓存
-            self.plot_frame.images_paths = []
-            self.plot_frame.set_images_paths(self.images_paths)
-            self.plot_frame.current_page = 0
-            self.plot_frame.show_current_image()
+            # 直接显示内存中的图形
+            self.plot_frame.set_figures(figures)
 
         except Exception as e:
             messagebox.showerror("错误", f"图表生成失败: {str(e)}")
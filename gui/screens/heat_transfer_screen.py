@@ -27,11 +27,6 @@ class Heat_Transfer_Screen(Base_Screen):
 
     RAW_COLS = ["序号", "Δp孔板/kPa", "t入/°C", "t出/°C"]
     RESULT_COLS = ["组号", "Re", "Pr", "Nu/Pr^0.4"]
-    IMAGE_PATHS = [
-        "./拟合图结果/无强化套管拟合.png",
-        "./拟合图结果/有强化套管拟合.png",
-        "./拟合图结果/传热性能对比.png",
-    ]
 
     def __init__(self, window):
         super().__init__(window)
@@ -155,10 +150,10 @@ class Heat_Transfer_Screen(Base_Screen):
 
         try:
             self.show_processing("生成图表中...")
-            self.processor.plot()  # 生成图表
+            figures = self.processor.plot()  # 生成图表
+            self.plot_frame.set_figures(figures)  # 直接显示内存中的图形
+            self.processor.export_figures()  # 导出图片
             self.processor.compress_results()  # 压缩结果
-            self.plot_frame.set_images_paths(self.IMAGE_PATHS)  # 更新图像路径
-            self.plot_frame.show_current_image()  # 显示图像
             messagebox.showinfo("成功", "图表生成完成！")
         except Exception as e:
             self._handle_error("绘图失败", e)
@@ -17,7 +17,6 @@ from tkinter import (
 from PIL import Image, ImageTk
 import pandas as pd
 
-
 # 动态获取项目根路径
 current_script_path = os.path.abspath(__file__)
 project_root = Path(current_script_path).parents[2]  # 向上3级到项目根
@@ -33,7 +32,6 @@ from gui.screens.processors.oxygen_desorption_experiment_processor import (
     Oxygen_Desorption_Experiment_Processor,
 )
 
-
 # 配置日志
 logging.basicConfig(
     level=logging.DEBUG,
@@ -187,7 +185,9 @@ class Oxygen_Desorption_Screen(Base_Screen):
             )
 
             # 执行完整计算流程
-            self.experiment_processor.run_all_calculations(compress_results=False)
+            self.experiment_processor.run_all_calculations(
+                compress_results=False, export_figures=False
+            )
 
             # 更新结果和图表
             self._update_results()
@@ -210,6 +210,20 @@ class Oxygen_Desorption_Screen(Base_Screen):
             self.result_table.append(
                 [Path(res["csv_file"]).stem, "-", "-", f"拟合类型: {res['fit_type']}"]
             )
+            for key, name in (("u_loading", "载点气速"), ("u_flooding", "泛点气速")):
+                value = "未出现" if res[key] is None else f"{res[key]:.3f} m/s"
+                self.result_table.append(
+                    [Path(res["csv_file"]).stem, "-", "-", f"{name}: {value}"]
+                )
+            if res["capacity"] is not None:
+                self.result_table.append(
+                    [
+                        Path(res["csv_file"]).stem,
+                        "-",
+                        "-",
+                        f"处理能力: {res['capacity']:.2f} m³/h",
+                    ]
+                )
 
         # 氧解吸结果
         oxygen_data = self.experiment_processor.oxygen_calculator.results
@@ -231,17 +245,14 @@ class Oxygen_Desorption_Screen(Base_Screen):
             return
 
         try:
-            # 动态获取最新图像路径
-            self.images_paths = [
-                str(Path(self.experiment_processor.output_dir) / "填料塔性能对比.png"),
-                str(Path(self.experiment_processor.output_dir) / "氧解吸传质关联.png"),
-            ]
-            self.plot_frame.set_images_paths(self.images_paths)
-            self.plot_frame.show_current_image()
+            # 直接显示内存中的图形
+            self.plot_frame.set_figures(
+                list(self.experiment_processor.figures.values())
+            )
             self.status_var.set("就绪")
         except Exception as e:
             logging.error(f"图表显示失败: {str(e)}")
-            messagebox.showerror("错误", "图表渲染失败，请检查图像文件")
+            messagebox.showerror("错误", "图表渲染失败，请重新处理数据")
 
     def _on_parameter_change(self, event=None):
         """参数变更响应"""
@@ -15,6 +15,7 @@ sys.path.insert(0, project_root)
 
 # from gui.screens.calculators.distillation_calculator import Distillation_Calculator
 from gui.screens.calculators.distillation_calculator import process_and_save
+from gui.screens.utils.figure_export import detach_figure, save_figure
 
 
 class Distillation_Plotter:
@@ -102,6 +103,10 @@ class Distillation_Plotter:
             图片保存路径，如果不提供则不保存
         show : bool, optional
             是否显示图表 (默认为True)
+
+        返回:
+        matplotlib.figure.Figure
+            绘制完成的图形，可直接交给PlotWidget显示
         """
         # 准备数据
         data = self._generate_plot_data()
@@ -198,14 +203,15 @@ class Distillation_Plotter:
 
         # 保存或显示
         if save_path:
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
-            fig.savefig(save_path, dpi=300, bbox_inches="tight")
+            save_figure(fig, save_path, dpi=300, bbox_inches="tight")
             print(f"图表已保存至: {save_path}")
 
         if show:
             plt.show()
         else:
-            plt.close(fig)
+            detach_figure(fig)
+
+        return fig
 
 
 # 使用示例
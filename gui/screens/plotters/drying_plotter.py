@@ -21,6 +21,7 @@ import matplotlib.image as mpimg
 from pathlib import Path
 
 from gui.screens.calculators.drying_calculator import Drying_Calculator
+from gui.screens.utils.figure_export import detach_figure, save_figure
 
 
 class Drying_Plotter:
@@ -33,6 +34,7 @@ class Drying_Plotter:
             raise ValueError("计算器尚未执行计算，请先调用run_full_calculation()")
 
         self.calculator = calculator
+        self.figures = {}  # {图名: Figure}，按生成顺序保存在内存中
         self.setup_plot_style()
 
     def setup_plot_style(self):
@@ -61,11 +63,9 @@ class Drying_Plotter:
         if missing:
             raise AttributeError(f"缺少必要数据: {', '.join(missing)}")
 
-    def plot_drying_curve(self, save_dir="./拟合图结果"):
-        """绘制干燥曲线"""
+    def build_drying_curve(self):
+        """绘制干燥曲线，返回内存中的Figure"""
         self._validate_data()
-        save_path = Path(save_dir)
-        save_path.mkdir(parents=True, exist_ok=True)
 
         fig, ax = plt.subplots(figsize=(8, 6))
         ax.scatter(
@@ -91,16 +91,12 @@ class Drying_Plotter:
         ax.grid(True, alpha=0.3)
         ax.legend(frameon=True)
 
-        curve_path = save_path / "drying_curve.png"
-        fig.savefig(curve_path, dpi=300, bbox_inches="tight")
-        plt.close(fig)
-        return str(curve_path)
+        self.figures["drying_curve"] = detach_figure(fig)
+        return fig
 
-    def plot_drying_rate_curve(self, save_dir="./拟合图结果"):
-        """绘制干燥速率曲线"""
+    def build_drying_rate_curve(self):
+        """绘制干燥速率曲线，返回内存中的Figure"""
         self._validate_data()
-        save_path = Path(save_dir)
-        save_path.mkdir(parents=True, exist_ok=True)
 
         fig, ax = plt.subplots(figsize=(8, 6))
         ax.scatter(
@@ -127,18 +123,13 @@ class Drying_Plotter:
         ax.grid(True, alpha=0.3)
         ax.legend(frameon=True)
 
-        rate_path = save_path / "drying_rate_curve.png"
-        fig.savefig(rate_path, dpi=300, bbox_inches="tight")
-        plt.close(fig)
-        return str(rate_path)
+        self.figures["drying_rate_curve"] = detach_figure(fig)
+        return fig
 
-    def integrate_images(self, save_dir="./拟合图结果"):
+    def build_combined_plot(self):
         """
-        生成组合对比图（横向排列）
+        生成组合对比图（横向排列），返回内存中的Figure
         """
-        save_path = Path(save_dir)
-        save_path.mkdir(parents=True, exist_ok=True)
-
         # 生成子图
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
@@ -158,11 +149,29 @@ class Drying_Plotter:
             ax.grid(True, alpha=0.3)
             ax.tick_params(axis="both", which="major", labelsize=8)
 
-        combined_path = save_path / "combined_plots.png"
-        plt.tight_layout()
-        fig.savefig(combined_path, dpi=300, bbox_inches="tight")
-        plt.close(fig)
-        return str(combined_path)
+        fig.tight_layout()
+        self.figures["combined_plots"] = detach_figure(fig)
+        return fig
+
+    def save_figure(self, name, save_dir="./拟合图结果"):
+        """将已生成的图形导出为PNG，返回图片路径"""
+        save_path = Path(save_dir) / f"{name}.png"
+        return save_figure(self.figures[name], save_path, dpi=300, bbox_inches="tight")
+
+    def plot_drying_curve(self, save_dir="./拟合图结果"):
+        """绘制干燥曲线并导出图片"""
+        self.build_drying_curve()
+        return self.save_figure("drying_curve", save_dir)
+
+    def plot_drying_rate_curve(self, save_dir="./拟合图结果"):
+        """绘制干燥速率曲线并导出图片"""
+        self.build_drying_rate_curve()
+        return self.save_figure("drying_rate_curve", save_dir)
+
+    def integrate_images(self, save_dir="./拟合图结果"):
+        """生成组合对比图并导出图片"""
+        self.build_combined_plot()
+        return self.save_figure("combined_plots", save_dir)
 
     def compress_results(self, source_dir="./拟合图结果", output_name="拟合结果"):
         """
@@ -217,6 +226,10 @@ class Drying_Plotter:
             "combined_plot": combined_path,
             "zip_archive": zip_path,
             "serialized_data": pkl_path,
+            "figures": [
+                self.figures[name]
+                for name in ("combined_plots", "drying_curve", "drying_rate_curve")
+            ],
         }
 
 
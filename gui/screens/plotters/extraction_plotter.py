@@ -24,10 +24,11 @@ logging.basicConfig(
 # 设置matplotlib日志级别为ERROR，避免显示findfont的DEBUG信息
 logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
 
-from scipy.integrate import trapezoid
-from scipy.interpolate import interp1d
-
-from gui.screens.calculators.extraction_calculator import Extraction_Calculator
+from gui.screens.calculators.extraction_calculator import (
+    Extraction_Calculator,
+    ntu_integrand,
+)
+from gui.screens.utils.figure_export import detach_figure, save_figure
 
 
 class Extraction_Plotter:
@@ -35,6 +36,7 @@ class Extraction_Plotter:
         self.calculator = calculator
         self._setup_plot_style()
         self.output_dir = "./拟合图结果"
+        self.figures = {}  # {图名: Figure}，导出前保留在内存中
 
     def _setup_plot_style(self):
         """统一设置专业科研绘图样式"""
@@ -233,13 +235,17 @@ class Extraction_Plotter:
 
     def _plot_single_integration(self, data, idx):
         """绘制单组积分曲线（科研级样式）"""
-        # 插值平滑
-        interp_func = interp1d(data["Y5_Eb"], data["integrand"], "cubic")
+        # 由分配曲线和操作线直接计算平滑曲线
         Y_smooth = np.linspace(data["Y5_Eb"].min(), data["Y5_Eb"].max(), 100)
-        integrand_smooth = interp_func(Y_smooth)
+        integrand_smooth = ntu_integrand(
+            self.calculator.coefficients,
+            self.calculator.k[idx],
+            self.calculator.b[idx],
+            Y_smooth,
+        )
 
-        # 计算积分值
-        integral = trapezoid(integrand_smooth, Y_smooth)
+        # 积分值取计算器的求积结果
+        integral = self.calculator.ans3[idx]
 
         # 专业绘图元素
         plt.fill_between(
@@ -282,15 +288,22 @@ class Extraction_Plotter:
         plt.legend(loc="upper right", fontsize=9)
 
     def _save_figure(self, name):
-        """保存科研级图表"""
+        """完成布局并将图表保留在内存中"""
         plt.tight_layout()
-        plt.savefig(
-            f"{self.output_dir}/{name}.png",
-            dpi=300,
-            bbox_inches="tight",
-            pad_inches=0.1,
-        )
-        plt.close()
+        self.figures[name] = detach_figure()
+
+    def save_figures(self):
+        """导出科研级图表"""
+        return [
+            save_figure(
+                fig,
+                f"{self.output_dir}/{name}.png",
+                dpi=300,
+                bbox_inches="tight",
+                pad_inches=0.1,
+            )
+            for name, fig in self.figures.items()
+        ]
 
     def package_results(self, zip_file="萃取分析结果.zip"):
         """专业打包方法"""
@@ -319,6 +332,7 @@ if __name__ == "__main__":
     # 生成图表
     plotter.plot_origin_curves()
     plotter.plot_integration_curves()
+    plotter.save_figures()
 
     # 打包结果
     plotter.package_results()
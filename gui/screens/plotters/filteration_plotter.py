@@ -13,9 +13,14 @@ sys.path.insert(0, project_root)
 
 import numpy as np
 import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
 import matplotlib.gridspec as gridspec  # 导入 gridspec 用于布局控制
 from gui.screens.calculators.filteration_calculator import Filteration_Calculator
+from gui.screens.utils.experiment_result import Experiment_Result
+from gui.screens.utils.figure_export import (
+    detach_figure,
+    figure_to_array,
+    save_figure,
+)
 
 # 设置中文字体
 plt.rcParams["font.family"] = "SimHei"
@@ -29,50 +34,21 @@ class Filteration_Plotter:
     负责生成符合指定风格的图表，保持一致的绘图风格设置
     """
 
-    def __init__(self, csv_file_path):
+    def __init__(self, csv_file_path, calculator=None, result=None):
         """
-        初始化绘图类，设置图表的默认样式，并调用计算类进行数据处理
+        初始化绘图类，设置图表的默认样式
         :param csv_file_path: CSV文件路径
+        :param calculator: 共享的计算类实例，默认新建
+        :param result: 共享的实验结果（含 "fit" 阶段），默认新建；拟合在首次绘图时计算
         """
         self.csv_file_path = csv_file_path
-        self.calculator = Filteration_Calculator(self.csv_file_path)
+        self.calculator = calculator or Filteration_Calculator(self.csv_file_path)
+        self.result = result or Experiment_Result().stage(
+            "fit", self.calculator.process_all_groups
+        )
 
-        # 获取计算器生成的数据
-        (
-            self.q_to_refit_lists,
-            self.delta_theta_over_delta_q_to_refit_lists,
-            self.refit_slopes,
-            self.refit_intercepts,
-        ) = self.calculator.process_all_groups()
-
-        # 存储来自计算器的所有数据和变量
-        self.calculator_data = {
-            "data": self.calculator.data,  # 存储加载的CSV数据
-            "q_to_refit_lists": self.calculator.q_to_refit_lists,
-            "delta_theta_over_delta_q_to_refit_lists": self.calculator.delta_theta_over_delta_q_to_refit_lists,
-            "refit_slopes": self.calculator.refit_slopes,
-            "refit_intercepts": self.calculator.refit_intercepts,
-            "selected_data": self.calculator.selected_data,
-            "data_array": self.calculator.data_array,
-            "deltaV": self.calculator.deltaV,
-            "S": self.calculator.S,
-            "deltaQ": self.calculator.deltaQ,
-            "delta_theta_list": self.calculator.delta_theta_list,
-            "delta_q_list": self.calculator.delta_q_list,
-            "delta_theta_over_delta_q_list": self.calculator.delta_theta_over_delta_q_list,
-            "q_list": self.calculator.q_list,
-            "q_to_fit": self.calculator.q_to_fit,
-            "delta_theta_over_delta_q_to_fit": self.calculator.delta_theta_over_delta_q_to_fit,
-            "fit_model": self.calculator.fit_model,
-            "fit_data": self.calculator.fit_data,
-            "fit_slope": self.calculator.fit_slope,
-            "fit_intercept": self.calculator.fit_intercept,
-            "outliers": self.calculator.outliers,
-            "refit_model": self.calculator.refit_model,
-            "filtered_data": self.calculator.filtered_data,
-        }
-
-        # 图像路径存储变量
+        # 内存中的图形 {文件名: Figure}，导出后记录图像路径
+        self.figures = {}
         self.images_paths = []
 
         # 设置图表风格
@@ -81,7 +57,7 @@ class Filteration_Plotter:
         plt.rcParams["figure.dpi"] = 50
         plt.rcParams["savefig.dpi"] = 300
 
-        # 存储图表的显示范围配置
+        # 存储图表的显示范围配置（超出配置的组自动缩放）
         self.plot_ranges_initial = [
             {"x_min": 0, "x_max": 0.200, "y_min": 0, "y_max": 140000},
             {"x_min": 0, "x_max": 0.200, "y_min": 0, "y_max": 25000},
@@ -103,27 +79,45 @@ class Filteration_Plotter:
         plt.gca().spines["right"].set_linewidth(2)
         plt.minorticks_on()
 
-    def save_image(self, filename):
+    def keep_figure(self, filename):
         """
-        保存生成的图像并记录路径
-        :param filename: 图像保存的文件名
+        将当前图形保留在内存中，导出时使用该文件名
+        :param filename: 图像导出的文件名
         """
-        # 定义保存路径
-        directory = "./拟合图结果"
+        self.figures[filename] = detach_figure()
 
-        # 检查路径是否存在，如果不存在则创建
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+    def save_figures(self, directory="./拟合图结果"):
+        """
+        导出所有图形及整合图，并记录图像路径
+        :param directory: 导出目录
+        """
+        self.images_paths = []
+        for filename, fig in self.figures.items():
+            # 保存图像，添加 bbox_inches='tight' 以减少空白
+            image_path = os.path.join(directory, f"{filename}.png")
+            self.images_paths.append(
+                save_figure(fig, image_path, dpi=300, bbox_inches="tight")
+            )
 
-        # 图像保存的完整路径
-        image_path = os.path.join(directory, f"{filename}.png")
+        self.integrate_figures(directory)
+        return self.images_paths
 
-        # 记录图像路径
-        self.images_paths.append(image_path)
+    def plot_range(self, plot_ranges, group_index):
+        """
+        获取指定组的显示范围
+        :param plot_ranges: 显示范围配置列表
+        :param group_index: 组索引
+        :return: 显示范围字典，未配置时返回None
+        """
+        return plot_ranges[group_index] if group_index < len(plot_ranges) else None
 
-        # 保存图像，添加 bbox_inches='tight' 以减少空白
-        plt.savefig(image_path, bbox_inches="tight")
-        plt.close()
+    def set_plot_range(self, plot_range):
+        """
+        设置显示范围，plot_range为None时保持自动缩放
+        """
+        if plot_range is not None:
+            plt.xlim(plot_range["x_min"], plot_range["x_max"])
+            plt.ylim(plot_range["y_min"], plot_range["y_max"])
 
     def add_auxiliary_lines(self, q_list, delta_theta_over_delta_q_list):
         """
@@ -187,8 +181,7 @@ class Filteration_Plotter:
         )
 
         self.add_auxiliary_lines(q_list, delta_theta_over_delta_q_list)
-        plt.xlim(plot_range["x_min"], plot_range["x_max"])
-        plt.ylim(plot_range["y_min"], plot_range["y_max"])
+        self.set_plot_range(plot_range)
 
         plt.xlabel("q 值")
         plt.ylabel("Δθ/Δq")
@@ -200,8 +193,8 @@ class Filteration_Plotter:
         # 设置轴样式
         self.set_axes_style()
 
-        # 调用自定义的 save_image 函数
-        self.save_image(f"{2 * group_index + 1}")
+        # 保留图形，导出时使用该文件名
+        self.keep_figure(f"{2 * group_index + 1}")
         # plt.show()
 
     def create_refit_figure(
@@ -242,8 +235,7 @@ class Filteration_Plotter:
         )
 
         self.add_auxiliary_lines(q_list, delta_theta_over_delta_q_list)
-        plt.xlim(plot_range["x_min"], plot_range["x_max"])
-        plt.ylim(plot_range["y_min"], plot_range["y_max"])
+        self.set_plot_range(plot_range)
 
         plt.xlabel("q 值")
         plt.ylabel("Δθ/Δq")
@@ -257,27 +249,32 @@ class Filteration_Plotter:
         )
 
         self.set_axes_style()
-        self.save_image(f"{2 * group_index + 2}")
+        self.keep_figure(f"{2 * group_index + 2}")
         # plt.show()
 
     def generate_comparison_figures(self):
         """
         生成对比图
         """
+        (
+            q_to_refit_lists,
+            delta_theta_over_delta_q_to_refit_lists,
+            refit_slopes,
+            refit_intercepts,
+        ) = self.result["fit"]
+        group_count = self.calculator.group_count
+
         # 初始拟合对比图
         plt.figure(figsize=(8, 6))
-        for group_index in range(3):
+        for group_index in range(group_count):
             (
                 q_to_fit,
                 delta_theta_over_delta_q_to_fit,
                 delta_theta_over_delta_q_list,
                 q_list,
             ) = self.calculator.process_single_group_data(group_index)
-            model, _ = self.calculator.perform_linear_fit(
-                q_to_fit, delta_theta_over_delta_q_to_fit
-            )
-            fit_slope = model.coef_[0]
-            fit_intercept = model.intercept_
+            fit_slope = self.calculator.fit_slopes[group_index]
+            fit_intercept = self.calculator.fit_intercepts[group_index]
 
             plt.scatter(
                 q_to_fit,
@@ -296,30 +293,33 @@ class Filteration_Plotter:
         plt.ylabel("Δθ/Δq")
         plt.legend(loc="upper left")
         plt.figtext(
-            0.5, 0.01, "三组数据保留所有数据点初拟合对比", ha="center", fontsize=15
+            0.5,
+            0.01,
+            f"{group_count}组数据保留所有数据点初拟合对比",
+            ha="center",
+            fontsize=15,
         )
 
         self.set_axes_style()
-        self.save_image("7")
+        self.keep_figure(f"{2 * group_count + 1}")
         # plt.show()
 
         # 重新拟合对比图
         plt.figure(figsize=(8, 6))
-        for i in range(3):
+        for i in range(group_count):
             plt.scatter(
-                self.q_to_refit_lists[i],
-                self.delta_theta_over_delta_q_to_refit_lists[i],
+                q_to_refit_lists[i],
+                delta_theta_over_delta_q_to_refit_lists[i],
                 label=f"第{i+1}组数据",
             )
             plt.plot(
-                self.q_to_refit_lists[i],
-                self.refit_slopes[i] * self.q_to_refit_lists[i]
-                + self.refit_intercepts[i],
+                q_to_refit_lists[i],
+                refit_slopes[i] * q_to_refit_lists[i] + refit_intercepts[i],
                 label=f"拟合线{i+1}",
             )
             self.add_auxiliary_lines(
-                self.q_to_refit_lists[i],
-                self.delta_theta_over_delta_q_to_refit_lists[i],
+                q_to_refit_lists[i],
+                delta_theta_over_delta_q_to_refit_lists[i],
             )
 
         plt.xlim(0, 0.200)
@@ -327,25 +327,31 @@ class Filteration_Plotter:
         plt.ylabel("Δθ/Δq")
         plt.legend(loc="upper left")
         plt.figtext(
-            0.5, 0.01, "三组数据排除异常值后再拟合对比", ha="center", fontsize=15
+            0.5,
+            0.01,
+            f"{group_count}组数据排除异常值后再拟合对比",
+            ha="center",
+            fontsize=15,
         )
 
         self.set_axes_style()
-        self.save_image("8")
+        self.keep_figure(f"{2 * group_count + 2}")
         # plt.show()
 
-    def integrate_figures(self):
+    def integrate_figures(self, directory="./拟合图结果"):
         """
-        合并所有绘图生成的图片并保存成一张图片
+        合并所有绘图生成的图形并保存成一张图片
         """
-        images = []
-        for i in range(1, 9):
-            img = mpimg.imread(f"./拟合图结果/{i}.png")
-            images.append(img)
+        # 直接在内存中栅格化各图形，无需读回已导出的PNG
+        images = [
+            figure_to_array(self.figures[f"{i}"])
+            for i in range(1, len(self.figures) + 1)
+        ]
 
-        # 使用 gridspec 精确控制子图布局
-        fig = plt.figure(figsize=(10, 12))
-        gs = gridspec.GridSpec(4, 2, wspace=-0.20, hspace=0)  # 设置水平间距和垂直间距
+        # 使用 gridspec 精确控制子图布局，每行两张图，设置水平间距和垂直间距
+        n_rows = (len(images) + 1) // 2
+        fig = plt.figure(figsize=(10, 3 * n_rows))
+        gs = gridspec.GridSpec(n_rows, 2, wspace=-0.20, hspace=0)
 
         for i, img in enumerate(images):
             ax = fig.add_subplot(gs[i])
@@ -353,16 +359,28 @@ class Filteration_Plotter:
             ax.axis("off")
             ax.margins(0)  # 减小子图内部边距
 
-        plt.savefig(r"./拟合图结果/拟合图整合图.png", bbox_inches="tight")
+        save_figure(
+            detach_figure(fig),
+            os.path.join(directory, "拟合图整合图.png"),
+            dpi=300,
+            bbox_inches="tight",
+        )
         # plt.show()
 
     def generate_all_figures(self):
         """
         生成所有必要的图形。
         """
-        # 1. 画三张初拟合图
-        for i in range(3):
-            # 正确拆解数据
+        # 所有组的拟合结果只计算一次，各图直接取用
+        (
+            q_to_refit_lists,
+            delta_theta_over_delta_q_to_refit_lists,
+            refit_slopes,
+            refit_intercepts,
+        ) = self.result["fit"]
+
+        # 1. 画各组初拟合图
+        for i in range(self.calculator.group_count):
             (
                 q_to_fit,
                 delta_theta_over_delta_q_to_fit,
@@ -370,69 +388,46 @@ class Filteration_Plotter:
                 q_list,
             ) = self.calculator.process_single_group_data(i)
 
-            # 执行线性拟合
-            model, _ = self.calculator.perform_linear_fit(
-                q_to_fit, delta_theta_over_delta_q_to_fit
-            )
-            fit_slope = model.coef_[0]
-            fit_intercept = model.intercept_
-
-            # 创建初拟合图
             self.create_initial_fit_figure(
                 i,
                 q_to_fit,
                 delta_theta_over_delta_q_to_fit,
-                fit_slope,
-                fit_intercept,
+                self.calculator.fit_slopes[i],
+                self.calculator.fit_intercepts[i],
                 q_list,
                 delta_theta_over_delta_q_list,
-                self.plot_ranges_initial[i],
+                self.plot_range(self.plot_ranges_initial, i),
             )
 
-        # 2. 画三张再拟合图
-        for i in range(3):
-            # 处理数据并获得回归线后的数据
+        # 2. 画各组再拟合图
+        for i in range(self.calculator.group_count):
             (
-                q_to_fit,
-                delta_theta_over_delta_q_to_fit,
+                _,
+                _,
                 delta_theta_over_delta_q_list,
                 q_list,
             ) = self.calculator.process_single_group_data(i)
-
-            # 执行线性拟合
-            model, fit_data = self.calculator.perform_linear_fit(
-                q_to_fit, delta_theta_over_delta_q_to_fit
+            filtered_data = np.column_stack(
+                (q_to_refit_lists[i], delta_theta_over_delta_q_to_refit_lists[i])
             )
 
-            # 获取异常值
-            outliers = self.calculator.detect_outliers(fit_data)
-
-            # 重新拟合数据并移除异常值
-            refit_model, filtered_data = (
-                self.calculator.refit_data_after_outlier_removal(fit_data, outliers)
-            )
-
-            refit_slope = refit_model.coef_[0]
-            refit_intercept = refit_model.intercept_
-
-            # 创建重新拟合图
             self.create_refit_figure(
                 i,
                 filtered_data,
-                refit_slope,
-                refit_intercept,
+                refit_slopes[i],
+                refit_intercepts[i],
                 q_list,
                 delta_theta_over_delta_q_list,
-                self.plot_ranges_refit[i],
+                self.plot_range(self.plot_ranges_refit, i),
             )
 
         # 3. 生成对比图
         self.generate_comparison_figures()
 
-        # 4. 生成整合图
-        self.integrate_figures()
+        return list(self.figures.values())
 
 
 if __name__ == "__main__":
     plotter = Filteration_Plotter(r"./过滤原始数据记录表(非).csv")
     plotter.generate_all_figures()
+    plotter.save_figures()
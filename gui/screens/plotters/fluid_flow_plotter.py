@@ -17,11 +17,18 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 
-from gui.screens.calculators.fluid_flow_calculator import Fluid_Flow_Calculator
+from gui.screens.calculators.fluid_flow_calculator import (
+    Fluid_Flow_Calculator,
+    LAMINAR_RE,
+    TURBULENT_RE,
+    friction_factor,
+    laminar_friction_factor,
+)
 from gui.screens.calculators.fluid_flow_calculator import (
     Centrifugal_Pump_Characteristics_Calculator,
 )
 from gui.screens.calculators.fluid_flow_calculator import Auxiliary
+from gui.screens.utils.figure_export import detach_figure, save_figures
 
 
 class Fluid_Flow_Plotter:
@@ -33,8 +40,14 @@ class Fluid_Flow_Plotter:
         self.log_Re = calculator.log_Re
         self.log_λ = calculator.log_λ
         self.valid_idx = calculator.valid_idx
+        self.relative_roughness = calculator.relative_roughness
         self.Re = self.ans1[:, 1]
         self.λ = self.ans1[:, 2]
+        self.figures = {}  # {图名: Figure}
+
+    def save_figures(self, output_dir="./拟合图结果"):
+        """导出图表"""
+        return save_figures(self.figures, output_dir, dpi=300)
 
     def plot(self):
         """绘制流体阻力分析结果"""
@@ -48,37 +61,67 @@ class Fluid_Flow_Plotter:
         log_Re = np.log10(Re_valid)
         log_λ = np.log10(λ_valid)
 
-        # 生成插值点
-        log_Re_interp = np.linspace(log_Re.min(), log_Re.max(), 100)
-        log_lambda_interp = self.p(log_Re_interp)
+        roughness_label = (
+            f"Colebrook拟合 (ε/d={self.relative_roughness:.2e})"
+            if self.relative_roughness is not None
+            else "光滑管参考曲线"
+        )
 
-        # 绘制无插值图
+        # 绘制拟合图
         plt.figure(figsize=(8, 6), dpi=125)
         plt.scatter(log_Re, log_λ, color="b", label="数据点")
-        plt.plot(log_Re, self.p(log_Re), color="red", label="拟合曲线")
+        order = np.argsort(log_Re)
+        plt.plot(
+            log_Re[order], self.p(log_Re[order]), color="red", label=roughness_label
+        )
         plt.xlabel("lg(Re)")
         plt.ylabel("lg(λ)")
-        plt.title("雷诺数与阻力系数双对数拟合(无插值)")
+        plt.title("雷诺数与阻力系数双对数拟合")
         plt.grid(True)
         plt.legend()
-        plt.savefig("./拟合图结果/雷诺数与阻力系数双对数拟合(无插值).png", dpi=300)
-        plt.close()
+        self.figures["雷诺数与阻力系数双对数拟合"] = detach_figure()
 
         # plt.show()
 
-        # 绘制有插值图
+        # 在稠密Re网格上与理论公式对比（两侧各外延半个数量级）
+        log_Re_dense = np.linspace(log_Re.min() - 0.5, log_Re.max() + 0.5, 500)
+        Re_dense = 10**log_Re_dense
+        laminar = Re_dense < TURBULENT_RE
+        turbulent = Re_dense > LAMINAR_RE
+
         plt.figure(figsize=(8, 6), dpi=125)
         plt.scatter(log_Re, log_λ, color="b", label="数据点")
-        plt.plot(log_Re_interp, log_lambda_interp, color="r", label="插值曲线")
+        plt.plot(log_Re_dense, self.p(log_Re_dense), color="r", label=roughness_label)
+        plt.plot(
+            log_Re_dense[turbulent],
+            np.log10(friction_factor(Re_dense[turbulent])),
+            color="gray",
+            linestyle="--",
+            label="Colebrook光滑管",
+        )
+        plt.plot(
+            log_Re_dense[turbulent],
+            np.log10(friction_factor(Re_dense[turbulent], model="blasius")),
+            color="g",
+            linestyle="-.",
+            label="Blasius公式",
+        )
+        plt.plot(
+            log_Re_dense[laminar],
+            np.log10(laminar_friction_factor(Re_dense[laminar])),
+            color="k",
+            linestyle=":",
+            label="层流 λ=64/Re",
+        )
         plt.xlabel("lg(Re)")
         plt.ylabel("lg(λ)")
-        plt.title("雷诺数与阻力系数双对数拟合(有插值)")
+        plt.title("雷诺数与阻力系数双对数曲线(理论对比)")
         plt.grid(True)
         plt.legend()
-        plt.savefig("./拟合图结果/雷诺数与阻力系数双对数拟合(有插值).png", dpi=300)
-        plt.close()
+        self.figures["雷诺数与阻力系数双对数曲线(理论对比)"] = detach_figure()
 
         # plt.show()
+        return list(self.figures.values())
 
 
 class Centrifugal_Pump_Characteristics_Plotter:
@@ -89,6 +132,11 @@ class Centrifugal_Pump_Characteristics_Plotter:
         self.params_H = calculator.params_H
         self.params_N = calculator.params_N
         self.params_η = calculator.params_η
+        self.figures = {}  # {图名: Figure}
+
+    def save_figures(self, output_dir="./拟合图结果"):
+        """导出图表"""
+        return save_figures(self.figures, output_dir, dpi=300)
 
     @staticmethod
     def quadratic(x, a, b, c):
@@ -140,8 +188,9 @@ class Centrifugal_Pump_Characteristics_Plotter:
         fig.legend(loc="upper center", bbox_to_anchor=(0.5, 1.08), ncol=3)
         plt.title("离心泵特性曲线及二次拟合")
         plt.tight_layout(rect=[0.05, 0.03, 0.95, 0.93])
-        plt.savefig("./拟合图结果/离心泵特性曲线及二次拟合.png", dpi=300)
+        self.figures["离心泵特性曲线及二次拟合"] = detach_figure(fig)
         # plt.show()
+        return list(self.figures.values())
 
 
 class PlotManager:
@@ -156,6 +205,7 @@ class PlotManager:
             fluid_calculator.process()
             fluid_plotter = Fluid_Flow_Plotter(fluid_calculator)
             fluid_plotter.plot()
+            fluid_plotter.save_figures()
 
         if "pump" in self.results:
             pump_calculator = Centrifugal_Pump_Characteristics_Calculator(
@@ -164,6 +214,7 @@ class PlotManager:
             pump_calculator.process()
             pump_plotter = Centrifugal_Pump_Characteristics_Plotter(pump_calculator)
             pump_plotter.plot()
+            pump_plotter.save_figures()
 
 
 if __name__ == "__main__":
@@ -25,6 +25,7 @@ import matplotlib.pyplot as plt
 from scipy.optimize import curve_fit
 
 from gui.screens.calculators.heat_transfer_calculator import Heat_Transfer_Calculator
+from gui.screens.utils.figure_export import detach_figure, save_figure
 
 
 class Heat_Transfer_Plotter:
@@ -36,6 +37,7 @@ class Heat_Transfer_Plotter:
         calculator_results: 从Heat_Transfer_Calculator获取的结果数据
         """
         self.results = calculator_results
+        self.figures = {}  # {保存路径: Figure}，导出前保留在内存中
         self.setup_plot_style()  # 初始化时设置全局样式
 
     def fit_func(self, x, a, b):
@@ -94,22 +96,29 @@ class Heat_Transfer_Plotter:
         for spine in ax.spines.values():
             spine.set_linewidth(2)
 
-    def plot_fit(self, data_for_fit, filename, title):
-        """优化后的拟合绘图方法"""
+    def plot_fit(self, data_for_fit, filename, title, params=None):
+        """
+        优化后的拟合绘图方法
+
+        参数:
+        params: 计算器已得到的拟合参数，提供时直接使用，不再重复拟合
+        """
         if len(data_for_fit) == 0:
             print(f"警告：跳过 {title} 的绘图，数据为空")
             return
 
-        try:
-            # 曲线拟合
-            ans_params, _ = curve_fit(
-                self.fit_func,
-                np.log10(data_for_fit[:, 0]),
-                np.log10(data_for_fit[:, 1]),
-            )
-        except Exception as e:
-            print(f"曲线拟合失败：{str(e)}")
-            return
+        ans_params = params
+        if ans_params is None:
+            try:
+                # 曲线拟合
+                ans_params, _ = curve_fit(
+                    self.fit_func,
+                    np.log10(data_for_fit[:, 0]),
+                    np.log10(data_for_fit[:, 1]),
+                )
+            except Exception as e:
+                print(f"曲线拟合失败：{str(e)}")
+                return
 
         # 配置图形
         plt.figure(figsize=(8, 6), dpi=125)
@@ -138,11 +147,16 @@ class Heat_Transfer_Plotter:
             bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
         )
 
-        # 保存输出
-        self.create_directory(filename)
+        # 保留输出，导出时写入filename
         plt.legend()
-        plt.savefig(filename, bbox_inches="tight")
-        plt.close()
+        self.figures[filename] = detach_figure()
+
+    def save_figures(self):
+        """将已生成的图表导出到各自的保存路径"""
+        for filename, fig in self.figures.items():
+            self.create_directory(filename)
+            save_figure(fig, filename, dpi=300, bbox_inches="tight")
+        return list(self.figures)
 
     def generate_plots(self):
         """生成所有分析图表"""
@@ -152,6 +166,7 @@ class Heat_Transfer_Plotter:
                 self.results[0]["data_for_fit"],
                 "./拟合图结果/无强化套管拟合.png",
                 "无强化套管传热性能分析",
+                self.results[0]["params"],
             )
 
         # 处理第二组数据（有强化套管）
@@ -160,11 +175,14 @@ class Heat_Transfer_Plotter:
                 self.results[1]["data_for_fit"],
                 "./拟合图结果/有强化套管拟合.png",
                 "有强化套管传热性能分析",
+                self.results[1]["params"],
             )
 
         # 生成对比图
         self.generate_comparison_plot()
 
+        return list(self.figures.values())
+
     def generate_comparison_plot(self):
         """生成对比分析图"""
         has_valid_data = False
@@ -214,11 +232,10 @@ class Heat_Transfer_Plotter:
             has_valid_data = True
 
         if has_valid_data:
-            self.create_directory("./拟合图结果/传热性能对比.png")
             plt.legend(fontsize=12, loc="upper left")
-            plt.savefig("./拟合图结果/传热性能对比.png", bbox_inches="tight")
-            plt.close()
+            self.figures["./拟合图结果/传热性能对比.png"] = detach_figure()
         else:
+            plt.close()
             print("警告：无有效数据生成对比图")
 
 
@@ -243,3 +260,4 @@ if __name__ == "__main__":
 
     # 生成并保存图表
     plotter.generate_plots()
+    plotter.save_figures()
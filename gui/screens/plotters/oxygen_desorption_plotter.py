@@ -15,8 +15,6 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit
-from scipy.stats import pearsonr
 import warnings
 
 warnings.filterwarnings("ignore")
@@ -27,6 +25,7 @@ from gui.screens.calculators.oxygen_desorption_calculator import (
 )
 from gui.screens.calculators.oxygen_desorption_calculator import Packed_Tower_Calculator
 from gui.screens.calculators.oxygen_desorption_calculator import Experiment_Data_Loader
+from gui.screens.utils.figure_export import detach_figure, save_figure
 
 
 class Packed_Tower_Plotter:
@@ -39,6 +38,13 @@ class Packed_Tower_Plotter:
         plt.rcParams["axes.unicode_minus"] = False
 
     def plot_comparison(self, save_path=None):
+        """绘制并导出填料塔性能对比图"""
+        output_path = save_path if save_path else "./拟合图结果/填料塔性能对比.png"
+        save_figure(self.build_comparison(), output_path, dpi=300, bbox_inches="tight")
+        return output_path
+
+    def build_comparison(self):
+        """绘制填料塔性能对比图，返回内存中的Figure"""
         plt.figure(figsize=(10, 6))
 
         # 确保有计算结果
@@ -67,12 +73,8 @@ class Packed_Tower_Plotter:
         plt.xlim(0, 1.3)
         plt.ylim(0, 40)
         ExperimentUtils.set_spine_width(plt.gca())
-
-        # 处理保存路径
-        output_path = save_path if save_path else "./拟合图结果/填料塔性能对比.png"
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=300, bbox_inches="tight")
         # plt.show()
+        return detach_figure()
 
     def _plot_single(self, data, label, color):
         u = data["u"]
@@ -90,6 +92,28 @@ class Packed_Tower_Plotter:
             eq = self._format_taylor_eq(popt)
 
         plt.plot(x_fit, y_fit, "k--", label=eq)
+        self._plot_breakpoints(data, color)
+
+    @staticmethod
+    def _plot_breakpoints(data, color):
+        """在双对数分段模型上标出载点和泛点"""
+        points = (("u_loading", "^", "载点"), ("u_flooding", "*", "泛点"))
+        for (key, marker, name), segment in zip(points, data["log_segments"]):
+            u_point = data[key]
+            if u_point is None:
+                continue
+            # 断点左侧一段的直线在断点处的值
+            Δp_point = np.exp(segment["intercept"] + segment["slope"] * np.log(u_point))
+            plt.scatter(
+                u_point,
+                Δp_point,
+                marker=marker,
+                s=150,
+                color=color,
+                edgecolors="k",
+                zorder=3,
+                label=f"{name} u={u_point:.3f} m/s",
+            )
 
     @staticmethod
     def _format_taylor_eq(coefficients):
@@ -111,6 +135,13 @@ class Oxygen_Desorption_Plotter:
         plt.rcParams["axes.unicode_minus"] = False
 
     def plot_correlation(self, save_path=None):
+        """绘制并导出氧解吸传质关联图"""
+        output_path = save_path if save_path else "./拟合图结果/氧解吸传质关联.png"
+        save_figure(self.build_correlation(), output_path, dpi=300, bbox_inches="tight")
+        return output_path
+
+    def build_correlation(self):
+        """绘制氧解吸传质关联图，返回内存中的Figure"""
         plt.figure(figsize=(8, 8))
 
         # 确保有计算结果
@@ -128,12 +159,8 @@ class Oxygen_Desorption_Plotter:
         plt.legend()
         plt.grid(True)
         ExperimentUtils.set_spine_width(plt.gca())
-
-        # 处理保存路径
-        output_path = save_path if save_path else "./拟合图结果/氧解吸传质关联.png"
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=300, bbox_inches="tight")
         # plt.show()
+        return detach_figure()
 
 
 class ExperimentUtils:
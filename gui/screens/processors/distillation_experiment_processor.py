@@ -14,6 +14,8 @@ sys.path.insert(0, str(project_root))
 
 from gui.screens.calculators.distillation_calculator import Distillation_Calculator
 from gui.screens.plotters.distillation_plotter import Distillation_Plotter
+from gui.screens.utils.experiment_result import Experiment_Result
+from gui.screens.utils.figure_export import save_figure
 
 
 class Distillation_Experiment_Processor:
@@ -47,6 +49,11 @@ class Distillation_Experiment_Processor:
         # 初始化可视化引擎
         self.plotter = Distillation_Plotter(self.calculator)
 
+        # 本次处理的共享结果，McCabe-Thiele图只绘制一次，导出和界面显示共用
+        self.result = Experiment_Result().stage(
+            "mccabe_thiele", self._plot_mccabe_thiele
+        )
+
         # 配置输出路径
         self.file_path = file_path
         self.output_dir = Path(output_dir)
@@ -87,10 +94,32 @@ class Distillation_Experiment_Processor:
         result_path = self.output_dir / "计算结果" / f"{self.base_name}_results.txt"
         self.calculator.save_results(str(result_path))
 
+    def _plot_mccabe_thiele(self):
+        """绘制McCabe-Thiele图（不显示）"""
+        return self.plotter.plot_mccabe_thiele(show=False)
+
     def _generate_plots(self, show=True):
         """生成可视化图表"""
         plot_path = self.output_dir / "拟合图结果" / f"{self.base_name}.png"
-        self.plotter.plot_mccabe_thiele(save_path=str(plot_path), show=show)
+        if show:
+            fig = self.plotter.plot_mccabe_thiele(save_path=str(plot_path), show=True)
+            self.result.set("mccabe_thiele", fig)
+        else:
+            save_figure(
+                self.result["mccabe_thiele"], plot_path, dpi=300, bbox_inches="tight"
+            )
+
+    def sweep_reflux(self, R_values):
+        """
+        回流比扫描并保存结果表
+
+        参数：
+        R_values (array_like): 待扫描的回流比序列
+        """
+        table = self.calculator.sweep_reflux(R_values)
+        table_path = self.output_dir / "计算结果" / f"{self.base_name}_reflux_sweep.csv"
+        table.to_csv(table_path, index=False, encoding="utf-8-sig")
+        return table
 
     def _create_archive(self):
         """创建ZIP打包文件"""
@@ -121,6 +150,36 @@ class Distillation_Experiment_Processor:
         }
 
 
+def run_distillation_cases(file_path, cases, αm, F, tS, tF):
+    """
+    后台进程任务：按多个回流比执行精馏实验流程
+
+    参数：
+    cases (list): [(回流比, 输出目录), ...]
+
+    返回：
+    list: 各回流比对应的处理器
+    """
+    processors = []
+    for R, output_dir in cases:
+        processor = Distillation_Experiment_Processor(
+            file_path=file_path, R=R, αm=αm, F=F, tS=tS, tF=tF, output_dir=output_dir
+        )
+        processor.process_experiment(show_plot=False)
+        processors.append(processor)
+    return processors
+
+
+def render_distillation_plots(processors):
+    """
+    后台进程任务：获取各处理器的McCabe-Thiele图
+
+    图形已在 process_experiment 导出时绘制，直接返回同一Figure对象，
+    仅处理失败而未绘制的处理器才会重新绘制。
+    """
+    return [processor.result["mccabe_thiele"] for processor in processors]
+
+
 if __name__ == "__main__":
     # 使用示例
     DATA_FILE = "./csv_data/精馏/精馏原始记录表(非)/Sheet1.csv"
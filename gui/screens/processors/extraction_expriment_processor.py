@@ -37,6 +37,7 @@ class ExtractionExperimentProcessor:
         self.distribution_file = distribution_file
         self.calculator = None
         self.plotter = None
+        self.design_table = None  # 塔高设计等值线表
 
         # 结果输出配置
         self.output_dir = "./拟合图结果"
@@ -65,6 +66,7 @@ class ExtractionExperimentProcessor:
         """执行完整数据处理流程"""
         # 数据计算阶段
         self.calculator.run_calculations()
+        self.design_table = self.calculator.design_contour_table()
 
         # 可视化阶段
         self.plotter.create_output_dir()
@@ -74,6 +76,7 @@ class ExtractionExperimentProcessor:
 
         # 结果打包
         print("正在打包结果文件...")
+        self.plotter.save_figures()
         self.plotter.package_results(self.zip_file)
 
     def print_summary(self):
@@ -100,6 +103,15 @@ class ExtractionExperimentProcessor:
             raise
 
 
+def run_extraction_experiment(origin_file, distribution_file):
+    """后台进程任务：执行萃取实验完整流程并返回处理器"""
+    processor = ExtractionExperimentProcessor(
+        origin_file=origin_file, distribution_file=distribution_file
+    )
+    processor.run()
+    return processor
+
+
 def parse_arguments():
     """解析命令行参数"""
     parser = argparse.ArgumentParser(description="萃取实验数据处理系统")
@@ -15,6 +15,7 @@ import zipfile
 import matplotlib.pyplot as plt
 from gui.screens.calculators.filteration_calculator import Filteration_Calculator
 from gui.screens.plotters.filteration_plotter import Filteration_Plotter
+from gui.screens.utils.experiment_result import Experiment_Result
 
 # 设置中文字体
 plt.rcParams["font.family"] = "SimHei"
@@ -39,13 +40,20 @@ class Filteration_Experiment_Processor:
         # 初始化计算类处理数据
         self.calculator = Filteration_Calculator(csv_file_path)
 
+        # 本次处理的共享结果，拟合只计算一次，绘图类按引用取用
+        self.result = Experiment_Result().stage(
+            "fit", self.calculator.process_all_groups
+        )
+
         # 初始化绘图类生成图形
-        self.plotter = Filteration_Plotter(csv_file_path)
+        self.plotter = Filteration_Plotter(
+            csv_file_path, calculator=self.calculator, result=self.result
+        )
 
         # 初始化一个列表来存储处理后的数据
         self.processed_data = []
 
-        # 存储来自Filteration_Calculator和Filteration_Plotter的数据
+        # 存储来自Filteration_Calculator的数据
         self.calculator_data = {
             "data": self.calculator.data,
             "q_to_refit_lists": self.calculator.q_to_refit_lists,
@@ -63,41 +71,35 @@ class Filteration_Experiment_Processor:
             "q_list": self.calculator.q_list,
             "q_to_fit": self.calculator.q_to_fit,
             "delta_theta_over_delta_q_to_fit": self.calculator.delta_theta_over_delta_q_to_fit,
-            "fit_model": self.calculator.fit_model,
+            "fit_slopes": self.calculator.fit_slopes,
+            "fit_intercepts": self.calculator.fit_intercepts,
             "fit_data": self.calculator.fit_data,
             "fit_slope": self.calculator.fit_slope,
             "fit_intercept": self.calculator.fit_intercept,
             "outliers": self.calculator.outliers,
-            "refit_model": self.calculator.refit_model,
+            "outlier_mask": self.calculator.outlier_mask,
             "filtered_data": self.calculator.filtered_data,
         }
 
-        self.plotter_data = {
-            "q_to_refit_lists": self.plotter.q_to_refit_lists,
-            "delta_theta_over_delta_q_to_refit_lists": self.plotter.delta_theta_over_delta_q_to_refit_lists,
-            "refit_slopes": self.plotter.refit_slopes,
-            "refit_intercepts": self.plotter.refit_intercepts,
-        }
-
     def calculate(self):
         """
         使用计算类处理数据。
         处理各组数据并返回进一步分析所需的信息。
         """
-        # 处理所有组的数据并存储结果
+        # 处理所有组的数据并存储结果（已计算时直接取用）
         (
             self.q_to_refit_lists,
             self.delta_theta_over_delta_q_to_refit_lists,
             self.refit_slopes,
             self.refit_intercepts,
-        ) = self.calculator.process_all_groups()
+        ) = self.result["fit"]
 
     def store(self):
         """
         将处理后的数据存储到类的processed_data列表中。
         这些数据将用于生成结果和图形。
         """
-        for i in range(3):
+        for i in range(len(self.refit_slopes)):
             # 存储每组处理后的数据（q值、斜率、截距）到字典中
             group_data = {
                 "group": i + 1,
@@ -112,8 +114,14 @@ class Filteration_Experiment_Processor:
         """
         使用绘图类基于处理后的数据生成所有所需的图形。
         """
-        # 使用绘图类生成图形
-        self.plotter.generate_all_figures()
+        # 使用绘图类生成图形（仅保留在内存中）
+        return self.plotter.generate_all_figures()
+
+    def export_figures(self):
+        """
+        将生成的图形及整合图导出到结果目录。
+        """
+        return self.plotter.save_figures(r"./拟合图结果")
 
     def compress_results(self):
         """
@@ -134,6 +142,20 @@ class Filteration_Experiment_Processor:
         print(f"压缩完成。文件已保存为: {dir_to_save}")
 
 
+def run_filteration_processing(csv_file_path):
+    """后台进程任务：完成过滤实验计算并返回处理器"""
+    processor = Filteration_Experiment_Processor(csv_file_path)
+    processor.calculate()
+    processor.store()
+    return processor
+
+
+def render_filteration_figures(processor):
+    """后台进程任务：生成过滤实验图形（保留在内存中）并返回处理器"""
+    processor.plot()
+    return processor
+
+
 if __name__ == "__main__":
     # 定义CSV文件的路径进行处理
     csv_file_path = r"./过滤原始数据记录表(非).csv"
@@ -150,5 +172,8 @@ if __name__ == "__main__":
     # 第三步：基于处理后的数据生成图形
     processor.plot()  # 生成图形（初拟合、再拟合等）
 
-    # 第四步：压缩结果图像文件为zip文件
+    # 第四步：导出图形文件
+    processor.export_figures()
+
+    # 第五步：压缩结果图像文件为zip文件
     processor.compress_results()  # 将生成的结果文件压缩成zip文件
@@ -67,14 +67,19 @@ class Fluid_Flow_Expriment_Processor:
             raise ValueError("第二个文件不是离心泵数据文件")
 
     def generate_all_plots(self):
-        """生成所有分析图表"""
+        """生成所有分析图表，返回内存中的Figure列表"""
         if not self.fluid_plotter:
             self.process_fluid_flow()
         if not self.pump_plotter:
             self.process_pump_characteristics()
 
-        self.fluid_plotter.plot()
-        self.pump_plotter.plot()
+        return self.fluid_plotter.plot() + self.pump_plotter.plot()
+
+    def export_plots(self):
+        """将已生成的图表导出到输出目录"""
+        return self.fluid_plotter.save_figures(
+            self.output_dir
+        ) + self.pump_plotter.save_figures(self.output_dir)
 
     def get_fluid_flow_results(self):
         """获取流体阻力实验结果"""
@@ -86,7 +91,8 @@ class Fluid_Flow_Expriment_Processor:
             "friction_factor": self.fluid_calculator.ans1[:, 2],
             "log_reynolds": self.fluid_calculator.log_Re,
             "log_friction": self.fluid_calculator.log_λ,
-            "polynomial": self.fluid_calculator.p,
+            "fit_curve": self.fluid_calculator.p,
+            "relative_roughness": self.fluid_calculator.relative_roughness,
         }
 
     def get_pump_characteristics_results(self):
@@ -100,6 +106,8 @@ class Fluid_Flow_Expriment_Processor:
             "head_params": self.pump_calculator.params_H,
             "power_params": self.pump_calculator.params_N,
             "efficiency_params": self.pump_calculator.params_η,
+            "operating_points": self.pump_calculator.operating_points(),
+            "best_efficiency_point": self.pump_calculator.best_efficiency_point(),
         }
 
 
@@ -121,8 +129,9 @@ if __name__ == "__main__":
         processor.process_pump_characteristics()
     )
 
-    # 生成所有图表
+    # 生成并导出所有图表
     processor.generate_all_plots()
+    processor.export_plots()
 
     # 获取结果
     fluid_results = processor.get_fluid_flow_results()
@@ -19,6 +19,7 @@ from scipy.optimize import curve_fit
 
 from gui.screens.calculators.heat_transfer_calculator import Heat_Transfer_Calculator
 from gui.screens.plotters.heat_transfer_plotter import Heat_Transfer_Plotter
+from gui.screens.utils.experiment_result import Experiment_Result
 
 # 设置中文字体
 plt.rcParams["font.family"] = "SimHei"
@@ -41,10 +42,13 @@ class Heat_Transfer_Experiment_Processor:
         """
         self.csv_file_paths = csv_file_paths  # 存储CSV文件路径列表
 
-        # 初始化计算类处理数据
+        # 初始化计算类处理数据（数据集在初始化时加载一次）
         self.calculator = Heat_Transfer_Calculator(csv_file_paths)
 
-        # 初始化绘图类生成图形
+        # 本次处理的共享结果，拟合只计算一次
+        self.result = Experiment_Result().stage("fit", self.calculator.process_data)
+
+        # 初始化绘图类生成图形（按引用共享计算结果列表）
         self.plotter = Heat_Transfer_Plotter(self.calculator.results)
 
         # 初始化一个列表来存储处理后的数据
@@ -58,13 +62,10 @@ class Heat_Transfer_Experiment_Processor:
         使用计算类处理传热实验数据。
         处理各组数据并返回拟合结果和计算信息。
         """
-        # 加载数据
-        datasets = self.calculator.load_data()
-
-        # 数据预处理（已在初始化中完成）
+        # 数据加载和预处理已在初始化中完成
 
-        # 数据处理
-        self.calculator.process_data()
+        # 数据处理（已计算时直接取用）
+        self.result["fit"]
 
     def store(self):
         """
@@ -86,8 +87,14 @@ class Heat_Transfer_Experiment_Processor:
         """
         使用绘图类基于处理后的数据生成所有所需的图形。
         """
-        # 生成并保存图表
-        self.plotter.generate_plots()
+        # 生成图表（保留在内存中）
+        return self.plotter.generate_plots()
+
+    def export_figures(self):
+        """
+        将生成的图表导出为图片文件。
+        """
+        return self.plotter.save_figures()
 
     def compress_results(self):
         """
@@ -158,6 +165,7 @@ if __name__ == "__main__":
 
     # 第三步：基于处理后的数据生成图形
     processor.plot()
+    processor.export_figures()
 
     # 第四步：生成拟合结果报告
     processor.fit_data_summary()
@@ -22,6 +22,7 @@ from gui.screens.plotters.oxygen_desorption_plotter import (
     Packed_Tower_Plotter,
     Oxygen_Desorption_Plotter,
 )
+from gui.screens.utils.figure_export import save_figures
 
 
 class Result_Compressor:
@@ -83,12 +84,16 @@ class Oxygen_Desorption_Experiment_Processor:
         # 添加实例属性占位
         self.tower_calculator = None
         self.oxygen_calculator = None
+        self.figures = {}  # {文件名: Figure}，内存中的图形
 
-    def run_all_calculations(self, compress_results: bool = True):
+    def run_all_calculations(
+        self, compress_results: bool = True, export_figures: bool = True
+    ):
         """执行完整计算流程
 
         Args:
             compress_results: 是否压缩结果文件，默认为True
+            export_figures: 是否导出图片文件，默认为True；界面中仅显示时可关闭
         """
         try:
             # 填料塔计算
@@ -98,9 +103,7 @@ class Oxygen_Desorption_Experiment_Processor:
             self.tower_calculator.calc_all_files()
 
             tower_plotter = Packed_Tower_Plotter(self.tower_calculator)
-            tower_plotter.plot_comparison(
-                save_path=str(self.output_dir / "填料塔性能对比.png")
-            )
+            self.figures["填料塔性能对比"] = tower_plotter.build_comparison()
 
             # 氧解吸计算
             self.oxygen_calculator = Oxygen_Desorption_Calculator(
@@ -109,9 +112,11 @@ class Oxygen_Desorption_Experiment_Processor:
             self.oxygen_calculator.calc_all_files()
 
             oxygen_plotter = Oxygen_Desorption_Plotter(self.oxygen_calculator)
-            oxygen_plotter.plot_correlation(
-                save_path=str(self.output_dir / "氧解吸传质关联.png")
-            )
+            self.figures["氧解吸传质关联"] = oxygen_plotter.build_correlation()
+
+            # 压缩前必须先导出图片
+            if export_figures or compress_results:
+                self.export_figures()
 
             # 可选结果压缩
             if compress_results:
@@ -124,6 +129,14 @@ class Oxygen_Desorption_Experiment_Processor:
             print(f"计算过程中发生错误: {str(e)}")
             raise
 
+    def export_figures(self) -> list:
+        """将内存中的图形导出到输出目录
+
+        Returns:
+            list: 图片文件路径
+        """
+        return save_figures(self.figures, self.output_dir, dpi=300, bbox_inches="tight")
+
 
 if __name__ == "__main__":
     # 使用示例
@@ -0,0 +1,347 @@
+# acquisition_hub.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import asyncio
+import logging
+import threading
+import time
+import numpy as np
+import serial
+
+from gui.screens.utils.config import DATA_CONFIG
+from gui.screens.utils.expserial import Experiment_Serial
+from gui.screens.utils.serial_acquisition import Ring_Buffer
+
+
+class Instrument:
+    """
+    采集仪器（通道）基类
+
+    每台仪器有独立的协议解析器和环形缓冲区。一次读取到的多个样本，
+    其时间戳在上次到达时刻与本次到达时刻之间线性分布，而不是全部记为本次到达时刻。
+    """
+
+    def __init__(self, name, protocol=None, capacity=None):
+        self.name = name
+        self.protocol = protocol or Experiment_Serial(mode="ascii")
+        self.capacity = capacity or DATA_CONFIG["acquisition_buffer_size"]
+        self.reset()
+
+    def reset(self):
+        """清空缓冲区和统计，每次开始采集时调用"""
+        self.buffer = Ring_Buffer(self.capacity)
+        self.error = None
+        self.bytes_read = 0
+        self.dropped = 0
+        self._pending = b""
+        self._last_arrival = None
+
+    @property
+    def channel_names(self):
+        """通道名称：仪器名.字段名"""
+        if self.protocol.dtype is None:
+            return [f"{self.name}.{j + 1}" for j in range(self.buffer.n_channels)]
+        return [f"{self.name}.{field}" for field in self.protocol.dtype.names]
+
+    def _feed(self, chunk, arrived):
+        """解析一次读取到的字节并写入缓冲区"""
+        self.bytes_read += len(chunk)
+        samples, self._pending, dropped = self.protocol.parse_samples(
+            self._pending + chunk
+        )
+        self.dropped += dropped
+        if len(samples):
+            previous = arrived if self._last_arrival is None else self._last_arrival
+            times = np.linspace(previous, arrived, len(samples) + 1)[1:]
+            if not self.buffer.write(times, samples):
+                self.dropped += len(samples)
+        self._last_arrival = arrived
+
+    async def run(self, hub):
+        """读取协程（子类实现）"""
+        raise NotImplementedError
+
+    def stats(self):
+        return {
+            "接收字节数": self.bytes_read,
+            "采样数": self.buffer.written,
+            "丢弃样本数": self.dropped,
+        }
+
+
+class Serial_Instrument(Instrument):
+    """
+    串口仪器
+
+    串口以非阻塞方式打开（timeout=0），在事件循环中按 poll_interval 轮询
+    已到达的字节，多个串口共用一个线程，互不阻塞。
+    """
+
+    def __init__(self, name, port, baudrate=9600, protocol=None, poll_interval=0.005):
+        super().__init__(name, protocol)
+        self.port = port
+        self.baudrate = baudrate
+        self.poll_interval = poll_interval
+
+    async def run(self, hub):
+        connection = serial.Serial(port=self.port, baudrate=self.baudrate, timeout=0)
+        try:
+            while not hub.stopping:
+                waiting = connection.in_waiting
+                if not waiting:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                self._feed(connection.read(waiting), hub.elapsed())
+        finally:
+            connection.close()
+
+
+class Tcp_Instrument(Instrument):
+    """TCP仪器（网络采集模块、以太网转串口服务器等）"""
+
+    def __init__(self, name, host, port, protocol=None):
+        super().__init__(name, protocol)
+        self.host = host
+        self.port = port
+
+    async def run(self, hub):
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            DATA_CONFIG["port_timeout"] * 20,
+        )
+        try:
+            while not hub.stopping:
+                try:
+                    chunk = await asyncio.wait_for(
+                        reader.read(1 << 16), DATA_CONFIG["port_timeout"]
+                    )
+                except asyncio.TimeoutError:
+                    continue
+                if not chunk:
+                    raise ConnectionError(f"{self.name} 连接已关闭")
+                self._feed(chunk, hub.elapsed())
+        finally:
+            writer.close()
+
+
+class Acquisition_Hub:
+    """
+    多仪器异步采集中心
+
+    所有仪器的读取协程运行在同一个事件循环线程中。Tk线程调用 poll() 时，
+    将各仪器的数据按公共时间轴（步长为 DATA_CONFIG["time_interval"]）线性插值对齐，
+    对齐结果写入 self.buffer，接口与 Serial_Acquisition 一致，可直接供 Base_Screen 使用。
+    公共时间轴只推进到所有正常仪器都已有数据的时刻；出错的仪器、超过 stale_time
+    没有新数据的仪器，以及开始采集 stale_time 后仍没有任何数据的仪器不再限制时间轴，
+    其通道在最后一个样本之后（或全部）记为NaN。各仪器的通道数在第一次对齐时确定，
+    之后对齐结果的列数始终与 channel_names 一致。
+    单台仪器出错不影响其他仪器，全部出错时 error 才不为None。
+    """
+
+    def __init__(self, instruments, time_step=None, capacity=None, stale_time=None):
+        self.instruments = list(instruments)
+        self.time_step = time_step or DATA_CONFIG["time_interval"] / 1000
+        self.buffer = Ring_Buffer(capacity or DATA_CONFIG["acquisition_buffer_size"])
+        self.stale_time = stale_time or DATA_CONFIG["instrument_stale_time"]
+
+        self.stopping = False
+        self.start_time = None
+        self._cursor = 0
+        self._aligned_until = None  # 已对齐到的时刻
+        self._read_from = []  # 各仪器下次复制的起始累计序号
+        self._widths = None  # 各仪器在对齐结果中的通道数，第一次对齐时确定
+        self._thread = None
+        self.overruns = 0
+        self.overrun_samples = 0
+        self._reported = set()  # 已通过 new_failures() 报告的仪器
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def failed(self):
+        """已出错的仪器"""
+        return [inst for inst in self.instruments if inst.error is not None]
+
+    @property
+    def error(self):
+        """全部仪器都出错时返回汇总异常，否则为None（部分仪器出错时继续采集）"""
+        failed = self.failed
+        if not failed or len(failed) < len(self.instruments):
+            return None
+        return ConnectionError(
+            "全部仪器采集失败: "
+            + "; ".join(f"{inst.name}: {str(inst.error)}" for inst in failed)
+        )
+
+    def new_failures(self):
+        """
+        获取上次调用以来新出错的仪器（在Tk线程中调用）
+
+        返回:
+        list
+            [(仪器名, 异常)]
+        """
+        failures = [
+            (inst.name, inst.error)
+            for inst in self.failed
+            if inst.name not in self._reported
+        ]
+        self._reported.update(name for name, _ in failures)
+        return failures
+
+    @property
+    def channel_names(self):
+        if self._widths is None:
+            return [name for inst in self.instruments for name in inst.channel_names]
+        names = []
+        for inst, width in zip(self.instruments, self._widths):
+            inst_names = inst.channel_names
+            if len(inst_names) != width:
+                inst_names = [f"{inst.name}.{j + 1}" for j in range(width)]
+            names.extend(inst_names)
+        return names
+
+    def elapsed(self):
+        return time.monotonic() - self.start_time
+
+    # ---------------------------- 事件循环线程 ----------------------------
+    def start(self):
+        """启动事件循环线程"""
+        if self.running:
+            return self
+        self.stopping = False
+        for instrument in self.instruments:
+            instrument.reset()
+        self._reported = set()
+        self._aligned_until, self._widths = None, None
+        self._read_from = [0] * len(self.instruments)
+        self.start_time = time.monotonic()
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._main()), name="chemlabx-hub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """通知所有读取协程退出并等待线程结束"""
+        self.stopping = True
+        if self._thread is not None:
+            self._thread.join(timeout or DATA_CONFIG["port_timeout"] * 4)
+
+    async def _main(self):
+        await asyncio.gather(*(self._guard(inst) for inst in self.instruments))
+
+    async def _guard(self, instrument):
+        """单台仪器出错时记录异常，不影响其他仪器"""
+        try:
+            await instrument.run(self)
+        except Exception as e:
+            instrument.error = e
+            logging.error(f"仪器 {instrument.name} 采集失败: {str(e)}")
+
+    # ---------------------------- 时间对齐 ----------------------------
+    def _active(self, instrument, times):
+        """
+        仪器是否参与确定公共时间轴：未出错，最近的样本未过时；
+        开始采集超过 stale_time 仍没有数据的仪器不再等待
+        """
+        if instrument.error is not None:
+            return False
+        if not len(times):
+            return self.elapsed() <= self.stale_time
+        return times[-1] >= self.elapsed() - self.stale_time
+
+    def _align(self):
+        """将各仪器新到达的数据插值到公共时间轴并写入对齐缓冲区"""
+        # 只复制上次对齐时刻之前最后一个样本以后的部分，复制后再插值，
+        # 避免视图在插值过程中被读取线程覆盖
+        windows = [
+            inst.buffer.snapshot_since(first)
+            for inst, first in zip(self.instruments, self._read_from)
+        ]
+        active = [
+            times
+            for inst, (times, _, _) in zip(self.instruments, windows)
+            if self._active(inst, times)
+        ]
+        if not active or any(len(times) == 0 for times in active):
+            return
+
+        t_first = max(times[0] for times in active)
+        t_last = min(times[-1] for times in active)
+        if self._aligned_until is None:
+            t_begin = t_first
+        else:
+            t_begin = max(self._aligned_until + self.time_step, t_first)
+        if t_last < t_begin:
+            return
+        grid = t_begin + self.time_step * np.arange(
+            int((t_last - t_begin) / self.time_step) + 1
+        )
+
+        if self._widths is None:
+            self._widths = [
+                samples.shape[1] if len(times) else len(inst.channel_names)
+                for inst, (times, samples, _) in zip(self.instruments, windows)
+            ]
+        columns = []
+        for i, (times, samples, first) in enumerate(windows):
+            width = self._widths[i]
+            if not len(times) or samples.shape[1] != width:
+                # 没有数据（或通道数与首次对齐时不符）的仪器以NaN占位
+                columns.extend(np.full(len(grid), np.nan) for _ in range(width))
+                continue
+            start = max(np.searchsorted(times, grid[0]) - 1, 0)  # 只插值相关的尾部
+            for j in range(width):
+                columns.append(
+                    np.interp(
+                        grid,
+                        times[start:],
+                        samples[start:, j],
+                        left=np.nan,
+                        right=np.nan,
+                    )
+                )
+            # 下次从不晚于本次对齐终点的最后一个样本开始复制
+            last = max(np.searchsorted(times, grid[-1], side="right") - 1, 0)
+            self._read_from[i] = first + last
+        if columns:
+            self.buffer.write(grid, np.column_stack(columns))
+        self._aligned_until = grid[-1]
+
+    def poll(self):
+        """
+        获取上次调用以来对齐后的新样本（在Tk线程中调用）
+
+        返回:
+        tuple
+            (公共时间轴, 样本数组(时刻数, 全部通道数))，均为缓冲区的视图
+        """
+        self._align()
+        times, samples, self._cursor, lost = self.buffer.read_since(self._cursor)
+        if lost:
+            self.overruns += 1
+            self.overrun_samples += lost
+        return times, samples
+
+    def stats(self):
+        """返回各仪器及对齐结果的统计"""
+        stats = {inst.name: inst.stats() for inst in self.instruments}
+        stats["对齐"] = {
+            "时刻数": self.buffer.written,
+            "溢出次数": self.overruns,
+            "溢出样本数": self.overrun_samples,
+        }
+        return stats
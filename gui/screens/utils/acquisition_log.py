@@ -0,0 +1,343 @@
+# acquisition_log.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+from gui.screens.utils.config import DATA_CONFIG
+
+MANIFEST_NAME = "manifest.json"
+CHUNK_PATTERN = "chunk_{:06d}.npy"
+
+
+def _fsync_path(path):
+    """将文件或目录的内容落盘（Windows不支持对目录fsync，直接跳过）"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_atomic(path, write):
+    """先写临时文件再原子替换，崩溃时只会留下旧文件或完整的新文件"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def read_manifest(directory):
+    """只读取清单，不修改目录（清单不存在时返回空清单）"""
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return {"columns": None, "chunk_size": None, "chunks": []}
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def recover_log(directory):
+    """
+    恢复采集日志目录（会删除和改写文件，只能在没有写入方时调用）
+
+    清单只记录已落盘的数据块；崩溃时清单之后可能还有已写出但未登记的数据块，
+    依次校验这些数据块（能完整读出且列数一致）并补登记，遇到第一个损坏的数据块为止，
+    其后的数据块和残留的临时文件一并删除。
+
+    返回:
+    dict
+        恢复后的清单
+    """
+    manifest = read_manifest(directory)
+
+    for name in os.listdir(directory):
+        if name.endswith(".tmp"):
+            os.remove(os.path.join(directory, name))
+
+    index = len(manifest["chunks"])
+    recovered = 0
+    while True:
+        path = os.path.join(directory, CHUNK_PATTERN.format(index))
+        if not os.path.exists(path):
+            break
+        try:
+            chunk = np.load(path, mmap_mode="r")
+            columns = manifest["columns"]
+            if chunk.ndim != 2 or not len(chunk):
+                raise ValueError("数据块形状不符")
+            if columns and chunk.shape[1] != len(columns):
+                raise ValueError("数据块列数与清单不符")
+            entry = _chunk_entry(os.path.basename(path), chunk)
+            del chunk
+        except (OSError, ValueError, IndexError) as e:
+            logging.warning(f"采集日志数据块损坏，已丢弃: {path} ({str(e)})")
+            break
+        manifest["chunks"].append(entry)
+        index += 1
+        recovered += 1
+
+    # 损坏数据块之后的内容无法保证顺序完整，全部删除
+    while os.path.exists(os.path.join(directory, CHUNK_PATTERN.format(index))):
+        os.remove(os.path.join(directory, CHUNK_PATTERN.format(index)))
+        index += 1
+
+    if recovered:
+        logging.info(f"采集日志已恢复 {recovered} 个未登记的数据块: {directory}")
+        _write_manifest(directory, manifest)
+    return manifest
+
+
+def _chunk_entry(name, chunk):
+    """数据块在清单中的登记信息（首列为时间）"""
+    return {
+        "file": name,
+        "rows": int(len(chunk)),
+        "t_start": float(chunk[0, 0]),
+        "t_end": float(chunk[-1, 0]),
+    }
+
+
+def _write_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST_NAME)
+    data = json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def write(f):
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    _write_atomic(path, write)
+    _fsync_path(directory)
+
+
+class Acquisition_Log_Writer:
+    """
+    只追加的分块列式采集日志
+
+    样本先填入预分配的数据块数组，写满后由后台线程保存为独立的 .npy 文件，
+    每写出 fsync_chunks 个数据块统一落盘一次，再原子更新清单 manifest.json。
+    崩溃后最多丢失尚未写满的数据块，重新打开目录时由 recover_log 补登记
+    已写出的完整数据块。
+    """
+
+    def __init__(self, directory, columns=None, chunk_size=None, fsync_chunks=None):
+        """
+        参数:
+        directory : str
+            日志目录，已存在时先恢复再继续追加
+        columns : list, optional
+            列名（首列为时间），默认由第一批样本确定
+        chunk_size : int, optional
+            每个数据块的行数，默认为 DATA_CONFIG["log_chunk_size"]
+        fsync_chunks : int, optional
+            每落盘一次写出的数据块数，默认为 DATA_CONFIG["log_fsync_chunks"]
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.manifest = recover_log(directory)
+        if self.manifest["columns"] is None:
+            self.manifest["columns"] = columns
+        self.chunk_size = self.manifest["chunk_size"] or int(
+            chunk_size or DATA_CONFIG["log_chunk_size"]
+        )
+        self.manifest["chunk_size"] = self.chunk_size
+        self.fsync_chunks = fsync_chunks or DATA_CONFIG["log_fsync_chunks"]
+
+        self._chunk = None  # 正在填充的数据块
+        self._filled = 0
+        self._next_index = len(self.manifest["chunks"])
+        self._unsynced = []  # 已写出但尚未落盘登记的数据块
+        self._queue = queue.Queue()
+
+        # 统计计数
+        self.rows_written = sum(entry["rows"] for entry in self.manifest["chunks"])
+        self.syncs = 0
+        self.error = None
+
+        if self.manifest["columns"] is not None:
+            _write_manifest(directory, self.manifest)
+        self._thread = threading.Thread(
+            target=self._run, name="chemlabx-log", daemon=True
+        )
+        self._thread.start()
+
+    # ---------------------------- 调用方接口 ----------------------------
+    def append(self, times, samples):
+        """
+        追加样本（在任意线程中调用，数据复制后交给后台线程）
+
+        参数:
+        times : array_like
+            时间数组
+        samples : array_like
+            样本数组（样本数, 通道数）
+        """
+        block = np.column_stack([times, samples]).astype(float)
+        if len(block):
+            self._queue.put(block)
+
+    def close(self, timeout=None):
+        """
+        写出剩余样本并落盘，等待后台线程结束
+
+        返回:
+        bool
+            后台线程是否在 timeout（默认 DATA_CONFIG["log_close_timeout"]）内结束；
+            写入失败时异常保存在 self.error
+        """
+        self._queue.put(None)
+        self._thread.join(timeout or DATA_CONFIG["log_close_timeout"])
+        return not self._thread.is_alive()
+
+    # ---------------------------- 后台线程 ----------------------------
+    def _run(self):
+        while True:
+            block = self._queue.get()
+            try:
+                if block is None:
+                    if self._filled:
+                        self._write_chunk(self._chunk[: self._filled])
+                        self._chunk, self._filled = None, 0
+                    self._sync()
+                else:
+                    self._append_block(block)
+            except (OSError, ValueError) as e:
+                self.error = e
+                logging.error(f"采集日志写入失败: {str(e)}")
+            if block is None:  # 收尾写入无论成败都结束线程，close() 不会一直等待
+                return
+
+    def _append_block(self, block):
+        if self.manifest["columns"] is None:
+            self.manifest["columns"] = ["时间/s"] + [
+                f"通道{j + 1}" for j in range(block.shape[1] - 1)
+            ]
+            _write_manifest(self.directory, self.manifest)
+        if block.shape[1] != len(self.manifest["columns"]):
+            raise ValueError(f"列数与日志不符: {block.shape[1]}")
+
+        while len(block):
+            if self._chunk is None:
+                self._chunk = np.empty((self.chunk_size, block.shape[1]))
+            n = min(self.chunk_size - self._filled, len(block))
+            self._chunk[self._filled : self._filled + n] = block[:n]
+            self._filled += n
+            block = block[n:]
+            if self._filled == self.chunk_size:
+                self._write_chunk(self._chunk)
+                self._chunk, self._filled = None, 0
+
+        if len(self._unsynced) >= self.fsync_chunks:
+            self._sync()
+
+    def _write_chunk(self, chunk):
+        name = CHUNK_PATTERN.format(self._next_index)
+        path = os.path.join(self.directory, name)
+        _write_atomic(path, lambda f: np.save(f, chunk))
+        self._unsynced.append((path, _chunk_entry(name, chunk)))
+        self._next_index += 1
+        self.rows_written += len(chunk)
+
+    def _sync(self):
+        """落盘已写出的数据块并登记到清单"""
+        if not self._unsynced and os.path.exists(
+            os.path.join(self.directory, MANIFEST_NAME)
+        ):
+            return
+        for path, _ in self._unsynced:
+            _fsync_path(path)
+        self.manifest["chunks"].extend(entry for _, entry in self._unsynced)
+        self._unsynced = []
+        _write_manifest(self.directory, self.manifest)
+        self.syncs += 1
+
+    def stats(self):
+        """返回写入统计"""
+        return {
+            "已写行数": self.rows_written,
+            "数据块数": self._next_index,
+            "落盘次数": self.syncs,
+            "待写批次": self._queue.qsize(),
+        }
+
+
+class Acquisition_Log:
+    """
+    采集日志读取
+
+    各数据块以内存映射方式打开，按时间窗口读取时只访问相关数据块。
+    只读取清单中已登记的数据块，不修改目录，可在写入过程中打开；
+    崩溃后的目录需先调用 recover_log 修复。
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest = read_manifest(directory)
+        self.columns = self.manifest["columns"] or []
+        self.chunks = [
+            np.load(os.path.join(directory, entry["file"]), mmap_mode="r")
+            for entry in self.manifest["chunks"]
+        ]
+
+    def __len__(self):
+        return sum(entry["rows"] for entry in self.manifest["chunks"])
+
+    def read(self, t_start=None, t_end=None):
+        """
+        读取时间窗口 [t_start, t_end] 内的样本
+
+        返回:
+        numpy.ndarray
+            形状为 (行数, 列数)，首列为时间
+        """
+        t_start = -np.inf if t_start is None else t_start
+        t_end = np.inf if t_end is None else t_end
+        parts = []
+        for entry, chunk in zip(self.manifest["chunks"], self.chunks):
+            if entry["t_end"] < t_start or entry["t_start"] > t_end:
+                continue
+            times = chunk[:, 0]
+            lo = np.searchsorted(times, t_start, side="left")
+            hi = np.searchsorted(times, t_end, side="right")
+            parts.append(chunk[lo:hi])
+        if not parts:
+            return np.empty((0, len(self.columns)))
+        return np.concatenate(parts)
+
+    def to_dataframe(self, t_start=None, t_end=None):
+        """读取时间窗口内的样本为DataFrame"""
+        return pd.DataFrame(self.read(t_start, t_end), columns=self.columns)
+
+
+def new_log_directory(root=None):
+    """按开始时间创建新的日志目录并返回路径，同一秒内多次开始时追加序号"""
+    root = root or DATA_CONFIG["log_dir"]
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    for k in itertools.count():
+        path = os.path.join(root, stamp if k == 0 else f"{stamp}_{k}")
+        try:
+            os.makedirs(path)
+        except FileExistsError:
+            continue
+        return path
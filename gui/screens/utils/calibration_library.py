@@ -0,0 +1,111 @@
+# calibration_library.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import hashlib
+import json
+import logging
+
+from gui.screens.utils.config import DATA_CONFIG
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """计算文件内容的SHA-256哈希（只读取字节，不解析）"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Calibration_Library:
+    """
+    标定库
+
+    以源数据文件的内容哈希为键，保存拟合得到的标定结果（系数、适用范围、
+    预先计算的取值表等）。内容相同的文件无论路径和修改时间如何都命中同一条标定，
+    一个实验批次中的所有运行因此使用完全相同的曲线；文件内容一旦改变即重新标定。
+    每条标定保存为一个JSON文件，先写临时文件再原子替换。
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory or DATA_CONFIG["calibration_dir"]
+
+    def path_for(self, kind, digest):
+        """标定文件路径，kind 区分标定类型（含拟合方法，改变方法即不再命中旧标定）"""
+        return os.path.join(self.directory, f"{kind}_{digest}.json")
+
+    def load(self, kind, digest):
+        """
+        读取标定
+
+        返回:
+        dict or None
+            标定内容，不存在或已损坏时返回None
+        """
+        path = self.path_for(kind, digest)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"标定文件损坏，将重新标定: {path} ({str(e)})")
+            return None
+        if record.get("sha256") != digest:
+            logging.warning(f"标定文件与源数据哈希不符，将重新标定: {path}")
+            return None
+        return record["calibration"]
+
+    def save(self, kind, digest, calibration, source=None):
+        """保存标定（calibration 须可序列化为JSON）"""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(kind, digest)
+        record = {
+            "kind": kind,
+            "sha256": digest,
+            "source": os.path.basename(source) if source else None,
+            "calibration": calibration,
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    def get_or_create(self, kind, source_path, calibrate):
+        """
+        获取源文件对应的标定，库中没有时调用 calibrate() 生成并保存
+
+        参数:
+        kind : str
+            标定类型
+        source_path : str
+            源数据文件路径
+        calibrate : callable
+            无参数的标定函数，返回可序列化为JSON的dict
+
+        返回:
+        tuple
+            (标定内容, 内容哈希, 是否命中标定库)
+        """
+        digest = file_digest(source_path)
+        calibration = self.load(kind, digest)
+        if calibration is not None:
+            return calibration, digest, True
+
+        calibration = calibrate()
+        try:
+            self.save(kind, digest, calibration, source_path)
+        except OSError as e:
+            logging.warning(f"标定保存失败，本次运行仍使用新标定: {str(e)}")
+        return calibration, digest, False
@@ -13,6 +13,22 @@ DATA_CONFIG = {
     "time_lower_limit": 30,
     "time_upper_limit": 40,
     "std_limit": 0.005,
+    "time_interval": 500,  # 记录数据间隔（毫秒）
+    "plot_max_points": 500,  # 绘图最大点数
+    "port_timeout": 0.25,  # 串口超时时间（秒）
+    "acquisition_buffer_size": 1 << 17,  # 采集环形缓冲区容量（样本数）
+    "instrument_stale_time": 5.0,  # 仪器超过该时间（秒）无新数据时不再参与时间对齐
+    "log_dir": "acquisition_logs",  # 采集日志根目录
+    "log_chunk_size": 4096,  # 采集日志每个数据块的行数
+    "log_fsync_chunks": 4,  # 采集日志每落盘一次写出的数据块数
+    "log_close_timeout": 10.0,  # 关闭采集日志时等待写入线程的最长时间（秒）
+    "calibration_dir": "calibrations",  # 标定库目录（按源文件内容哈希保存拟合结果）
+    "export_dpi": 300,
+    "plot_cache_size": 16,  # 绘图控件缓存的显示位图数量
+    "redraw_frame_ms": 16,  # 重绘调度器的合并周期（毫秒）
+    "live_frame_ms": 50,  # 实时曲线的最短刷新间隔（毫秒）
+    "table_drain_ms": 100,  # 表格线程安全追加的批量处理周期（毫秒）
+    "table_max_rows": 2000,  # 表格线程安全追加保留的最大行数
 }
 
 SCREEN_CONFIG = {"borderwidth": 5, "relief": "raised"}
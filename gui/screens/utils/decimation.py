@@ -0,0 +1,130 @@
+# decimation.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+
+def minmax_indices(y, max_points):
+    """
+    最值分箱降采样
+
+    将序列均分为约 max_points / 2 个箱，每箱保留最小值和最大值两点（按原顺序），
+    并保留首尾两点，峰谷不会被抹平。全部为向量化运算，适合实时刷新。
+
+    返回:
+    numpy.ndarray
+        保留点的升序索引
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    n_bins = (max_points - 2) // 2
+    if n_bins < 1:  # 点数不足以分箱时均匀取点
+        return np.unique(np.linspace(0, n - 1, max_points).astype(int))
+
+    bin_size = -(-n // n_bins)  # 向上取整
+    n_bins = -(-n // bin_size)
+    padded = np.full(n_bins * bin_size, np.nan)
+    padded[:n] = y
+    bins = padded.reshape(n_bins, bin_size)
+    missing = np.isnan(bins)  # 末箱补齐部分及缺测值不参与比较
+    lowest = np.argmin(np.where(missing, np.inf, bins), axis=1)
+    highest = np.argmax(np.where(missing, -np.inf, bins), axis=1)
+
+    offsets = np.arange(n_bins)[:, None] * bin_size
+    picks = np.stack([lowest, highest], axis=1)
+    indices = np.sort(picks, axis=1) + offsets
+    indices = indices[indices < n]
+    return np.unique(np.concatenate([[0], indices, [n - 1]]))
+
+
+def lttb_indices(x, y, max_points):
+    """
+    最大三角形三桶（LTTB）降采样
+
+    每个桶中选取与上一选中点、下一桶均值点构成三角形面积最大的点，
+    保形效果优于最值分箱，但逐桶依赖上一选中点，适合导入数据等一次性绘图。
+
+    返回:
+    numpy.ndarray
+        保留点的升序索引
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+    if max_points < 3:  # 点数不足以分桶时均匀取点（2点即首尾两点）
+        return np.unique(np.linspace(0, n - 1, max(max_points, 0)).astype(int))
+
+    # 首尾两点固定，中间均分为 max_points - 2 个桶
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    means_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1) / np.diff(edges)
+    means_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1) / np.diff(edges)
+
+    indices = np.empty(max_points, dtype=int)
+    indices[0], indices[-1] = 0, n - 1
+    previous = 0
+    for k in range(max_points - 2):
+        start, stop = edges[k], edges[k + 1]
+        if k + 1 < max_points - 2:
+            next_x, next_y = means_x[k + 1], means_y[k + 1]
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.nanargmax(area)) if np.any(area == area) else start
+        indices[k + 1] = previous
+    return indices
+
+
+def decimate(x, y, max_points, method="minmax"):
+    """
+    降采样到不超过 max_points 个点
+
+    参数:
+    x, y : array_like
+        横纵坐标
+    max_points : int
+        最大点数
+    method : str
+        "minmax"（最值分箱）或 "lttb"
+
+    返回:
+    tuple
+        (降采样后的x, 降采样后的y)
+    """
+    if method == "lttb":
+        indices = lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        indices = minmax_indices(y, max_points)
+    else:
+        raise ValueError(f"未知降采样方法: {method}")
+    return np.asarray(x)[indices], np.asarray(y)[indices]
+
+
+# 测试代码
+if __name__ == "__main__":
+    x = np.linspace(0, 10, 1000)
+    y = np.sin(x) + 0.1 * np.cos(37 * x)
+    for method in ("minmax", "lttb"):
+        for max_points in range(0, 12):
+            x_dec, y_dec = decimate(x, y, max_points, method=method)
+            assert len(x_dec) <= max_points, (method, max_points, len(x_dec))
+            assert np.all(np.diff(x_dec) > 0)
+            if max_points >= 2:
+                assert x_dec[0] == x[0] and x_dec[-1] == x[-1]
+        print(method, len(decimate(x, y, 100, method=method)[0]))
@@ -0,0 +1,200 @@
+# executor_service.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import atexit
+import logging
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def _init_process_worker():
+    """进程池初始化：子进程中使用无界面的Agg后端绘图"""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+class Background_Task:
+    """
+    后台任务句柄
+
+    一个任务由若干步骤组成，每个步骤为 (函数, 执行方式)，执行方式为
+    "thread"（线程池，适合I/O）或 "process"（进程池，适合拟合、绘图等CPU密集计算）。
+    后一步骤以前一步骤的返回值为唯一参数（第一步无参数），步骤之间在Tk线程中
+    通过 after() 轮询衔接，因此所有回调都在Tk线程中执行。
+    """
+
+    def __init__(
+        self,
+        service,
+        widget,
+        steps,
+        on_success=None,
+        on_error=None,
+        on_progress=None,
+        on_cancel=None,
+        poll_ms=50,
+    ):
+        self.service = service
+        self.widget = widget
+        self.steps = list(steps)
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.poll_ms = poll_ms
+
+        self.step_index = 0
+        self.future = None
+        self.cancelled = False
+        self.finished = False
+        self._after_id = None
+
+    @property
+    def total_steps(self):
+        return len(self.steps)
+
+    def start(self):
+        """提交第一个步骤"""
+        self._submit_step(None, first=True)
+        return self
+
+    def cancel(self):
+        """
+        取消任务
+
+        尚未开始的步骤不再执行；正在运行的步骤无法中断，其结果将被丢弃。
+        """
+        if self.finished:
+            return
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+        self._finish()
+        if self.on_cancel:
+            self.on_cancel()
+
+    def _submit_step(self, previous_result, first=False):
+        func, kind = self.steps[self.step_index]
+        args = () if first else (previous_result,)
+        self.future = self.service.executor(kind).submit(func, *args)
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        self._after_id = self.widget.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        """在Tk线程中检查当前步骤是否完成"""
+        self._after_id = None
+        if self.cancelled:
+            return
+        if not self.future.done():
+            self._schedule_poll()
+            return
+
+        try:
+            result = self.future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            self._finish()
+            if self.on_error:
+                self.on_error(e)
+            else:
+                logging.error(f"后台任务失败: {str(e)}")
+            return
+
+        self.step_index += 1
+        if self.on_progress:
+            self.on_progress(self.step_index, self.total_steps)
+
+        if self.step_index < self.total_steps:
+            self._submit_step(result)
+        else:
+            self._finish()
+            if self.on_success:
+                self.on_success(result)
+
+    def _finish(self):
+        self.finished = True
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+
+class Executor_Service:
+    """
+    全局共享的后台执行服务
+
+    线程池与进程池在首次使用时创建，程序退出时统一关闭。
+    """
+
+    _shared = None
+
+    def __init__(self, max_threads=4, max_processes=None):
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self._thread_pool = None
+        self._process_pool = None
+
+    @classmethod
+    def shared(cls):
+        """获取全局共享实例"""
+        if cls._shared is None:
+            cls._shared = cls()
+            atexit.register(cls._shared.shutdown)
+        return cls._shared
+
+    def executor(self, kind="thread"):
+        """按执行方式获取线程池或进程池"""
+        if kind == "process":
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_processes, initializer=_init_process_worker
+                )
+            return self._process_pool
+        if kind == "thread":
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_threads, thread_name_prefix="chemlabx"
+                )
+            return self._thread_pool
+        raise ValueError(f"未知执行方式: {kind}")
+
+    def submit(self, widget, steps, **callbacks):
+        """
+        提交后台任务
+
+        参数:
+        widget : tkinter.Misc
+            用于 after() 轮询的Tk控件
+        steps : list
+            [(函数, "thread" | "process"), ...]
+        callbacks :
+            on_success / on_error / on_progress / on_cancel / poll_ms
+
+        返回:
+        Background_Task
+            任务句柄，可调用 cancel() 取消
+        """
+        return Background_Task(self, widget, steps, **callbacks).start()
+
+    def shutdown(self, wait=False):
+        """关闭线程池和进程池，未开始的任务将被取消"""
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+        self._thread_pool = None
+        self._process_pool = None
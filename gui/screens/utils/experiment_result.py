@@ -0,0 +1,79 @@
+# experiment_result.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+
+class Experiment_Result:
+    """
+    单次实验处理的共享结果
+
+    处理器登记各计算阶段（名称、计算函数、依赖的阶段），计算器、绘图器和界面
+    按名称取用结果：每个阶段在第一次取用时计算一次，之后始终返回同一对象的引用，
+    不再复制或重算。计算函数应为可序列化的绑定方法或模块级函数，
+    以便结果随处理器在进程池与主进程之间传递。
+    """
+
+    def __init__(self):
+        self._stages = {}  # {阶段名: (计算函数, 依赖阶段)}
+        self._values = {}
+        self.compute_counts = {}  # {阶段名: 计算次数}，用于检查是否重复计算
+
+    def stage(self, name, compute, depends=()):
+        """
+        登记计算阶段
+
+        参数:
+        name : str
+            阶段名
+        compute : callable
+            计算函数，按 depends 的顺序接收各依赖阶段的结果
+        depends : tuple
+            依赖的阶段名
+        """
+        for dependency in depends:
+            if dependency not in self._stages and dependency not in self._values:
+                raise KeyError(f"未登记的依赖阶段: {dependency}")
+        self._stages[name] = (compute, tuple(depends))
+        self.invalidate(name)
+        return self
+
+    def set(self, name, value):
+        """直接写入已计算好的结果"""
+        self.invalidate(name)
+        self._values[name] = value
+        return value
+
+    def get(self, name):
+        """获取阶段结果，尚未计算时先计算其依赖和自身"""
+        if name in self._values:
+            return self._values[name]
+        if name not in self._stages:
+            raise KeyError(f"未登记的阶段: {name}")
+
+        compute, depends = self._stages[name]
+        value = compute(*(self.get(dependency) for dependency in depends))
+        self._values[name] = value
+        self.compute_counts[name] = self.compute_counts.get(name, 0) + 1
+        return value
+
+    __getitem__ = get
+
+    def __contains__(self, name):
+        """阶段是否已有结果"""
+        return name in self._values
+
+    def invalidate(self, name):
+        """丢弃阶段结果及所有依赖它的阶段的结果（参数变化后调用）"""
+        self._values.pop(name, None)
+        for other, (_, depends) in self._stages.items():
+            if name in depends and other in self._values:
+                self.invalidate(other)
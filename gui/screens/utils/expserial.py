@@ -11,6 +11,310 @@ project_root = os.path.dirname(
 )
 sys.path.insert(0, project_root)
 
+import time
+import numpy as np
+from numpy.lib import recfunctions
+
+FIELD_VOTE_LINES = 2  # 省略 fields 时，确定字段数至少需要的字段数一致的行数
+
 
 class Experiment_Serial:
-    pass
+    """
+    实验仪器串口协议解析
+
+    支持两种帧格式，均对整块读取缓冲区一次性解析为NumPy结构化数组：
+    - "binary": 帧头 + 定长数据区 + 1字节校验和（数据区各字节之和取低8位），
+      数据区按 fields 描述的类型紧凑排列，用 np.frombuffer 直接解码；
+    - "ascii": 每行一帧，字段以 delimiter 分隔，批量切分后统一转换为数值。
+    帧头不匹配或校验失败时逐字节向后寻找下一个帧头重新同步，
+    跳过的字节和丢弃的帧计入统计。
+    """
+
+    def __init__(
+        self,
+        fields=None,
+        mode="ascii",
+        header=b"\xaa\x55",
+        checksum=True,
+        delimiter=b",",
+        byteorder="<",
+    ):
+        """
+        参数:
+        fields : list, optional
+            [(字段名, 类型)]，类型为NumPy类型码（如 "f4"、"u2"）；
+            ascii 模式下可为字段名列表或省略（由一批数据中最常见的字段数确定，
+            均按浮点数解析）
+        mode : str
+            "binary" 或 "ascii"
+        header : bytes
+            二进制帧头
+        checksum : bool
+            二进制帧是否带校验和
+        delimiter : bytes
+            ascii 字段分隔符
+        byteorder : str
+            二进制数据字节序，"<" 为小端，">" 为大端
+        """
+        if mode not in ("binary", "ascii"):
+            raise ValueError(f"未知帧格式: {mode}")
+        if mode == "binary" and not fields:
+            raise ValueError("二进制帧必须指定字段类型")
+
+        self.mode = mode
+        self.header = bytes(header)
+        self.checksum = checksum
+        self.delimiter = delimiter
+        self.dtype = None
+        if fields:
+            self._set_fields(fields, byteorder)
+
+        # 统计计数
+        self.frames = 0  # 解析成功的帧数
+        self.bytes_parsed = 0  # 已消费的字节数
+        self.dropped = 0  # 丢弃的帧数
+        self.resync_bytes = 0  # 重新同步时跳过的字节数
+        self.parse_time = 0.0  # 累计解析耗时
+        self._first_parse = None
+
+    def _set_fields(self, fields, byteorder="<"):
+        if self.mode == "ascii":
+            names = [f if isinstance(f, str) else f[0] for f in fields]
+            self.dtype = np.dtype([(name, "f8") for name in names])
+        else:
+            self.dtype = np.dtype(
+                [
+                    (name, np.dtype(kind).newbyteorder(byteorder))
+                    for name, kind in fields
+                ]
+            )
+
+    @property
+    def frame_size(self):
+        """二进制帧总长度（字节）"""
+        return len(self.header) + self.dtype.itemsize + int(self.checksum)
+
+    # ---------------------------- 解析接口 ----------------------------
+    def parse(self, buffer):
+        """
+        解析一块读取缓冲区
+
+        参数:
+        buffer : bytes
+            读取到的字节，可包含多个完整帧和末尾的不完整帧
+
+        返回:
+        tuple
+            (结构化数组, 剩余字节, 本次丢弃的帧数)，剩余字节应拼接到下次读取的数据前
+        """
+        start = time.perf_counter()
+        if self._first_parse is None:
+            self._first_parse = start
+
+        if self.mode == "binary":
+            records, remainder, dropped = self._parse_binary(buffer)
+        else:
+            records, remainder, dropped = self._parse_ascii(buffer)
+
+        self.frames += len(records)
+        self.dropped += dropped
+        self.bytes_parsed += len(buffer) - len(remainder)
+        self.parse_time += time.perf_counter() - start
+        return records, remainder, dropped
+
+    def parse_samples(self, buffer):
+        """
+        解析为二维浮点数组，可直接作为 Serial_Acquisition 的解析函数
+
+        返回:
+        tuple
+            (样本数组(帧数, 字段数), 剩余字节, 本次丢弃的帧数)
+        """
+        records, remainder, dropped = self.parse(buffer)
+        if self.dtype is None:
+            return np.empty((0, 0)), remainder, dropped
+        samples = recfunctions.structured_to_unstructured(records, dtype=float)
+        return samples, remainder, dropped
+
+    def build_frames(self, values):
+        """
+        将数据编码为帧字节流（用于仪器模拟和联调）
+
+        参数:
+        values : array_like
+            结构化数组或二维数组（帧数, 字段数）
+        """
+        values = np.asarray(values)
+        if self.dtype is None:
+            self._set_fields([f"通道{j + 1}" for j in range(np.shape(values)[-1])])
+        if values.dtype.names is None:
+            values = recfunctions.unstructured_to_structured(
+                np.atleast_2d(values), dtype=self.dtype
+            )
+        records = values.astype(self.dtype)
+
+        if self.mode == "ascii":
+            delimiter = self.delimiter.decode()
+            lines = [
+                delimiter.join(repr(float(v)) for v in record) for record in records
+            ]
+            return ("\n".join(lines) + "\n").encode()
+
+        payload = np.frombuffer(records.tobytes(), dtype=np.uint8).reshape(
+            len(records), -1
+        )
+        parts = [np.tile(np.frombuffer(self.header, dtype=np.uint8), (len(records), 1))]
+        parts.append(payload)
+        if self.checksum:
+            parts.append((payload.sum(axis=1) & 0xFF).astype(np.uint8)[:, None])
+        return np.hstack(parts).tobytes()
+
+    # ---------------------------- 二进制帧 ----------------------------
+    def _frame_bytes(self, data, starts):
+        """按起始位置取出各帧字节，返回 (帧数, 帧长度) 数组"""
+        return data[starts[:, None] + np.arange(self.frame_size)]
+
+    def _valid_frames(self, frames):
+        """校验帧头和校验和"""
+        n_header = len(self.header)
+        valid = np.all(
+            frames[:, :n_header] == np.frombuffer(self.header, dtype=np.uint8), axis=1
+        )
+        if self.checksum:
+            payload = frames[:, n_header:-1]
+            valid &= (payload.sum(axis=1) & 0xFF) == frames[:, -1]
+        return valid
+
+    def _decode(self, frames):
+        """将有效帧的数据区解码为结构化数组"""
+        n_header = len(self.header)
+        payload = frames[:, n_header : n_header + self.dtype.itemsize]
+        return np.ascontiguousarray(payload).view(self.dtype).ravel()
+
+    def _parse_binary(self, buffer):
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        size = self.frame_size
+        n_frames = len(data) // size
+
+        # 快速路径：数据与帧边界对齐且全部有效
+        if n_frames:
+            frames = data[: n_frames * size].reshape(n_frames, size)
+            if self._valid_frames(frames).all():
+                return self._decode(frames), buffer[n_frames * size :], 0
+
+        # 重新同步：在所有帧头候选位置上批量校验，再按顺序选取互不重叠的有效帧
+        n_header = len(self.header)
+        candidates = np.arange(max(len(data) - n_header + 1, 0))
+        for k, byte in enumerate(self.header):
+            candidates = candidates[data[candidates + k] == byte]
+        complete = candidates[candidates + size <= len(data)]
+        valid = complete[self._valid_frames(self._frame_bytes(data, complete))]
+
+        starts, end, dropped = [], 0, 0
+        for position in valid:
+            if position < end:
+                continue
+            if position > end:
+                dropped += 1  # 一段无法解析的字节按一帧丢弃计
+                self.resync_bytes += int(position - end)
+            starts.append(position)
+            end = position + size
+        starts = np.asarray(starts, dtype=int)
+
+        # 剩余字节从最后一个有效帧之后的第一个不完整帧头开始
+        pending = candidates[(candidates >= end) & (candidates + size > len(data))]
+        if len(pending):
+            tail = int(pending[0])
+        else:
+            tail = max(end, len(data) - n_header + 1)
+        if tail > end:
+            dropped += 1
+            self.resync_bytes += int(tail - end)
+
+        records = (
+            self._decode(self._frame_bytes(data, starts))
+            if len(starts)
+            else np.empty(0, dtype=self.dtype)
+        )
+        return records, buffer[tail:], dropped
+
+    # ---------------------------- ASCII帧 ----------------------------
+    def _parse_ascii(self, buffer):
+        lines = buffer.replace(b"\r", b"").split(b"\n")
+        remainder = lines.pop()
+        lines = [line for line in lines if line.strip()]
+        if not lines:
+            empty = np.empty(0, dtype=self.dtype) if self.dtype else np.empty(0)
+            return empty, remainder, 0
+
+        if self.dtype is None:
+            n_fields = self._vote_fields(lines)
+            if n_fields is None:
+                return np.empty(0), buffer, 0  # 整块保留，等待更多行再确定字段数
+            self._set_fields([f"通道{j + 1}" for j in range(n_fields)])
+        n_fields = len(self.dtype.names)
+
+        # 按分隔符数量批量筛除字段数不符的行
+        array = np.array(lines)
+        good = np.char.count(array, self.delimiter) == n_fields - 1
+        dropped = int(len(array) - good.sum())
+        array = array[good]
+
+        values, n_bad = self._convert_lines(array, n_fields)
+        dropped += n_bad
+
+        records = recfunctions.unstructured_to_structured(values, dtype=self.dtype)
+        return records, remainder, dropped
+
+    def _vote_fields(self, lines):
+        """
+        按各行分隔符数量投票确定字段数
+
+        中途接入串口时第一行通常不完整，因此取出现次数最多的字段数（并列时取
+        较多者），且至少有 FIELD_VOTE_LINES 行一致才确定，否则返回None。
+        """
+        counts = np.char.count(np.array(lines), self.delimiter)
+        votes = np.bincount(counts)
+        n_fields = len(votes) - int(np.argmax(votes[::-1]))
+        if votes[n_fields - 1] < FIELD_VOTE_LINES:
+            return None
+        return n_fields
+
+    def _convert_lines(self, lines, n_fields):
+        """
+        将若干行一次性切分并转换为 (行数, 字段数) 浮点数组
+
+        存在无法转换的字段时二分定位坏行，转换次数只随坏行数对数增长。
+
+        返回:
+        tuple
+            (浮点数组, 丢弃行数)
+        """
+        if len(lines) == 0:
+            return np.empty((0, n_fields)), 0
+        tokens = self.delimiter.join(lines.tolist()).split(self.delimiter)
+        try:
+            return np.array(tokens, dtype=float).reshape(len(lines), n_fields), 0
+        except ValueError:
+            if len(lines) == 1:
+                return np.empty((0, n_fields)), 1
+        half = len(lines) // 2
+        head, bad_head = self._convert_lines(lines[:half], n_fields)
+        tail, bad_tail = self._convert_lines(lines[half:], n_fields)
+        return np.vstack([head, tail]), bad_head + bad_tail
+
+    # ---------------------------- 统计 ----------------------------
+    def stats(self):
+        """返回解析统计"""
+        elapsed = time.perf_counter() - self._first_parse if self._first_parse else 0
+        return {
+            "帧数": self.frames,
+            "字节数": self.bytes_parsed,
+            "丢弃帧数": self.dropped,
+            "重同步字节数": self.resync_bytes,
+            "解析耗时/s": self.parse_time,
+            "吞吐量/(帧/s)": self.frames / elapsed if elapsed else 0.0,
+            "解析速率/(帧/s)": (
+                self.frames / self.parse_time if self.parse_time else 0.0
+            ),
+        }
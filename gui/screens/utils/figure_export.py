@@ -0,0 +1,90 @@
+# figure_export.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import io
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def detach_figure(fig=None):
+    """
+    将图形从pyplot管理中移除并返回Figure对象
+
+    移除后的Figure不再占用pyplot窗口，可直接交给PlotWidget显示，
+    也可在进程池中序列化后传回主进程。
+
+    参数:
+    fig : matplotlib.figure.Figure, optional
+        待移除的图形，默认为当前图形
+    """
+    if fig is None:
+        fig = plt.gcf()
+    plt.close(fig)
+    return fig
+
+
+def save_figure(fig, save_path, dpi=300, **kwargs):
+    """
+    显式导出图形为图片文件
+
+    参数:
+    fig : matplotlib.figure.Figure
+        待导出的图形
+    save_path : str or Path
+        保存路径，所在目录不存在时自动创建
+    dpi : int
+        导出分辨率
+
+    返回:
+    str
+        保存路径
+    """
+    directory = os.path.dirname(str(save_path))
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fig.savefig(save_path, dpi=dpi, **kwargs)
+    return str(save_path)
+
+
+def save_figures(figures, output_dir, dpi=300, **kwargs):
+    """
+    批量导出图形
+
+    参数:
+    figures : dict
+        {文件名(不含扩展名): Figure}
+    output_dir : str or Path
+        输出目录
+
+    返回:
+    list
+        各图片的保存路径，顺序与figures一致
+    """
+    return [
+        save_figure(fig, os.path.join(str(output_dir), f"{name}.png"), dpi, **kwargs)
+        for name, fig in figures.items()
+    ]
+
+
+def figure_to_array(fig, dpi=150):
+    """
+    在内存中将图形栅格化为RGBA数组，用于拼接整合图，无需PNG编解码
+
+    返回:
+    numpy.ndarray
+        形状为 (高, 宽, 4) 的uint8数组
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="rgba", dpi=dpi)
+    width = int(fig.get_figwidth() * dpi)
+    return np.frombuffer(buffer.getvalue(), dtype=np.uint8).reshape(-1, width, 4)
@@ -0,0 +1,202 @@
+# plateau_detector.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import math
+from collections import deque
+
+from gui.screens.utils.config import DATA_CONFIG
+
+
+class Plateau_Detector:
+    """
+    流式平台期（稳态）检测器
+
+    在线维护一个时间窗口内的均值和方差（Welford算法，支持加入和移出样本），
+    每个样本的更新代价为均摊 O(1)：
+    - 窗口长度超过 time_upper_limit 时从左侧移出旧样本；
+    - 窗口标准差超过 std_limit 时从左侧收缩，直到重新满足阈值；
+    - 窗口跨度达到 time_lower_limit 且标准差不超过阈值时判定进入平台期，
+      之后新样本使标准差超限时判定平台期结束。
+    平台期整体的均值和标准差另用只增不减的累加量统计，不受窗口长度限制。
+    """
+
+    def __init__(self, std_limit=None, time_lower_limit=None, time_upper_limit=None):
+        self.std_limit = DATA_CONFIG["std_limit"] if std_limit is None else std_limit
+        self.time_lower_limit = (
+            DATA_CONFIG["time_lower_limit"]
+            if time_lower_limit is None
+            else time_lower_limit
+        )
+        self.time_upper_limit = (
+            DATA_CONFIG["time_upper_limit"]
+            if time_upper_limit is None
+            else time_upper_limit
+        )
+        if self.time_upper_limit < self.time_lower_limit:
+            raise ValueError("平台期最大时间窗口不能小于最小时间窗口")
+        self.reset()
+
+    def reset(self):
+        """清空窗口和平台期状态"""
+        self.window = deque()  # [(时间, 数值)]
+        self._n, self._mean, self._m2 = 0, 0.0, 0.0
+        self.in_plateau = False
+        self._plateau = None  # [开始时间, 结束时间, 样本数, 均值, M2]
+
+    # ---------------------------- 窗口统计 ----------------------------
+    def _add(self, t, x):
+        self.window.append((t, x))
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (x - self._mean)
+
+    def _remove_oldest(self):
+        _, x = self.window.popleft()
+        self._n -= 1
+        if self._n == 0:
+            self._mean, self._m2 = 0.0, 0.0
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._n
+        self._m2 = max(self._m2 - delta * (x - self._mean), 0.0)
+
+    @property
+    def std(self):
+        """窗口内样本标准差"""
+        return math.sqrt(self._m2 / (self._n - 1)) if self._n > 1 else 0.0
+
+    @property
+    def span(self):
+        """窗口时间跨度"""
+        return self.window[-1][0] - self.window[0][0] if self.window else 0.0
+
+    # ---------------------------- 更新接口 ----------------------------
+    def update(self, t, x):
+        """
+        加入一个样本，时间或数值为NaN/inf的样本（如传感器掉线）直接跳过，
+        不进入窗口统计
+
+        返回:
+        dict or None
+            触发平台期开始或结束时返回事件，否则返回None
+        """
+        if not (math.isfinite(t) and math.isfinite(x)):
+            return None
+        event = None
+        self._add(t, x)
+        while self.window and t - self.window[0][0] > self.time_upper_limit:
+            self._remove_oldest()
+
+        if self.std > self.std_limit:
+            if self.in_plateau:
+                event = self._end_plateau()
+            while self._n > 1 and self.std > self.std_limit:
+                self._remove_oldest()
+
+        if self.in_plateau:
+            self._extend_plateau(t, x)
+        elif event is None and self.span >= self.time_lower_limit:
+            event = self._start_plateau()
+        return event
+
+    def update_batch(self, times, values):
+        """
+        依次加入一批样本
+
+        返回:
+        list
+            本批样本触发的事件（非有限值样本被跳过）
+        """
+        events = []
+        for t, x in zip(times, values):
+            event = self.update(float(t), float(x))
+            if event is not None:
+                events.append(event)
+        return events
+
+    def finish(self):
+        """数据结束时关闭未结束的平台期"""
+        return self._end_plateau() if self.in_plateau else None
+
+    # ---------------------------- 平台期事件 ----------------------------
+    def _start_plateau(self):
+        self.in_plateau = True
+        self._plateau = [self.window[0][0], self.window[-1][0], 0, 0.0, 0.0]
+        for t, x in self.window:
+            self._extend_plateau(t, x)
+        return self._event("开始")
+
+    def _extend_plateau(self, t, x):
+        plateau = self._plateau
+        plateau[1] = t
+        plateau[2] += 1
+        delta = x - plateau[3]
+        plateau[3] += delta / plateau[2]
+        plateau[4] += delta * (x - plateau[3])
+
+    def _end_plateau(self):
+        self.in_plateau = False
+        return self._event("结束")
+
+    def _event(self, kind):
+        start, end, n, mean, m2 = self._plateau
+        return {
+            "事件": kind,
+            "开始时间": start,
+            "结束时间": end,
+            "样本数": n,
+            "均值": mean,
+            "标准差": math.sqrt(m2 / (n - 1)) if n > 1 else 0.0,
+        }
+
+
+def find_plateaus(times, values, **limits):
+    """
+    在完整时间序列中查找全部平台期
+
+    参数:
+    times, values : array_like
+        时间和数值序列
+    limits :
+        std_limit / time_lower_limit / time_upper_limit，默认取 DATA_CONFIG
+
+    返回:
+    list
+        各平台期的结束事件（含开始时间、结束时间、样本数、均值、标准差）
+    """
+    detector = Plateau_Detector(**limits)
+    events = detector.update_batch(times, values)
+    last = detector.finish()
+    if last is not None:
+        events.append(last)
+    return [event for event in events if event["事件"] == "结束"]
+
+
+# 测试代码
+if __name__ == "__main__":
+    import numpy as np
+
+    t = np.arange(0.0, 300.0)
+    y = np.where(t < 100, t, 100.0) + 0.01 * np.sin(t)
+    plateaus = find_plateaus(t, y, std_limit=0.1, time_lower_limit=30)
+    assert len(plateaus) == 1 and abs(plateaus[0]["均值"] - 100.0) < 0.1
+
+    # 非有限值样本被跳过，不破坏窗口统计
+    y_nan = y.copy()
+    y_nan[[150, 151, 220]] = [np.nan, np.inf, np.nan]
+    plateaus_nan = find_plateaus(t, y_nan, std_limit=0.1, time_lower_limit=30)
+    assert len(plateaus_nan) == 1
+    assert math.isfinite(plateaus_nan[0]["均值"])
+    assert plateaus_nan[0]["样本数"] == plateaus[0]["样本数"] - 3
+    print(plateaus_nan[0])
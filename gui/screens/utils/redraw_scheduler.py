@@ -0,0 +1,109 @@
+# redraw_scheduler.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import logging
+import tkinter as tk
+from collections import OrderedDict
+
+from gui.screens.utils.config import DATA_CONFIG
+
+
+class Redraw_Scheduler:
+    """
+    全局重绘调度器
+
+    窗口拖动时 <Configure> 事件会连续触发，调度器将同一帧内的重绘请求
+    按键合并（同键只保留最后一次回调），每帧最多执行一次；目标控件不可见
+    （所在屏幕已隐藏）时直接跳过，由控件重新显示时再次请求。
+    """
+
+    _shared = None
+
+    def __init__(self, frame_ms=None):
+        self.frame_ms = frame_ms or DATA_CONFIG["redraw_frame_ms"]
+        self.pending = OrderedDict()  # {键: (控件, 回调)}
+        self._after_id = None
+        self._root = None
+
+        # 统计计数
+        self.requested = 0  # 请求次数
+        self.executed = 0  # 实际执行次数
+        self.skipped = 0  # 因控件隐藏或已销毁而跳过的次数
+
+    @classmethod
+    def shared(cls):
+        """获取全局共享实例"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def request(self, widget, callback, key=None):
+        """
+        请求在下一帧执行重绘
+
+        参数:
+        widget : tkinter.Misc
+            重绘目标控件，用于可见性判断
+        callback : callable
+            重绘回调
+        key : hashable, optional
+            合并键，默认为目标控件
+        """
+        self.requested += 1
+        self.pending[widget if key is None else key] = (widget, callback)
+        if self._after_id is None:
+            # 使用顶层窗口注册定时器，避免目标控件销毁后定时器失效
+            self._root = widget.winfo_toplevel()
+            self._after_id = self._root.after(self.frame_ms, self._flush)
+
+    def _flush(self):
+        """执行本帧内合并后的重绘请求"""
+        self._after_id = None
+        pending, self.pending = self.pending, OrderedDict()
+        for widget, callback in pending.values():
+            if not self._is_visible(widget):
+                self.skipped += 1
+                continue
+            self.executed += 1
+            try:
+                callback()
+            except Exception as e:
+                logging.error(f"重绘失败: {str(e)}")
+
+    @staticmethod
+    def _is_visible(widget):
+        """控件及其所有上级均已映射时才需要重绘"""
+        try:
+            return bool(widget.winfo_exists()) and bool(widget.winfo_viewable())
+        except tk.TclError:
+            return False
+
+    def cancel(self):
+        """取消所有未执行的请求"""
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        self.pending.clear()
+
+    def stats(self):
+        """返回重绘统计"""
+        merged = self.requested - self.executed - self.skipped - len(self.pending)
+        return {
+            "请求次数": self.requested,
+            "执行次数": self.executed,
+            "跳过次数": self.skipped,
+            "合并次数": merged,
+        }
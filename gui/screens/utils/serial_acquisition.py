@@ -0,0 +1,269 @@
+# serial_acquisition.py
+
+# 内置库
+import sys
+import os
+
+# 动态获取路径
+current_script_path = os.path.abspath(__file__)
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_script_path)))
+)
+sys.path.insert(0, project_root)
+
+import logging
+import threading
+import time
+import numpy as np
+import serial
+
+from gui.screens.utils.config import DATA_CONFIG
+from gui.screens.utils.expserial import Experiment_Serial
+
+
+class Ring_Buffer:
+    """
+    预分配的单生产者/单消费者环形缓冲区
+
+    数据区按两倍容量分配，每个样本同时写入 i 和 i + 容量 两个位置，
+    因此任意不超过容量的最近窗口在内存中都是连续的，读取时直接返回视图而不复制。
+    写入线程先写数据再更新写入计数，读取方只依据写入计数确定窗口，无需加锁；
+    视图在写入方绕回一圈后会被覆盖，消费者应在容量对应的时间内处理完毕。
+    """
+
+    SNAPSHOT_MARGIN = 0.1  # snapshot() 窗口比容量少的比例
+
+    def __init__(self, capacity, n_channels=None):
+        self.capacity = int(capacity)
+        self.times = np.zeros(2 * self.capacity)
+        self.data = None
+        self.written = 0  # 累计写入样本数
+        if n_channels:
+            self._allocate(n_channels)
+
+    @property
+    def n_channels(self):
+        return 0 if self.data is None else self.data.shape[1]
+
+    def _allocate(self, n_channels):
+        self.data = np.zeros((2 * self.capacity, n_channels))
+
+    def write(self, times, samples):
+        """
+        批量写入样本（仅由采集线程调用）
+
+        返回:
+        bool
+            通道数与缓冲区不一致时返回False，样本不写入
+        """
+        if self.data is None:
+            self._allocate(samples.shape[1])
+        if samples.shape[1] != self.n_channels:
+            return False
+
+        n_total = len(samples)
+        if n_total > self.capacity:  # 只保留最后一圈
+            times, samples = times[-self.capacity :], samples[-self.capacity :]
+
+        start = (self.written + n_total - len(samples)) % self.capacity
+        index = (start + np.arange(len(samples))) % self.capacity
+        for offset in (0, self.capacity):
+            self.times[index + offset] = times
+            self.data[index + offset] = samples
+        self.written += n_total
+        return True
+
+    def latest(self, n):
+        """
+        获取最近 n 个样本的视图
+
+        返回:
+        tuple
+            (时间数组, 样本数组)，均为缓冲区的视图
+        """
+        written = self.written
+        n = min(n, written, self.capacity)
+        if self.data is None or n <= 0:
+            return self.times[:0], np.empty((0, self.n_channels))
+        start = (written - n) % self.capacity
+        return self.times[start : start + n], self.data[start : start + n]
+
+    def snapshot(self, n):
+        """
+        复制最近 n 个样本（最多为容量减去余量）
+
+        视图会被写入方覆盖，需要保留到稍后（如 after() 回调中）使用的窗口应复制。
+        窗口比容量少 SNAPSHOT_MARGIN，复制期间写入方继续写入也不会立即覆盖窗口；
+        若复制期间写入过多，丢弃已被覆盖的最旧部分。
+
+        返回:
+        tuple
+            (时间数组, 样本数组)，均为副本
+        """
+        written = self.written
+        times, data, _ = self._copy(written - n, written)
+        return times, data
+
+    def snapshot_since(self, first):
+        """
+        复制累计序号 first 以来的样本（最多为容量减去余量），只复制所需部分
+
+        返回:
+        tuple
+            (时间数组, 样本数组, 第一个样本的累计序号)，均为副本
+        """
+        return self._copy(first, self.written)
+
+    def _copy(self, first, written):
+        """复制累计序号 [first, written) 的样本"""
+        margin = max(int(self.capacity * self.SNAPSHOT_MARGIN), 1)
+        first = max(first, written - (self.capacity - margin), 0)
+        n = written - first
+        if self.data is None or n <= 0:
+            return self.times[:0].copy(), np.empty((0, self.n_channels)), written
+        start = first % self.capacity
+        times = self.times[start : start + n].copy()
+        data = self.data[start : start + n].copy()
+        overwritten = self.written - written - (self.capacity - n)
+        if overwritten > 0:
+            times, data = times[overwritten:], data[overwritten:]
+            first += overwritten
+        return times, data, first
+
+    def read_since(self, cursor):
+        """
+        获取自 cursor 以来写入的样本视图
+
+        返回:
+        tuple
+            (时间数组, 样本数组, 新游标, 已被覆盖而未读取的样本数)
+        """
+        written = self.written
+        lost = max(0, written - cursor - self.capacity)
+        cursor += lost
+        n = written - cursor
+        if self.data is None or n <= 0:
+            return self.times[:0], np.empty((0, self.n_channels)), written, lost
+        start = cursor % self.capacity
+        return (
+            self.times[start : start + n],
+            self.data[start : start + n],
+            written,
+            lost,
+        )
+
+
+class Serial_Acquisition:
+    """
+    后台串口采集
+
+    独立的读取线程每次取出串口缓冲区中全部已到达的字节，批量解析后写入
+    Ring_Buffer；Tk线程通过 poll() 定时获取新样本的视图，读取线程不接触任何控件。
+    无数据时读取阻塞至串口超时（DATA_CONFIG["port_timeout"]），既不空转也能及时响应停止。
+    """
+
+    MAX_PENDING_BYTES = 1 << 16  # 无法组成完整帧的残留字节上限
+
+    def __init__(self, serial_connection, parser=None, capacity=None, n_channels=None):
+        """
+        参数:
+        serial_connection : serial.Serial
+            已打开的串口
+        parser : callable, optional
+            解析函数 parser(bytes) -> (样本数组, 剩余字节, 丢弃样本数)，
+            默认为按行解析ASCII帧的 Experiment_Serial().parse_samples
+        capacity : int, optional
+            环形缓冲区容量，默认为 DATA_CONFIG["acquisition_buffer_size"]
+        n_channels : int, optional
+            通道数，默认由第一批样本确定
+        """
+        self.serial = serial_connection
+        self.parser = parser or Experiment_Serial(mode="ascii").parse_samples
+        self.buffer = Ring_Buffer(
+            capacity or DATA_CONFIG["acquisition_buffer_size"], n_channels
+        )
+
+        self.error = None
+        self.start_time = None
+        self._cursor = 0
+        self._thread = None
+        self._stop_event = threading.Event()
+
+        # 统计计数
+        self.bytes_read = 0  # 接收字节数
+        self.dropped = 0  # 解析失败或通道数不符而丢弃的样本数
+        self.overruns = 0  # 消费者落后超过一圈的次数
+        self.overrun_samples = 0  # 因落后而未读取即被覆盖的样本数
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """启动读取线程"""
+        if self.running:
+            return self
+        self.serial.timeout = DATA_CONFIG["port_timeout"]
+        self.start_time = time.monotonic()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="chemlabx-serial", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """停止读取线程，最多等待一个串口超时周期"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout or DATA_CONFIG["port_timeout"] * 4)
+
+    def _run(self):
+        """读取线程主循环"""
+        pending = b""
+        while not self._stop_event.is_set():
+            try:
+                chunk = self.serial.read(self.serial.in_waiting or 1)
+            except (serial.SerialException, OSError) as e:
+                self.error = e
+                logging.error(f"串口读取失败: {str(e)}")
+                break
+            if not chunk:
+                continue
+
+            arrived = time.monotonic() - self.start_time
+            self.bytes_read += len(chunk)
+            samples, pending, dropped = self.parser(pending + chunk)
+            self.dropped += dropped
+            if len(pending) > self.MAX_PENDING_BYTES:
+                pending = b""
+                self.dropped += 1
+
+            if len(samples):
+                times = np.full(len(samples), arrived)
+                if not self.buffer.write(times, samples):
+                    self.dropped += len(samples)
+
+    def poll(self):
+        """
+        获取上次调用以来的新样本（在Tk线程中调用）
+
+        返回:
+        tuple
+            (时间数组, 样本数组)，均为缓冲区的视图
+        """
+        times, samples, self._cursor, lost = self.buffer.read_since(self._cursor)
+        if lost:
+            self.overruns += 1
+            self.overrun_samples += lost
+        return times, samples
+
+    def stats(self):
+        """返回采集统计"""
+        return {
+            "接收字节数": self.bytes_read,
+            "采样数": self.buffer.written,
+            "丢弃样本数": self.dropped,
+            "溢出次数": self.overruns,
+            "溢出样本数": self.overrun_samples,
+        }
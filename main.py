@@ -20,6 +20,7 @@
     time_upper_limit: 自动寻找平台期的最大时间窗口
     width_height_inches: 保存图片尺寸，单位英尺
     dpi: 保存图片DPI
+    max_live_screens: 同时保留的界面实例上限，超出后回收最久未使用的界面，None表示不回收
 
 内置库:
     csv
@@ -35,6 +36,7 @@
 import sys
 import os
 import shutil
+import multiprocessing
 import numexpr as ne
 
 ne.set_num_threads(8)  # 设置 numexpr 使用的线程数
@@ -57,6 +59,7 @@ time_lower_limit = 30  # 自动寻找平台期的最小时间窗口
 time_upper_limit = 40  # 自动寻找平台期的最大时间窗口
 width_height_inches = (10, 6)  # 保存图片尺寸，单位英尺
 dpi = 600  # 保存图片DPI
+max_live_screens = 3  # 同时保留的界面实例上限，None表示不回收
 
 
 def clear_pycache(root_dir="."):
@@ -70,6 +73,8 @@ def clear_pycache(root_dir="."):
 
 
 if __name__ == "__main__":
+    # 打包为可执行文件时，后台进程池需要该调用
+    multiprocessing.freeze_support()
 
     # 获取当前路径
     # 如果是pyinstaller打包的exe文件，则获取可执行文件所在目录的绝对路径
@@ -95,6 +100,7 @@ if __name__ == "__main__":
         width_height_inches,
         dpi,
         py_path,
+        max_live_screens,
     )
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
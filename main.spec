@@ -5,7 +5,18 @@ a = Analysis(
     pathex=['E:\\1.LGRepository\\ChemLabX1.0'],
     binaries=[('D:/Anaconda/envs/new_env/python39.dll', '.')],  # 添加 python39.dll
     datas=[('logos/ce.ico', 'logos')],  # 包含图标文件
-    hiddenimports=['gui'],
+    hiddenimports=[
+        'gui',
+        # 屏幕模块由 gui.app 按需动态导入，需显式声明
+        'gui.screens.common_screens.base_screen',
+        'gui.screens.filteration_screen',
+        'gui.screens.heat_transfer_screen',
+        'gui.screens.extraction_screen',
+        'gui.screens.drying_screen',
+        'gui.screens.oxygen_desorption_screen',
+        'gui.screens.distillation_screen',
+        'gui.screens.fluid_flow_screen',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],